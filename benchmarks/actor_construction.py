@@ -0,0 +1,58 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+"""Benchmark building a large population of actors.
+
+Run from the repository root with:
+
+    python benchmarks/actor_construction.py [--actors N]
+
+Compares creating actors one at a time in a loop with ``Actor.create_many``.
+"""
+
+import argparse
+import random
+import time
+
+import upstage_des.api as UP
+
+
+class Shopper(UP.Actor, entity_groups=["shoppers"]):
+    """An actor with a mix of states."""
+
+    budget = UP.State[float](recording=True)
+    patience = UP.State[float]()
+    visits = UP.State[int](default=0)
+    basket = UP.State[list](default_factory=list)
+
+
+def main() -> None:
+    """Time building a population both ways."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actors", type=int, default=100_000, help="Actors to create.")
+    args = parser.parse_args()
+    count: int = args.actors
+
+    rng = random.Random(1)
+    names = [f"Shopper {i}" for i in range(count)]
+    budgets = [rng.uniform(10.0, 100.0) for _ in range(count)]
+    patience = [rng.uniform(1.0, 5.0) for _ in range(count)]
+
+    print(f"{'case':<16}{'seconds':>10}{'actors/s':>14}")
+    with UP.EnvironmentContext():
+        start = time.perf_counter()
+        for name, budget, wait in zip(names, budgets, patience):
+            Shopper(name=name, budget=budget, patience=wait, debug_log=False)
+        elapsed = time.perf_counter() - start
+    print(f"{'loop':<16}{elapsed:>10.3f}{count / elapsed:>14,.0f}")
+
+    with UP.EnvironmentContext():
+        start = time.perf_counter()
+        Shopper.create_many(names, budget=budgets, patience=patience, debug_log=False)
+        elapsed = time.perf_counter() - start
+    print(f"{'create_many':<16}{elapsed:>10.3f}{count / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+"""Benchmark event scheduling with many pending events.
+
+Run from the repository root with:
+
+    python benchmarks/event_scheduling.py [--actors N] [--until T]
+
+Runs plain SimPy processes, and actors looping on a waiting task, with
+``simpy.Environment`` and ``BucketedEnvironment``. Each runs once with
+whole-hour waits (many events at the same times) and once with waits drawn from
+a continuous distribution.
+"""
+
+import argparse
+import time
+from collections.abc import Generator
+from random import Random
+from typing import Any
+
+import simpy as SIM
+
+import upstage_des.api as UP
+from upstage_des.type_help import TASK_GEN
+
+
+class Worker(UP.Actor):
+    """An actor that counts its jobs."""
+
+    jobs = UP.State[int](default=0)
+    whole_hours = UP.State[bool](default=True)
+
+
+class Job(UP.Task):
+    """Wait a random time, then count the job."""
+
+    def task(self, *, actor: Worker) -> TASK_GEN:
+        """Wait for the job."""
+        yield UP.Wait(_wait(actor.stage.random, actor.whole_hours))
+        actor.jobs += 1
+
+
+def _wait(rng: Random, whole_hours: bool) -> float:
+    return float(rng.randint(1, 4)) if whole_hours else rng.uniform(1.0, 4.0)
+
+
+def run_processes(
+    scheduler: type[SIM.Environment], count: int, until: float, whole_hours: bool
+) -> int:
+    """Run plain SimPy processes and return the number of jobs done."""
+    done = 0
+
+    def work(env: SIM.Environment, rng: Random) -> Generator[SIM.Event, Any, None]:
+        nonlocal done
+        while True:
+            yield env.timeout(_wait(rng, whole_hours))
+            done += 1
+
+    with UP.EnvironmentContext(random_seed=1, scheduler=scheduler) as env:
+        rng = UP.get_stage().random
+        for _ in range(count):
+            env.process(work(env, rng))
+        env.run(until=until)
+    return done
+
+
+def run_tasks(scheduler: type[SIM.Environment], count: int, until: float, whole_hours: bool) -> int:
+    """Run actors looping on a task and return the number of jobs done."""
+    with UP.EnvironmentContext(random_seed=1, scheduler=scheduler) as env:
+        workers = [
+            Worker(name=f"worker {i}", whole_hours=whole_hours, debug_log=False)
+            for i in range(count)
+        ]
+        for worker in workers:
+            net = UP.TaskNetworkFactory.from_single_looping("work", Job).make_network()
+            worker.add_task_network(net)
+            worker.start_network_loop("work", "Job")
+        env.run(until=until)
+        return sum(worker.jobs for worker in workers)
+
+
+def main() -> None:
+    """Time the models with each scheduler."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=200_000, help="SimPy processes to run.")
+    parser.add_argument("--actors", type=int, default=5_000, help="Actors to run.")
+    parser.add_argument("--until", type=float, default=50.0, help="Time to run until.")
+    args = parser.parse_args()
+
+    print(f"{'model':<11}{'waits':<14}{'scheduler':<22}{'seconds':>10}{'jobs/s':>12}")
+    models = [("processes", run_processes, args.processes), ("tasks", run_tasks, args.actors)]
+    for model, runner, count in models:
+        for whole_hours in (True, False):
+            waits = "whole hours" if whole_hours else "continuous"
+            for scheduler in (SIM.Environment, UP.BucketedEnvironment):
+                start = time.perf_counter()
+                jobs = runner(scheduler, count, args.until, whole_hours)
+                elapsed = time.perf_counter() - start
+                name = scheduler.__name__
+                print(f"{model:<11}{waits:<14}{name:<22}{elapsed:>10.3f}{jobs / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+"""Benchmark actor knowledge used as a per-task scratchpad.
+
+Run from the repository root with:
+
+    python benchmarks/knowledge.py [--calls N]
+
+Each timed loop sets, gets, and clears one knowledge value, which is how many
+models pass values between the steps of a task.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import upstage_des.api as UP
+
+
+class Worker(UP.Actor):
+    """An actor with no states."""
+
+
+def _scratchpad(worker: Worker, calls: int, caller: str | None) -> None:
+    for i in range(calls):
+        worker.set_knowledge("scratch", i, caller=caller)
+        worker.get_knowledge("scratch")
+        worker.clear_knowledge("scratch", caller=caller)
+
+
+def _time(func: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Time knowledge throughput with and without debug logging."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000, help="Loops per case.")
+    args = parser.parse_args()
+    calls: int = args.calls
+
+    cases: list[tuple[str, bool, str | None]] = [
+        ("logging off", False, None),
+        ("logging on, caller from stack", True, None),
+        ("logging on, caller given", True, "bench"),
+    ]
+    print(f"{'case':<32}{'seconds':>10}{'ops/s':>14}")
+    for label, debug_log, caller in cases:
+        with UP.EnvironmentContext():
+            worker = Worker(name="worker", debug_log=debug_log)
+            elapsed = _time(lambda: _scratchpad(worker, calls, caller))
+        # three knowledge operations per loop
+        rate = 3 * calls / elapsed
+        print(f"{label:<32}{elapsed:>10.3f}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+"""Benchmark drawing random wait times.
+
+Run from the repository root with:
+
+    python benchmarks/random_variates.py [--draws N]
+
+Compares drawing exponential times one at a time from ``stage.random`` with
+``stage.variates``, drawn in blocks by ``random.Random`` and, when NumPy is
+installed, by a NumPy generator.
+"""
+
+import argparse
+import time
+from importlib.util import find_spec
+
+import upstage_des.api as UP
+
+
+def main() -> None:
+    """Time drawing exponential variates each way."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--draws", type=int, default=1_000_000, help="Draws to make.")
+    args = parser.parse_args()
+    count: int = args.draws
+
+    print(f"{'case':<24}{'seconds':>10}{'draws/s':>14}")
+    with UP.EnvironmentContext(random_seed=1):
+        rng = UP.get_stage().random
+        start = time.perf_counter()
+        for _ in range(count):
+            rng.expovariate(0.5)
+        elapsed = time.perf_counter() - start
+    print(f"{'stage.random':<24}{elapsed:>10.3f}{count / elapsed:>14,.0f}")
+
+    cases = [("variates", False)]
+    if find_spec("numpy") is not None:
+        cases.append(("variates (numpy)", True))
+    for name, use_numpy in cases:
+        with UP.EnvironmentContext(random_seed=1, numpy_variates=use_numpy):
+            variates = UP.get_stage().variates
+            start = time.perf_counter()
+            for _ in range(count):
+                variates.exponential(2.0)
+            elapsed = time.perf_counter() - start
+        print(f"{name:<24}{elapsed:>10.3f}{count / elapsed:>14,.0f}")
+
+    with UP.EnvironmentContext(random_seed=1):
+        start = time.perf_counter()
+        for _ in range(count):
+            UP.Wait.from_exponential(2.0)
+        elapsed = time.perf_counter() - start
+    print(f"{'Wait.from_exponential':<24}{elapsed:>10.3f}{count / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+"""Benchmark reading and writing actor states.
+
+Run from the repository root with:
+
+    python benchmarks/state_access.py [--updates N]
+
+Each timed loop reads a state and sets it to a new value.
+"""
+
+import argparse
+import time
+
+import upstage_des.api as UP
+
+
+class Counter(UP.Actor):
+    """An actor with states that use different features."""
+
+    plain = UP.State[float](default=0.0)
+    typed = UP.State[int](default=0, valid_types=int)
+    recorded = UP.State[float](default=0.0, recording=True)
+    watched = UP.State[float](default=0.0)
+
+
+def main() -> None:
+    """Time state updates for each kind of state."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=300_000, help="Updates per state.")
+    args = parser.parse_args()
+    updates: int = args.updates
+
+    print(f"{'state':<12}{'seconds':>10}{'updates/s':>14}")
+    with UP.EnvironmentContext():
+        actor = Counter(name="counter")
+        seen: list[float] = []
+        actor._add_callback_to_state("bench", lambda _, value: seen.append(value), "watched")
+        for name in ["plain", "typed", "recorded", "watched"]:
+            start = time.perf_counter()
+            for _ in range(updates):
+                setattr(actor, name, getattr(actor, name) + 1)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<12}{elapsed:>10.3f}{updates / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
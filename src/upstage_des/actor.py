@@ -6,9 +6,11 @@
 """This file contains the fundamental Actor class for UPSTAGE."""
 
 from collections import Counter, defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import nullcontext
 from copy import copy, deepcopy
 from dataclasses import dataclass
+from functools import partial
 from inspect import Parameter, signature
 from typing import TYPE_CHECKING, Any, Self, Union
 
@@ -17,15 +19,22 @@ from simpy import Process
 from upstage_des.events import Event
 
 from .base import (
+    CONTEXT_ERROR_MSG,
     SPECIAL_ENTITY_CONTEXT_VAR,
+    STAGE_CONTEXT_VAR,
     MockEnvironment,
     NamedUpstageEntity,
     SettableEnv,
     SimulationError,
     UpstageError,
+    _entity_sandbox,
 )
+from .constants import PLANNING_FACTOR_OBJECT
 from .data_types import CartesianLocation, GeodeticLocation
+from .debug_logging import LogLevel, LogRecord, _ActorLog
 from .states import (
+    CALLBACK_FUNC,
+    RECORD_FUNC,
     ActiveState,
     CartesianLocationChangingState,
     DetectabilityState,
@@ -42,6 +51,7 @@ __all__ = ("Actor",)
 
 if TYPE_CHECKING:
     from .nucleus import TaskNetworkNucleus
+    from .rehearsal import RehearsalCache
 
 LOC_STATE = GeodeticLocationChangingState | CartesianLocationChangingState
 LOCATIONS = GeodeticLocation | CartesianLocation
@@ -54,44 +64,37 @@ class TaskData:
     process: Process
 
 
-class Actor(SettableEnv, NamedUpstageEntity):
-    """Actors perform tasks and are composed of states.
+@dataclass(frozen=True)
+class _ConstructionPlan:
+    """How an actor class sets up its states, computed once per class.
 
-    You can subclass, but do not overwrite __init_subclass__. Mixins are allowed
-    but they cannot depend on __init__. Always put mixins after actor base classes.
+    Attributes:
+        states (dict[str, State]): The states by name, in definition order.
+        no_init (frozenset[str]): States that can't be given on init.
+        required (frozenset[str]): States without defaults.
+        defaults (tuple[State, ...]): States with defaults, in definition order.
     """
 
-    def __init_states(self, **states: Any) -> None:
-        seen = set()
-        for state, value in states.items():
-            if state in self._state_defs:
-                seen.add(state)
-                st = self._state_defs[state]
-                if st._no_init:
-                    raise SimulationError(
-                        f"State {state} on {self} has set no_init=True. "
-                        "Initializing a no_init state is disallowed."
-                    )
-                setattr(self, state, value)
-            else:
-                raise UpstageError(f"Input to {self} was not expected: {state}={value}")
-        exist = set(self._state_defs.keys())
-        unseen = exist - seen
-        for state_name in unseen:
-            _state = self._state_defs[state_name]
-            if _state.has_default():
-                seen.add(state_name)
-                _state._set_default(self)
-        if len(seen) != len(exist):
-            raise UpstageError(
-                f"Missing values for states! These states need values: "
-                f"{exist - seen} to be specified for '{self.name}'."
-            )
-        if "log" in seen:
+    states: dict[str, State]
+    no_init: frozenset[str]
+    required: frozenset[str]
+    defaults: tuple[State, ...]
+
+    @classmethod
+    def from_states(cls, states: dict[str, State]) -> "_ConstructionPlan":
+        """Validate state definitions and make their construction plan.
+
+        Args:
+            states (dict[str, State]): The states by name.
+
+        Returns:
+            _ConstructionPlan: The plan.
+        """
+        if "log" in states:
             raise UpstageError("Do not name a state `log`")
         # Check that we won't name clash state names and recording function names
         recording_names: dict[str, int] = Counter()
-        for name, state_def in self._state_defs.items():
+        for name, state_def in states.items():
             recording_names[name] += 1
             for _, rec_name in state_def._recording_functions:
                 recording_names[rec_name] += 1
@@ -102,6 +105,106 @@ class Actor(SettableEnv, NamedUpstageEntity):
         if error_msg:
             raise SimulationError(error_msg)
 
+        return cls(
+            states=states,
+            no_init=frozenset(name for name, state in states.items() if state._no_init),
+            required=frozenset(name for name, state in states.items() if not state.has_default()),
+            defaults=tuple(state for state in states.values() if state.has_default()),
+        )
+
+
+def _sets_directly(state: State) -> bool:
+    """Check if a new actor's value for a state can skip the state's setter.
+
+    A new actor has no frozen value, callbacks, or listener to tell, so only
+    the recording in the standard ``State.__set__`` is needed.
+
+    Args:
+        state (State): The state.
+
+    Returns:
+        bool: If the value can be stored and recorded directly.
+    """
+    return type(state).__set__ is State.__set__
+
+
+_LAZY_CONTAINERS: dict[str, Callable[[], Any]] = {
+    "_active_states": dict,
+    "_mimic_states": dict,
+    "_mimic_states_by_task": partial(defaultdict, set),
+    "_states_by_task": partial(defaultdict, set),
+    "_tasks_by_state": partial(defaultdict, set),
+    "_task_networks": dict,
+    "_task_queue": dict,
+    "_knowledge": dict,
+    "_knowledge_waiters": dict,
+    "_state_histories": dict,
+    "_state_callbacks": dict,
+    "_state_recorders": dict,
+}
+"""Actor bookkeeping containers that are made on first use, and their factories."""
+
+
+class Actor(SettableEnv, NamedUpstageEntity):
+    """Actors perform tasks and are composed of states.
+
+    You can subclass, but do not overwrite __init_subclass__. Mixins are allowed
+    but they cannot depend on __init__. Always put mixins after actor base classes.
+
+    The debug log can be tuned per class with ``LOG_LEVEL``, the lowest
+    ``LogLevel`` that is recorded, and ``LOG_MAX_RECORDS``, which keeps only
+    the most recent records when set.
+    """
+
+    LOG_LEVEL: int = LogLevel.DEBUG
+    LOG_MAX_RECORDS: int | None = None
+
+    _construction_plan: _ConstructionPlan = _ConstructionPlan({}, frozenset(), frozenset(), ())
+    _state_defs: dict[str, State] = {}
+
+    # Defaults until an actor changes them
+    _debug_logging: bool = True
+    _debug_log_time: bool | None = None
+    _num_clones: int = 0
+    _is_rehearsing: bool = False
+    _state_listener: "TaskNetworkNucleus | None" = None
+
+    # Made on first use, see __getattr__ and _LAZY_CONTAINERS
+    _active_states: dict[str, dict[str, Any]]
+    _mimic_states: dict[str, tuple["Actor", str]]
+    _mimic_states_by_task: dict[Task, set[str]]
+    _states_by_task: dict[Task, set[str]]
+    _tasks_by_state: dict[str, set[Task]]
+    _task_networks: dict[str, TaskNetwork]
+    _task_queue: dict[str, list[str]]
+    _knowledge: dict[str, Any]
+    _knowledge_waiters: dict[str, list[tuple[Callable[[Any], bool] | None, Event]]]
+    _state_histories: dict[str, list[tuple[float, Any]]]
+    _state_callbacks: dict[str, dict[Any, CALLBACK_FUNC]]
+    _state_recorders: dict[str, RECORD_FUNC]
+    _debug_log: _ActorLog
+
+    def __init_states(self, **states: Any) -> None:
+        plan = self._construction_plan
+        for state, value in states.items():
+            if state not in plan.states:
+                raise UpstageError(f"Input to {self} was not expected: {state}={value}")
+            if state in plan.no_init:
+                raise SimulationError(
+                    f"State {state} on {self} has set no_init=True. "
+                    "Initializing a no_init state is disallowed."
+                )
+            setattr(self, state, value)
+        missing = plan.required.difference(states)
+        if missing:
+            raise UpstageError(
+                f"Missing values for states! These states need values: "
+                f"{set(missing)} to be specified for '{self.name}'."
+            )
+        for _state in plan.defaults:
+            if _state.name not in states:
+                _state._set_default(self)
+
     def __actual_init__(
         self,
         *,
@@ -124,37 +227,37 @@ class Actor(SettableEnv, NamedUpstageEntity):
         """
         self.name = name
         super().__init__()
-
-        self._active_states: dict[str, dict[str, Any]] = {}
-        self._num_clones: int = 0
-        self._state_defs: dict[str, State] = getattr(self.__class__, "_state_defs", {})
-
-        self._mimic_states: dict[str, tuple[Actor, str]] = {}  # has to be before other calls
-        self._mimic_states_by_task: dict[Task, set[str]] = defaultdict(set)
-
-        self._states_by_task: dict[Task, set[str]] = defaultdict(set)
-        self._tasks_by_state: dict[str, set[Task]] = defaultdict(set)
-
-        self._task_networks: dict[str, TaskNetwork] = {}
-        self._task_queue: dict[str, list[str]] = {}
-
-        self._knowledge: dict[str, Any] = {}
-        self._is_rehearsing: bool = False
-
-        self._debug_logging: bool = debug_log
-        self._debug_log_time = debug_log_time
-        self._debug_log: list[tuple[float | int, str]] = []
-
-        self._state_histories: dict[str, list[tuple[float, Any]]] = {}
-
-        # Task Network Nucleus hook-ins
-        self._state_listener: TaskNetworkNucleus | None = None
-
+        self.__init_attributes(debug_log, debug_log_time)
         self.__init_states(**states)
 
         if initial_knowledge is not None:
             self.set_bulk_knowledge(initial_knowledge, overwrite=True, caller="init")
 
+    def __init_attributes(self, debug_log: bool, debug_log_time: bool | None) -> None:
+        # Bookkeeping containers are made on first use, see __getattr__.
+        if not debug_log:
+            self._debug_logging = False
+        if debug_log_time is not None:
+            self._debug_log_time = debug_log_time
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            """Make a bookkeeping container the first time it is used.
+
+            Most actors in large populations never use most of their containers,
+            so they are only made when needed.
+            """
+            factory = _LAZY_CONTAINERS.get(name)
+            if factory is not None:
+                value = factory()
+            elif name == "_debug_log":
+                value = _ActorLog(STAGE_CONTEXT_VAR.get(None), self.LOG_MAX_RECORDS)
+            else:
+                raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+            self.__dict__[name] = value
+            return value
+
     def __init__(
         self,
         *,
@@ -184,6 +287,138 @@ class Actor(SettableEnv, NamedUpstageEntity):
             initial_knowledge=initial_knowledge,
         )
 
+    @classmethod
+    def create_many(
+        cls,
+        names: Sequence[str],
+        *,
+        debug_log: bool = True,
+        debug_log_time: bool | None = None,
+        **state_columns: Iterable[Any],
+    ) -> list[Self]:
+        """Create many actors of this class at once.
+
+        Each keyword gives the values of one state, in the same order as
+        ``names``. NumPy arrays (or anything with ``tolist``) are converted to
+        Python values first. The columns are checked once, the actors are
+        added to their entity groups together, and states that use the
+        standard ``State`` setter are set without the per-change checks
+        that a new actor doesn't need.
+
+        Classes that override ``__actual_init__``, or replace ``__init__`` after
+        the class is made, are built one at a time with ``cls(name=..., **states)``
+        so their own setup runs.
+
+        Example:
+            >>> cashiers = Cashier.create_many(
+            >>>     [f"Cashier {i}" for i in range(1000)],
+            >>>     scan_speed=rng.uniform(1.0, 2.0, size=1000),
+            >>> )
+
+        Args:
+            names (Sequence[str]): The actor names.
+            debug_log (bool, optional): Whether to write to debug log. Defaults to True.
+            debug_log_time (bool, optional): If time is logged in debug messages.
+                Defaults to None (uses Stage value), otherwise local value is used.
+            **state_columns (Iterable[Any]): Values for each state, one per name.
+
+        Returns:
+            list[Self]: The actors, in the order of ``names``.
+        """
+        try:
+            special = SPECIAL_ENTITY_CONTEXT_VAR.get()
+        except LookupError:
+            raise UpstageError(CONTEXT_ERROR_MSG)
+        plan = cls._construction_plan
+        count = len(names)
+        value_columns: dict[str, list[Any]] = {}
+        for state_name, column in state_columns.items():
+            tolist = getattr(column, "tolist", None)
+            values = list(column) if tolist is None else tolist()
+            if len(values) != count:
+                raise UpstageError(
+                    f"State '{state_name}' has {len(values)} values for {count} actor names."
+                )
+            value_columns[state_name] = values
+
+        if not cls._has_default_init():
+            return [
+                cls(
+                    name=name,
+                    debug_log=debug_log,
+                    debug_log_time=debug_log_time,
+                    **{state_name: values[i] for state_name, values in value_columns.items()},
+                )
+                for i, name in enumerate(names)
+            ]
+
+        columns: list[tuple[State, list[Any], bool]] = []
+        for state_name, values in value_columns.items():
+            if state_name not in plan.states:
+                raise UpstageError(f"Input to {cls.__name__} was not expected: {state_name}")
+            if state_name in plan.no_init:
+                raise SimulationError(
+                    f"State {state_name} on {cls.__name__} has set no_init=True. "
+                    "Initializing a no_init state is disallowed."
+                )
+            state = plan.states[state_name]
+            for value in values:
+                state._type_check(value, throw=True)
+            columns.append((state, values, _sets_directly(state)))
+        missing = plan.required.difference(state_columns)
+        if missing:
+            raise UpstageError(
+                f"Missing values for states! These states need values: "
+                f"{set(missing)} to be specified for '{cls.__name__}.create_many'."
+            )
+        defaults: list[tuple[State, bool]] = []
+        for state in plan.defaults:
+            if state.name in state_columns:
+                continue
+            direct = _sets_directly(state) and type(state)._set_default is State._set_default
+            if direct and state._default is None and state._default_factory is None:
+                # An allowed None default isn't set.
+                continue
+            defaults.append((state, direct))
+
+        actors: list[Self] = []
+        for i, name in enumerate(names):
+            actor = cls.__new__(cls)
+            actor.name = name
+            actor.__init_attributes(debug_log, debug_log_time)
+            for state, values, direct in columns:
+                if direct:
+                    actor.__dict__[state.name] = values[i]
+                    if state._recording:
+                        state._do_record(actor, values[i])
+                else:
+                    state.__set__(actor, values[i])
+            for state, direct in defaults:
+                if not direct:
+                    state._set_default(actor)
+                    continue
+                factory = state._default_factory
+                value = state._default if factory is None else factory()
+                actor.__dict__[state.name] = value
+                if state._recording:
+                    state._do_record(actor, value)
+            actors.append(actor)
+
+        cls._add_many_to_groups(actors)
+        special.actors.extend(actors)
+        return actors
+
+    @classmethod
+    def _has_default_init(cls) -> bool:
+        """Test if the class is built only by the standard actor setup.
+
+        Returns:
+            bool: If ``create_many`` can skip calling the class.
+        """
+        init = cls.__init__
+        standard_init = init is Actor.__init__ or getattr(init, "_upstage_state_init", False)
+        return bool(standard_init) and cls.__actual_init__ is Actor.__actual_init__
+
     def __init_subclass__(
         cls,
         *args: Any,
@@ -200,6 +435,7 @@ class Actor(SettableEnv, NamedUpstageEntity):
                     all_states[state_name] = state
                     state.name = state_name
         cls._state_defs = all_states
+        cls._construction_plan = _ConstructionPlan.from_states(all_states)
 
         nxt = cls.mro()[1]
         if nxt is object:
@@ -252,6 +488,7 @@ Args:
             e.add_note(f"Failure likely due to repeated state name in inherited actor {cls}")
             raise e
         new_init.__doc__ = docstring
+        setattr(new_init, "_upstage_state_init", True)
         setattr(cls, "__init__", new_init)
 
     def _add_special_group(self) -> None:
@@ -259,10 +496,11 @@ Args:
 
         Called by the NamedUpstageEntity on group inits.
         """
-        ans = SPECIAL_ENTITY_CONTEXT_VAR.get().actors
-        if self in ans:
-            return
-        ans.append(self)
+        SPECIAL_ENTITY_CONTEXT_VAR.get().actors.add(self)
+
+    def _remove_special_group(self) -> None:
+        """Remove self from the actor context list."""
+        SPECIAL_ENTITY_CONTEXT_VAR.get().actors.discard(self)
 
     def _lock_state(self, *, state: str, task: Task) -> None:
         """Lock one of the actor's states by a given task.
@@ -548,7 +786,7 @@ Args:
             state_name (str): _description_
         """
         state: State = self._state_defs[state_name]
-        state._add_callback(source, callback)
+        state._add_callback(self, source, callback)
 
     def _remove_callback_from_state(
         self,
@@ -562,7 +800,7 @@ Args:
             state_name (str): Name of the state with the callback.
         """
         state = self._state_defs[state_name]
-        state._remove_callback(source)
+        state._remove_callback(self, source)
 
     def get_knowledge(self, name: str, must_exist: bool = False) -> Any:
         """Get a knowledge value from the actor.
@@ -600,21 +838,31 @@ Args:
         method_name: str = "",
         caller_level: int = 1,
         caller_name: str | None = None,
+        *,
+        values: tuple[Any, ...] = (),
     ) -> None:
         """Log information about who is calling this method.
 
-        If no caller_name is given, it is searched for in the stack.
+        If no caller_name is given, it is searched for in the stack. Nothing is
+        searched for if the record would not be logged.
 
         Args:
             method_name (str, optional): Method name for logging. Defaults to "".
             caller_level (int, optional): Level to look up for the caller. Defaults to 1.
             caller_name (Optional[str], optional): Name of the caller. Defaults to None.
+            values (tuple[Any, ...], optional): Values for the method's own message in
+                ``LOG_MESSAGES``. Defaults to (), which logs only the method name.
         """
+        if not self._debug_logging or LogLevel.DEBUG < self.LOG_LEVEL:
+            return
         if caller_name is None:
             info = get_caller_info(caller_level=caller_level + 1)
         else:
             info = caller_name
-        self.log(f"method '{method_name}' called by '{info}'")
+        if values:
+            self._log_event(LogLevel.DEBUG, method_name, *values, info)
+        else:
+            self._log_event(LogLevel.DEBUG, "caller", method_name, info)
 
     def set_knowledge(
         self,
@@ -634,7 +882,7 @@ Args:
                 Defaults to False.
             caller (str, Optional): The name of the object that called the method.
         """
-        self._log_caller(f"set_knowledge '{name}={value}'", caller_name=caller)
+        self._log_caller("set_knowledge", caller_name=caller, values=(name, value))
         if name in self._knowledge and not overwrite:
             raise SimulationError(
                 f"Actor {self} overwriting existing knowledge {name} "
@@ -643,6 +891,50 @@ Args:
             )
         else:
             self._knowledge[name] = value
+            if name in self._knowledge_waiters:
+                self._notify_knowledge_waiters(name, value)
+
+    def _notify_knowledge_waiters(self, name: str, value: Any) -> None:
+        """Succeed the knowledge waiters whose predicate the new value meets.
+
+        Args:
+            name (str): The knowledge name.
+            value (Any): The new knowledge value.
+        """
+        waiters = self._knowledge_waiters[name]
+        remaining: list[tuple[Callable[[Any], bool] | None, Event]] = []
+        for index, (predicate, event) in enumerate(waiters):
+            if event._event.triggered:
+                # Cancelled by an interrupted task.
+                continue
+            try:
+                met = predicate is None or predicate(value)
+            except Exception:
+                # Keep the waiters that were not tested.
+                self._knowledge_waiters[name] = remaining + waiters[index:]
+                raise
+            if met:
+                event.succeed(value=value)
+            else:
+                remaining.append((predicate, event))
+        if remaining:
+            self._knowledge_waiters[name] = remaining
+        else:
+            del self._knowledge_waiters[name]
+
+    def _drop_knowledge_waiter(self, name: str, event: Event) -> None:
+        """Remove a cancelled knowledge waiter.
+
+        Args:
+            name (str): The knowledge name.
+            event (Event): The waiter's event.
+        """
+        waiters = self._knowledge_waiters.get(name)
+        if waiters is None:
+            return
+        waiters[:] = [waiter for waiter in waiters if waiter[1] is not event]
+        if not waiters:
+            del self._knowledge_waiters[name]
 
     def clear_knowledge(self, name: str, caller: str | None = None) -> None:
         """Clear a knowledge value.
@@ -655,7 +947,7 @@ Args:
                 Used for debug logging purposes.
 
         """
-        self._log_caller(f"clear_knowledge '{name}'", caller_name=caller)
+        self._log_caller("clear_knowledge", caller_name=caller, values=(name,))
         if name not in self._knowledge:
             raise SimulationError(f"Actor {self} does not have knowledge: {name}")
         else:
@@ -810,7 +1102,7 @@ Args:
             )
         elif not queue:
             self.set_task_queue(network_name, [task_name])
-        self.log(f"begin_next_task: Starting {task_name} task")
+        self._log_event(LogLevel.DEBUG, "begin_task", task_name)
         self._task_queue[network_name].pop(0)
 
     def start_network_loop(
@@ -922,12 +1214,74 @@ Args:
             raise SimulationError(f"No networked with id: {network_id} to delete")
         del self._task_networks[network_id]
 
+    def retire(self, sink: Callable[[dict[str, list[Any]]], None] | None = None) -> None:
+        """Remove the actor from the simulation so it can be garbage collected.
+
+        Retiring an actor:
+
+        * Stops its task networks. Running tasks end without calling ``on_interrupt``.
+        * Deactivates its active and mimicking states.
+        * Sends its recorded data to ``sink``, if one is given.
+        * Removes it, and its resources, from the actor list and the entity groups.
+        * Removes it from the motion manager and the communications managers.
+        * Releases the random streams and ``stage.variates`` streams whose keys name it.
+        * Clears its knowledge, task queues, task networks, and histories.
+
+        Retired actors no longer appear in ``create_table`` or the other data
+        gathering functions, so use ``sink`` to keep their data. The sink gets a
+        dictionary of column name to column values, with the columns of
+        ``create_table``, with location states included.
+
+        If a task on this actor calls ``retire``, that task runs until it
+        finishes, and no tasks follow it. References to the actor held by
+        user code (in stores, or other actors' knowledge) are not cleared.
+
+        Args:
+            sink (Callable[[dict[str, list[Any]]], None], optional): Receives the
+                actor's recorded data. Defaults to None.
+        """
+        for network in self._task_networks.values():
+            network.stop()
+        for task in list(self._states_by_task):
+            self.deactivate_all_states(task=task)
+        for task in list(self._mimic_states_by_task):
+            self.deactivate_all_mimic_states(task=task)
+
+        if sink is not None:
+            from .data_utils.data_utils import STATE_COLUMN_NAMES, _actor_state_data, _ColumnSink
+
+            table = _ColumnSink(STATE_COLUMN_NAMES)
+            _actor_state_data(table, self, skip_locations=False)
+            sink(table.output())
+
+        self._remove_entity()
+        for name, state in self._state_defs.items():
+            if not isinstance(state, ResourceState):
+                continue
+            resource = self.__dict__.get(name)
+            if isinstance(resource, NamedUpstageEntity):
+                resource._remove_entity()
+
+        if hasattr(self.stage, "motion_manager"):
+            self.stage.motion_manager._retire_actor(self)
+        for manager in SPECIAL_ENTITY_CONTEXT_VAR.get().comms_managers:
+            manager._retire_actor(self)
+        if hasattr(self.stage, "random_streams"):
+            self.stage.random_streams.release(self)
+        if hasattr(self.stage, "variates"):
+            self.stage.variates.release(self)
+
+        for container in _LAZY_CONTAINERS:
+            self.__dict__.pop(container, None)
+        self._state_listener = None
+
     def rehearse_network(
         self,
         network_name: str,
         task_name_list: list[str],
         knowledge: dict[str, Any] | None = None,
         end_task: str | None = None,
+        cache: "RehearsalCache | None" = None,
     ) -> Self:
         """Rehearse a network on this actor.
 
@@ -940,6 +1294,8 @@ Args:
             knowledge (dict[str, Any], optional): knowledge to give to the cloned
                 actor. Defaults to None.
             end_task (str, optional): A task to end on once reached.
+            cache (RehearsalCache, optional): A cache to reuse matching rehearsals
+                from. Defaults to None.
 
         Returns:
             Actor: The cloned actor after rehearsing the network.
@@ -951,6 +1307,7 @@ Args:
             task_name_list=task_name_list,
             knowledge=knowledge,
             end_task=end_task,
+            cache=cache,
         )
         return understudy
 
@@ -958,6 +1315,8 @@ Args:
         self,
         new_env: MockEnvironment | None = None,
         knowledge: dict[str, Any] | None = None,
+        copy_history: bool = True,
+        register: bool = True,
         **new_states: Any,
     ) -> Self:
         """Clones an actor and assigns it a new environment.
@@ -972,11 +1331,25 @@ Args:
             The clones' names are appended with the label ``'[CLONE #]'`` where
             ``'#'`` indicates the number of clones of the actor.
 
+            Without ``copy_history``, the clone's state histories start from the
+            actor's latest record of each state and its debug log starts empty,
+            so the cost of cloning doesn't grow with how long the actor has run.
+            Rehearsals clone this way.
+
+            Without ``register``, the clone and any resources made for its states
+            are not added to the entity groups, so they don't show up in
+            ``get_actors`` or the data tables, and are garbage collected once
+            the clone is no longer used. Rehearsals clone this way as well.
+
         Args:
             new_env (Optional[MockEnvironment], optional): Environment for cloning.
                 Defaults to None.
             knowledge (Optional[dict[str, Any]], optional): Knowledge for the clone.
                 Defaults to None.
+            copy_history (bool, optional): If the state histories and debug log
+                are copied to the clone. Defaults to True.
+            register (bool, optional): If the clone is added to the entity groups.
+                Defaults to True.
             new_states (Any): New states to add to the actor when cloning.
 
         Returns:
@@ -985,25 +1358,25 @@ Args:
         knowledge = {} if knowledge is None else knowledge
         new_env = MockEnvironment.mock(self.env) if new_env is None else new_env
 
-        states: dict[str, Any] = {}
-        for state in self.states:
-            state_obj = self._state_defs[state]
-            if isinstance(state_obj, ResourceState):
-                states[state] = state_obj._make_clone(self, getattr(self, state))
-            elif isinstance(state_obj, _KeyValueBase):
-                states[state] = state_obj._make_clone(self)
-            else:
-                states[state] = copy(getattr(self, state))
-        states.update(new_states)
-
         self._num_clones += 1
-
-        clone = self.__class__(
-            name=self.name + f" [CLONE {self._num_clones}]",
-            debug_log=self._debug_logging,
-            debug_log_time=self._debug_log_time,
-            **states,
-        )
+        with nullcontext() if register else _entity_sandbox():
+            states: dict[str, Any] = {}
+            for state in self.states:
+                state_obj = self._state_defs[state]
+                if isinstance(state_obj, ResourceState):
+                    states[state] = state_obj._make_clone(self, getattr(self, state))
+                elif isinstance(state_obj, _KeyValueBase):
+                    states[state] = state_obj._make_clone(self)
+                else:
+                    states[state] = copy(getattr(self, state))
+            states.update(new_states)
+
+            clone = self.__class__(
+                name=self.name + f" [CLONE {self._num_clones}]",
+                debug_log=self._debug_logging,
+                debug_log_time=self._debug_log_time,
+                **states,
+            )
         clone.env = new_env
 
         ignored_attributes = list(states.keys()) + ["env", "stage"]
@@ -1020,8 +1393,13 @@ Args:
 
         # update the state histories
         for state_name in self._state_defs:
-            if state_name in self._state_histories:
-                clone._state_histories[state_name] = deepcopy(self._state_histories[state_name])
+            history = self._state_histories.get(state_name)
+            if not history:
+                continue
+            if copy_history:
+                clone._state_histories[state_name] = deepcopy(history)
+            else:
+                clone._state_histories[state_name] = [deepcopy(history[-1])]
 
         clone._knowledge = {}
         for name, data in self._knowledge.items():
@@ -1030,44 +1408,72 @@ Args:
         for name, data in knowledge.items():
             clone._knowledge[name] = copy(data)
 
-        clone._task_queue = copy(self._task_queue)
+        # Rehearsals pop from the queues, which must not change the original's.
+        clone._task_queue = {name: list(queue) for name, queue in self._task_queue.items()}
         clone._task_networks = copy(self._task_networks)
 
-        if clone._debug_logging:
-            clone._debug_log = list(self._debug_log)
+        if copy_history and clone._debug_logging:
+            clone._debug_log.extend(self._debug_log.records)
 
         clone._is_rehearsing = True
         return clone
 
-    def log(self, msg: str | None = None) -> list[tuple[float | int, str]] | None:
+    def _log_event(self, level: int, event: str, *args: Any) -> None:
+        """Store a log record without formatting it.
+
+        Args:
+            level (int): The log level.
+            event (str): The event code, a key of ``LOG_MESSAGES``.
+            *args (Any): Values for the event's message.
+        """
+        if self._debug_logging and level >= self.LOG_LEVEL:
+            self._debug_log.add(self.env.now, level, event, args)
+
+    def log(
+        self, msg: str | None = None, level: int = LogLevel.INFO
+    ) -> list[tuple[float | int, str]] | None:
         """Add to the log or return it.
 
-        Only adds to log if debug_logging is True.
+        Only adds to log if debug_logging is True, and the level is at least
+        the actor's ``LOG_LEVEL``.
 
         Args:
             msg (str, Optional): The message to log.
+            level (int, optional): The log level. Defaults to LogLevel.INFO.
 
         Returns:
             list[str] | None: The log if no message is given. None otherwise.
         """
         if msg is None:
-            return self._debug_log
-        elif self._debug_logging:
-            dlt = self._debug_log_time
-            do_time = dlt if dlt is not None else self.stage.get("debug_log_time", True)
-            if do_time:
-                ts = self.pretty_now
-                msg = f"{ts} {msg}"
-            self._debug_log += [(self.env.now, msg)]
+            return self.get_log()
+        self._log_event(level, "message", msg)
         return None
 
     def get_log(self) -> list[tuple[float | int, str]]:
         """Get the debug log.
 
+        The records are formatted when this is called, including the time if
+        the actor or stage ``debug_log_time`` setting allows it.
+
+        Returns:
+            list[tuple[float | int, str]]: List of times and log messages.
+        """
+        do_time = self._debug_log_time
+        if do_time is None:
+            stage = self._debug_log.stage
+            do_time = True if stage is None else stage.get("debug_log_time", True)
+        return self._debug_log.format(do_time)
+
+    def get_log_records(self, level: int = LogLevel.DEBUG) -> list[LogRecord]:
+        """Get the unformatted debug log records.
+
+        Args:
+            level (int, optional): The lowest log level to return. Defaults to LogLevel.DEBUG.
+
         Returns:
-            list[str]: List of log messages.
+            list[LogRecord]: The records, with time, level, event code, and arguments.
         """
-        return self._debug_log
+        return [record for record in self._debug_log.records if record.level >= level]
 
     @property
     def states(self) -> tuple[str, ...]:
@@ -1201,6 +1607,62 @@ Args:
         self.clear_knowledge(name, "actor.succeed_knowledge_event")
         event.succeed(**kwargs)
 
+    def wait_for_knowledge(
+        self,
+        name: str,
+        predicate: Callable[[Any], bool] | None = None,
+        rehearsal_time_to_complete: float = 0.0,
+    ) -> Event:
+        """Create an event that succeeds when knowledge is set.
+
+        The event succeeds when ``set_knowledge`` gives ``name`` a value that the
+        predicate returns True for, or any value if there is no predicate. If the
+        current knowledge already meets the predicate, the event succeeds now.
+        The value is in the event's payload under "value". When rehearsing, the
+        event takes ``rehearsal_time_to_complete`` and the value is the
+        ``PLANNING_FACTOR_OBJECT``.
+
+        Clearing knowledge does not succeed the event.
+
+        Example:
+            >>> def task(self, actor):
+            >>>     evt = actor.wait_for_knowledge("order", lambda order: order.size > 2)
+            >>>     yield evt
+            >>>     order = evt.get_payload()["value"]
+            ...
+            >>> def other_task(self, actor):
+            >>>     customer.set_knowledge("order", Order(size=3), overwrite=True)
+
+        Args:
+            name (str): The knowledge name.
+            predicate (Callable[[Any], bool], optional): Test of the new value.
+                Defaults to None, which accepts any value.
+            rehearsal_time_to_complete (float, optional): The event's expected
+                time to complete. Defaults to 0.0.
+
+        Returns:
+            Event: The event to yield on
+        """
+        event = Event(rehearsal_time_to_complete=rehearsal_time_to_complete, auto_reset=False)
+        # Rehearsing actors only use the expected time.
+        if self._is_rehearsing:
+            event._payload = {"value": PLANNING_FACTOR_OBJECT}
+            return event
+        if name in self._knowledge:
+            value = self._knowledge[name]
+            if predicate is None or predicate(value):
+                event.succeed(value=value)
+                return event
+        self._knowledge_waiters.setdefault(name, []).append((predicate, event))
+
+        def _on_cancel(_: Any) -> None:
+            # Succeeded waiters are already removed; only cancels are left.
+            if event._event.defused:
+                self._drop_knowledge_waiter(name, event)
+
+        event._event.callbacks.append(_on_cancel)
+        return event
+
     def get_remaining_waypoints(
         self, location_state: str
     ) -> list[GeodeticLocation] | list[CartesianLocation]:
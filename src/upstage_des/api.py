@@ -18,8 +18,10 @@ from upstage_des.base import (
     UpstageBase,
     UpstageError,
     add_stage_variable,
+    get_random_stream,
     get_stage,
     get_stage_variable,
+    remove_entity,
 )
 
 # Comms
@@ -38,6 +40,9 @@ from upstage_des.data_types import (
     Location,
 )
 
+# Debug logging
+from upstage_des.debug_logging import LogLevel, LogRecord
+
 # Events
 from upstage_des.events import All, Any, Event, FilterGet, Get, Put, ResourceHold, Wait
 
@@ -47,6 +52,15 @@ from upstage_des.motion import SensorMotionManager, SteppedMotionManager
 # Task network nucleus
 from upstage_des.nucleus import NucleusInterrupt, TaskNetworkNucleus
 
+# Rehearsal profiling
+from upstage_des.profiling import RehearsalProfiler
+
+# Random numbers
+from upstage_des.random_numbers import RandomStreams, Variates
+
+# Rehearsal
+from upstage_des.rehearsal import RehearsalCache, RehearsalResult, rehearse_many
+
 # Resources
 from upstage_des.resources.container import (
     ContainerEmptyError,
@@ -67,6 +81,7 @@ from upstage_des.resources.sorted import SortedFilterGet, SortedFilterStore
 
 # Routine
 from upstage_des.routines import Routine, WindowedGet
+from upstage_des.scheduling import BucketedEnvironment
 
 # Nucleus-friendly states
 from upstage_des.state_sharing import SharedLinearChangingState
@@ -100,6 +115,8 @@ __all__ = [
     "MotionAndDetectionError",
     "RulesError",
     "Actor",
+    "LogLevel",
+    "LogRecord",
     "PLANNING_FACTOR_OBJECT",
     "UpstageBase",
     "NamedUpstageEntity",
@@ -107,6 +124,11 @@ __all__ = [
     "add_stage_variable",
     "get_stage_variable",
     "get_stage",
+    "get_random_stream",
+    "RandomStreams",
+    "Variates",
+    "BucketedEnvironment",
+    "remove_entity",
     "All",
     "Any",
     "Event",
@@ -151,6 +173,10 @@ __all__ = [
     "TaskNetwork",
     "TaskNetworkFactory",
     "TaskLinks",
+    "rehearse_many",
+    "RehearsalResult",
+    "RehearsalCache",
+    "RehearsalProfiler",
     "TaskNetworkNucleus",
     "NucleusInterrupt",
     "SharedLinearChangingState",
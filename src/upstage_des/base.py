@@ -6,19 +6,21 @@
 """Base classes and exceptions for UPSTAGE."""
 
 from collections import defaultdict
-from collections.abc import Generator, Iterable
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
 from math import floor
 from random import Random
 from time import gmtime, strftime
-from typing import TYPE_CHECKING, Any, Protocol, Union
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, Union, overload
 from warnings import warn
 
 from simpy import Environment as SimpyEnv
 from simpy import Event as SimEvent
 
 from upstage_des.geography import INTERSECTION_LOCATION_CALLABLE, EarthProtocol
+from upstage_des.random_numbers import RandomStreams, Variates
 from upstage_des.units.convert import STANDARD_TIMES, TIME_ALTERNATES, unit_convert
 
 CONTEXT_ERROR_MSG = "Undefined context variable: use EnvironmentContext"
@@ -26,6 +28,8 @@ CONTEXT_ERROR_MSG = "Undefined context variable: use EnvironmentContext"
 
 if TYPE_CHECKING:
     from upstage_des.actor import Actor
+    from upstage_des.communications.comms import CommsManagerBase
+    from upstage_des.data_utils.data_recorder import DataChannel
     from upstage_des.resources.monitoring import MonitoringMixin
 
 
@@ -106,6 +110,14 @@ class StageProtocol(Protocol):
     def random(self) -> Random:
         """Random number generator."""
 
+    @property
+    def random_streams(self) -> RandomStreams:
+        """Named random number streams, seeded from the context's random seed."""
+
+    @property
+    def variates(self) -> Variates:
+        """Random variates drawn in blocks, seeded from the context's random seed."""
+
     @property
     def daily_time_count(self) -> float | int:
         """The number of time_units in a "day".
@@ -204,24 +216,209 @@ class MockEnvironment:
         raise UpstageError("You tried to use `run` on a mock environment")
 
 
+T = TypeVar("T")
+_REMOVED: Any = object()
+
+
+class EntityGroup(Sequence[T]):
+    """An insertion-ordered collection of entities with constant time membership.
+
+    Entities are compared by identity. The group behaves like a read-only
+    list for iteration, indexing, ``len``, ``in``, ``index``, ``count``,
+    ``copy``, and ``+``, and compares equal to a list holding the same
+    entities in the same order. ``copy`` and ``+`` return lists.
+
+    Adding or removing entities while iterating over the group is allowed,
+    and added entities will be seen by the iteration, as with a list.
+    """
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        """Create a group.
+
+        Args:
+            items (Iterable[T], optional): Starting members. Defaults to ().
+        """
+        self._positions: dict[int, int] = {}
+        self._items: list[T] = []
+        self._iterating = 0
+        for item in items:
+            self.add(item)
+
+    def add(self, item: T) -> bool:
+        """Add an entity to the end of the group, if it isn't there already.
+
+        Args:
+            item (T): The entity
+
+        Returns:
+            bool: If the entity was added.
+        """
+        key = id(item)
+        if key in self._positions:
+            return False
+        self._positions[key] = len(self._items)
+        self._items.append(item)
+        return True
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Add entities to the end of the group, skipping any already there.
+
+        Args:
+            items (Iterable[T]): The entities
+        """
+        positions = self._positions
+        stored = self._items
+        for item in items:
+            key = id(item)
+            if key not in positions:
+                positions[key] = len(stored)
+                stored.append(item)
+
+    def discard(self, item: T) -> bool:
+        """Remove an entity from the group, if it is there.
+
+        Args:
+            item (T): The entity
+
+        Returns:
+            bool: If the entity was removed.
+        """
+        position = self._positions.pop(id(item), None)
+        if position is None:
+            return False
+        self._items[position] = _REMOVED
+        if len(self._items) > 32 and len(self._positions) < len(self._items) // 2:
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        """Drop the places of removed entities.
+
+        Running iterations hold positions in the list, so nothing is dropped
+        until they finish.
+        """
+        if self._iterating:
+            return
+        self._items = [item for item in self._items if item is not _REMOVED]
+        self._positions = {id(item): i for i, item in enumerate(self._items)}
+
+    def __contains__(self, item: object) -> bool:
+        return id(item) in self._positions
+
+    def __iter__(self) -> Iterator[T]:
+        # Index-based, so entities added during iteration are seen.
+        self._iterating += 1
+        try:
+            items = self._items
+            i = 0
+            while i < len(items):
+                item = items[i]
+                if item is not _REMOVED:
+                    yield item
+                i += 1
+        finally:
+            self._iterating -= 1
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if len(self._positions) != len(self._items):
+            if self._iterating:
+                return [item for item in self._items if item is not _REMOVED][index]
+            self._compact()
+        return self._items[index]
+
+    def copy(self) -> list[T]:
+        """Get the entities as a new list.
+
+        Returns:
+            list[T]: The entities.
+        """
+        return list(self)
+
+    def __add__(self, other: Iterable[T]) -> list[T]:
+        return [*self, *other]
+
+    def __radd__(self, other: Iterable[T]) -> list[T]:
+        return [*other, *self]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EntityGroup | list):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore [assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 @dataclass
 class SpecialContexts:
     """Accessible lists of typed objects for contexts."""
 
-    actors: list["Actor"] = field(default_factory=list)
-    monitored: list["MonitoringMixin"] = field(default_factory=list)
+    actors: EntityGroup["Actor"] = field(default_factory=EntityGroup)
+    monitored: EntityGroup["MonitoringMixin"] = field(default_factory=EntityGroup)
     data_recorded: list[tuple[float, Any]] = field(default_factory=list)
+    data_channels: dict[str, "DataChannel"] = field(default_factory=dict)
+    comms_managers: EntityGroup["CommsManagerBase"] = field(default_factory=EntityGroup)
 
 
 ENV_CONTEXT_VAR: ContextVar[SimpyEnv] = ContextVar("Environment")
 SPECIAL_ENTITY_CONTEXT_VAR: ContextVar[SpecialContexts] = ContextVar("SpecialContexts")
-ENTITY_CONTEXT_VAR: ContextVar[dict[str, list["NamedUpstageEntity"]]] = ContextVar("Entities")
+ENTITY_CONTEXT_VAR: ContextVar[dict[str, EntityGroup["NamedUpstageEntity"]]] = ContextVar(
+    "Entities"
+)
 STAGE_CONTEXT_VAR: ContextVar[DotDict] = ContextVar("Stage")
 
 
 SKIP_GROUPS: list[str] = ["Actor", "Task", "Location", "CartesianLocation", "GeodeticLocation"]
 
 
+def pretty_time(now: float, stage: StageProtocol) -> str:
+    """A well-formatted string of a sim time.
+
+    Tries to account for generic names for time, such as 'ticks', using the
+    ``time_unit`` and ``daily_time_count`` stage variables.
+
+    Args:
+        now (float): The time to format.
+        stage (StageProtocol): The stage holding the time settings.
+
+    Returns:
+        str: The sim time
+    """
+    time_unit = stage.get("time_unit", None)
+    # If it's explicitly set to None, still treat it as hours.
+    time_unit = "hr" if time_unit is None else time_unit
+    standard = TIME_ALTERNATES.get(time_unit.lower(), time_unit)
+
+    ts: str
+    if standard in STANDARD_TIMES:
+        now_hrs = unit_convert(now, time_unit, "hr")
+        day = floor(now_hrs / 24)
+        rem_hours = now_hrs - (day * 24)
+        hms = strftime("%H:%M:%S", gmtime(rem_hours * 3600))
+        ts = f"[Day {day:4.0f} - {hms:s}]"
+    else:
+        day_unit_count = stage.get("daily_time_count", None)
+        if day_unit_count is None:
+            ts = f"[{now:.3f} {time_unit}]"
+        else:
+            days = int(floor(now / day_unit_count))
+            rem = now - (days * day_unit_count)
+            ts = f"[Day {days:4d} - {rem:.3f} {time_unit}]"
+
+    return ts
+
+
 class UpstageBase:
     """A base mixin class for everyone.
 
@@ -266,43 +463,42 @@ class UpstageBase:
             raise UpstageError("No stage found or set.")
         return stage
 
-    def get_actors(self) -> list["Actor"]:
+    def get_actors(self) -> EntityGroup["Actor"]:
         """Return all actors that the director knows.
 
         Returns:
-            list[NamedUpstageEntity]: List of actors in the simulation.
+            EntityGroup[Actor]: List-like group of actors in the simulation.
         """
-        ans: list[Actor] = []
         try:
             ans = SPECIAL_ENTITY_CONTEXT_VAR.get().actors
         except LookupError:
             raise UpstageError(CONTEXT_ERROR_MSG)
         return ans
 
-    def get_entity_group(self, group_name: str) -> list["NamedUpstageEntity"]:
+    def get_entity_group(self, group_name: str) -> EntityGroup["NamedUpstageEntity"]:
         """Get a single entity group by name.
 
         Args:
             group_name (str): The name of the entity group.
 
         Returns:
-            list[NamedUpstageEntity]: List of entities in the group.
+            EntityGroup[NamedUpstageEntity]: List-like group of entities.
         """
-        ans: list[NamedUpstageEntity] = []
         try:
-            grps: dict[str, list[NamedUpstageEntity]] = ENTITY_CONTEXT_VAR.get()
-            ans = grps.get(group_name, [])
+            grps = ENTITY_CONTEXT_VAR.get()
+            ans = grps.get(group_name)
+            if ans is None:
+                ans = EntityGroup()
         except LookupError:
             raise UpstageError(CONTEXT_ERROR_MSG)
         return ans
 
-    def get_monitored(self) -> list["MonitoringMixin"]:
+    def get_monitored(self) -> EntityGroup["MonitoringMixin"]:
         """Return entities that inherit from the MonitoringMixin.
 
         Returns:
-            list[MonitoringMixin]: List of entitites that are monitoring.
+            EntityGroup[MonitoringMixin]: List-like group of entitites that are monitoring.
         """
-        ans: list[MonitoringMixin] = []
         try:
             ans = SPECIAL_ENTITY_CONTEXT_VAR.get().monitored
         except LookupError:
@@ -322,14 +518,25 @@ class UpstageBase:
             raise UpstageError(CONTEXT_ERROR_MSG)
         return ans
 
-    def get_all_entity_groups(self) -> dict[str, list["NamedUpstageEntity"]]:
+    def get_data_channels(self) -> dict[str, "DataChannel"]:
+        """Return the named data recording channels.
+
+        Returns:
+            dict[str, DataChannel]: Channel name to channel.
+        """
+        try:
+            ans = SPECIAL_ENTITY_CONTEXT_VAR.get().data_channels
+        except LookupError:
+            raise UpstageError(CONTEXT_ERROR_MSG)
+        return ans
+
+    def get_all_entity_groups(self) -> dict[str, EntityGroup["NamedUpstageEntity"]]:
         """Get all entity groups.
 
         Returns:
-            dict[str, list[NamedUpstageEntity]]: Entity group names and associated
+            dict[str, EntityGroup[NamedUpstageEntity]]: Entity group names and associated
                 entities.
         """
-        grps: dict[str, list[NamedUpstageEntity]] = {}
         try:
             grps = ENTITY_CONTEXT_VAR.get()
         except LookupError:
@@ -345,29 +552,7 @@ class UpstageBase:
         Returns:
             str: The sim time
         """
-        now = self.env.now
-        time_unit = self.stage.get("time_unit", None)
-        # If it's explicitly set to None, still treat it as hours.
-        time_unit = "hr" if time_unit is None else time_unit
-        standard = TIME_ALTERNATES.get(time_unit.lower(), time_unit)
-
-        ts: str
-        if standard in STANDARD_TIMES:
-            now_hrs = unit_convert(now, time_unit, "hr")
-            day = floor(now_hrs / 24)
-            rem_hours = now_hrs - (day * 24)
-            hms = strftime("%H:%M:%S", gmtime(rem_hours * 3600))
-            ts = f"[Day {day:4.0f} - {hms:s}]"
-        else:
-            day_unit_count = self.stage.get("daily_time_count", None)
-            if day_unit_count is None:
-                ts = f"[{now:.3f} {time_unit}]"
-            else:
-                days = int(floor(now / day_unit_count))
-                rem = now - (days * day_unit_count)
-                ts = f"[Day {days:4d} - {rem:.3f} {time_unit}]"
-
-        return ts
+        return pretty_time(self.env.now, self.stage)
 
 
 class NamedUpstageEntity(UpstageBase):
@@ -392,14 +577,56 @@ class NamedUpstageEntity(UpstageBase):
         """
         try:
             ans = ENTITY_CONTEXT_VAR.get()
-            ans.setdefault(group_name, [])
-            if self in ans[group_name]:
+            group = ans.get(group_name)
+            if group is None:
+                group = ans[group_name] = EntityGroup()
+            if not group.add(self):
                 raise UpstageError(f"Entity: {self} already recorded in the environment")
-            ans[group_name].append(self)
         except LookupError:
-            entity_groups = {group_name: [self]}
+            entity_groups = {group_name: EntityGroup([self])}
             ENTITY_CONTEXT_VAR.set(entity_groups)
 
+    @classmethod
+    def _add_many_to_groups(cls, entities: Sequence["NamedUpstageEntity"]) -> None:
+        """Add new entities of this class to the class's entity groups at once.
+
+        Special groups are not added to.
+
+        Args:
+            entities (Sequence[NamedUpstageEntity]): Entities that aren't in any group.
+        """
+        try:
+            ans = ENTITY_CONTEXT_VAR.get()
+        except LookupError:
+            ans = {}
+            ENTITY_CONTEXT_VAR.set(ans)
+        for group_name in cls._entity_groups:
+            if group_name in SKIP_GROUPS:
+                continue
+            group = ans.get(group_name)
+            if group is None:
+                group = ans[group_name] = EntityGroup()
+            group.extend(entities)
+
+    def _remove_from_group(self, group_name: str) -> None:
+        """Remove from a single group.
+
+        Empty groups are removed from the context.
+
+        Args:
+            group_name (str): Group name
+        """
+        try:
+            ans = ENTITY_CONTEXT_VAR.get()
+        except LookupError:
+            raise UpstageError(CONTEXT_ERROR_MSG)
+        group = ans.get(group_name)
+        if group is None:
+            return
+        group.discard(self)
+        if not group:
+            del ans[group_name]
+
     def _add_special_group(self) -> None:
         """Add to a special group.
 
@@ -409,6 +636,13 @@ class NamedUpstageEntity(UpstageBase):
         """
         ...
 
+    def _remove_special_group(self) -> None:
+        """Remove from a special group.
+
+        Sub-classable to match ``_add_special_group``.
+        """
+        ...
+
     def _add_entity(self, group_names: set[str]) -> None:
         """Add self to an entity group(s).
 
@@ -421,6 +655,14 @@ class NamedUpstageEntity(UpstageBase):
             self._add_to_group(group_name)
         self._add_special_group()
 
+    def _remove_entity(self) -> None:
+        """Remove self from all of its entity groups."""
+        for group_name in self._entity_groups:
+            if group_name in SKIP_GROUPS:
+                continue
+            self._remove_from_group(group_name)
+        self._remove_special_group()
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Init the named entity."""
         super().__init__(*args, **kwargs)
@@ -455,9 +697,11 @@ class NamedUpstageEntity(UpstageBase):
 class SettableEnv(UpstageBase):
     """A mixin class for allowing the instance's environment to change."""
 
+    # Only set on instances that change their environment
+    _new_env: MockEnvironment | None = None
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Passthrough for the mixed classes."""
-        self._new_env: MockEnvironment | None = None
         super().__init__(*args, **kwargs)
 
     @property  # type: ignore [override]
@@ -483,7 +727,8 @@ class SettableEnv(UpstageBase):
 class EnvironmentContext:
     """A context manager to create a safe, globally (in context) referenceable environment and data.
 
-    The environment created is of type simpy.Environment
+    The environment created is of type simpy.Environment, or the subclass given
+    as ``scheduler``.
 
     This also sets context variables for actors, entities, and the stage.
 
@@ -522,29 +767,41 @@ class EnvironmentContext:
         initial_time: float = 0.0,
         random_seed: int | None = None,
         random_gen: Any | None = None,
+        numpy_variates: bool = False,
+        scheduler: type[SimpyEnv] = SimpyEnv,
     ) -> None:
         """Create an environment context.
 
-        random_seed is ignored if random_gen is given. Otherwise random.Random is
-        used.
+        random_seed is ignored for ``stage.random`` if random_gen is given. Otherwise
+        random.Random is used. The named streams from ``get_random_stream`` and the
+        variates on ``stage.variates`` are always seeded from random_seed.
 
         Args:
             initial_time (float, optional): Time to start the clock at. Defaults to 0.0.
             random_seed (int | None, optional): Seed for RNG. Defaults to None.
             random_gen (Any | None, optional): RNG object. Defaults to None.
+            numpy_variates (bool, optional): Draw ``stage.variates`` with NumPy.
+                Requires numpy. Defaults to False.
+            scheduler (type[SimpyEnv], optional): Environment class to run the
+                simulation with, such as ``BucketedEnvironment``. Must subclass
+                ``simpy.Environment``. Defaults to ``simpy.Environment``.
         """
+        if not (isinstance(scheduler, type) and issubclass(scheduler, SimpyEnv)):
+            raise UpstageError(f"Scheduler {scheduler} must be a simpy.Environment subclass")
         self.env_ctx = ENV_CONTEXT_VAR
         self.special_ctx = SPECIAL_ENTITY_CONTEXT_VAR
         self.entity_ctx = ENTITY_CONTEXT_VAR
         self.stage_ctx = STAGE_CONTEXT_VAR
         self.env_token: Token[SimpyEnv]
         self.special_token: Token[SpecialContexts]
-        self.entity_token: Token[dict[str, list[NamedUpstageEntity]]]
+        self.entity_token: Token[dict[str, EntityGroup[NamedUpstageEntity]]]
         self.stage_token: Token[DotDict]
         self._env: SimpyEnv | None = None
         self._initial_time: float = initial_time
         self._random_seed: int | None = random_seed
         self._random_gen: Any = random_gen
+        self._numpy_variates: bool = numpy_variates
+        self._scheduler: type[SimpyEnv] = scheduler
 
     def __enter__(self) -> SimpyEnv:
         """Create the environment context.
@@ -552,10 +809,12 @@ class EnvironmentContext:
         Returns:
             SimpyEnv: Simpy Environment
         """
-        self._env = SimpyEnv(initial_time=self._initial_time)
+        streams = RandomStreams(self._random_seed)
+        variates = Variates(streams, use_numpy=self._numpy_variates)
+        self._env = self._scheduler(initial_time=self._initial_time)
         self.env_token = self.env_ctx.set(self._env)
         self.special_token = self.special_ctx.set(SpecialContexts())
-        self.entity_token = self.entity_ctx.set(defaultdict(list))
+        self.entity_token = self.entity_ctx.set(defaultdict(EntityGroup))
         stage = DotDict()
         self.stage_token = self.stage_ctx.set(stage)
         if self._random_gen is None:
@@ -563,6 +822,8 @@ class EnvironmentContext:
             stage.random = random
         else:
             stage.random = self._random_gen
+        stage.random_streams = streams
+        stage.variates = variates
         return self._env
 
     def __exit__(self, *_: Any) -> None:
@@ -574,6 +835,38 @@ class EnvironmentContext:
         self._env = None
 
 
+@contextmanager
+def _entity_sandbox() -> Iterator[None]:
+    """Register entities made in the block in throwaway entity groups.
+
+    The entity groups of the context are untouched, so the entities are not
+    returned by ``get_entity_group``, ``get_actors``, or ``get_monitored``.
+    """
+    special_token = SPECIAL_ENTITY_CONTEXT_VAR.set(SpecialContexts())
+    entity_token = ENTITY_CONTEXT_VAR.set(defaultdict(EntityGroup))
+    try:
+        yield
+    finally:
+        SPECIAL_ENTITY_CONTEXT_VAR.reset(special_token)
+        ENTITY_CONTEXT_VAR.reset(entity_token)
+
+
+def remove_entity(entity: NamedUpstageEntity) -> None:
+    """Remove an entity from the entity groups of the current context.
+
+    After this, the entity is not returned by ``get_entity_group``,
+    ``get_actors``, or ``get_monitored``, and it won't be in the data
+    tables. Removing an entity that isn't registered does nothing.
+
+    Use this to keep the groups from growing when entities are done, such
+    as customers leaving a store.
+
+    Args:
+        entity (NamedUpstageEntity): The entity to remove.
+    """
+    entity._remove_entity()
+
+
 def add_stage_variable(varname: str, value: Any) -> None:
     """Add a variable to the stage.
 
@@ -610,6 +903,33 @@ def get_stage_variable(varname: str) -> Any:
     return getattr(stage, varname)
 
 
+def get_random_stream(*key: Any) -> Random:
+    """Get a named random number stream from the context's stage.
+
+    Streams are seeded from the context's random seed and their key, so draws
+    from one stream don't change the draws from another. Key parts that are
+    classes are named by their qualified name, and named entities (such as
+    actors) by their name, giving per task class and per actor streams.
+
+    Example:
+        >>> with EnvironmentContext(random_seed=42):
+        >>>     arrivals = get_random_stream("arrivals")
+        >>>     repair = get_random_stream(RepairTask, actor)
+
+    Args:
+        *key (Any): The parts of the stream's key.
+
+    Returns:
+        Random: The stream's random number generator.
+    """
+    try:
+        stage = STAGE_CONTEXT_VAR.get()
+    except LookupError:
+        raise ValueError("Stage should have been set.")
+    rng: Random = stage.random_streams.get(*key)
+    return rng
+
+
 def get_stage() -> StageProtocol:
     """Return the entire stage object.
 
@@ -627,6 +947,8 @@ def create_top_context(
     initial_time: float = 0.0,
     random_seed: int | None = None,
     random_gen: Any | None = None,
+    numpy_variates: bool = False,
+    scheduler: type[SimpyEnv] = SimpyEnv,
 ) -> EnvironmentContext:
     """Create a stage at this level of context.
 
@@ -635,7 +957,7 @@ def create_top_context(
     Returns:
         EnvironmentContext: The context
     """
-    ctx = EnvironmentContext(initial_time, random_seed, random_gen)
+    ctx = EnvironmentContext(initial_time, random_seed, random_gen, numpy_variates, scheduler)
     ctx.__enter__()
     return ctx
 
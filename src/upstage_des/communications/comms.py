@@ -15,7 +15,12 @@ from simpy import Event as SimpyEvent
 from simpy import Store
 
 from upstage_des.actor import Actor
-from upstage_des.base import ENV_CONTEXT_VAR, SimulationError, UpstageBase
+from upstage_des.base import (
+    ENV_CONTEXT_VAR,
+    SPECIAL_ENTITY_CONTEXT_VAR,
+    SimulationError,
+    UpstageBase,
+)
 from upstage_des.events import Put
 from upstage_des.states import CommunicationStore
 from upstage_des.task import process
@@ -138,6 +143,7 @@ class CommsManagerBase(UpstageBase):
                 self.connect(entity, comms_store_name)
         self.debug_log: list[dict[str, Any]] = []
         self.debug_logging: bool = debug_logging
+        SPECIAL_ENTITY_CONTEXT_VAR.get().comms_managers.add(self)
 
     @staticmethod
     def clean_message(message: str | Message) -> MessageContent:
@@ -164,6 +170,16 @@ class CommsManagerBase(UpstageBase):
         """
         self.connected[entity] = comms_store_name
 
+    def _retire_actor(self, actor: Actor) -> None:
+        """Forget an actor that is leaving the simulation.
+
+        Args:
+            actor (Actor): The retiring actor.
+        """
+        self.connected.pop(actor, None)
+        self.blocked_links = [link for link in self.blocked_links if actor not in link]
+        self.blocked_nodes = [node for node in self.blocked_nodes if node is not actor]
+
     def _get_state(self, actor: Actor) -> str | None:
         """Get the comms store for the right mode."""
         for name, state in actor._state_defs.items():
@@ -226,6 +226,22 @@ class RoutingTableCommsManager(RoutingCommsManagerBase):
         self._nodes: dict[str, Actor] = {}
         self._network: dict[str, set[str]] = defaultdict(set)
 
+    def _retire_actor(self, actor: Actor) -> None:
+        """Forget an actor that is leaving the simulation.
+
+        The actor is removed from the routing network.
+
+        Args:
+            actor (Actor): The retiring actor.
+        """
+        super()._retire_actor(actor)
+        if self._nodes.get(actor.name) is not actor:
+            return
+        del self._nodes[actor.name]
+        self._network.pop(actor.name, None)
+        for dests in self._network.values():
+            dests.discard(actor.name)
+
     def connect_nodes(self, u: Actor, v: Actor, two_way: bool = False) -> None:
         """Connect node u to v (one-way).
 
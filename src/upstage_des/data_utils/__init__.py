@@ -1,7 +1,17 @@
 """Utilities for data processing."""
 
-from .data_recorder import DataRecorder, get_recorded_data, record_data
+from .data_recorder import (
+    DataChannel,
+    DataRecorder,
+    create_data_channel,
+    flush_data_channels,
+    get_data_channel,
+    get_recorded_data,
+    record_data,
+)
 from .data_utils import create_location_table, create_table
+from .exporter import IncrementalExporter
+from .streaming import iter_location_table, iter_resource_table, iter_table
 
 __all__ = [
     "create_table",
@@ -9,4 +19,12 @@ __all__ = [
     "DataRecorder",
     "record_data",
     "get_recorded_data",
+    "DataChannel",
+    "create_data_channel",
+    "get_data_channel",
+    "flush_data_channels",
+    "IncrementalExporter",
+    "iter_table",
+    "iter_location_table",
+    "iter_resource_table",
 ]
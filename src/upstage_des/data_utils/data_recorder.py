@@ -1,9 +1,18 @@
 """Class for custom recording of things."""
 
+from collections import deque
+from collections.abc import Callable
 from copy import deepcopy
-from typing import Any
+from importlib import import_module
+from itertools import islice
+from types import UnionType
+from typing import Any, Union, cast, get_args, get_origin
 
-from upstage_des.base import SPECIAL_ENTITY_CONTEXT_VAR, UpstageBase
+from upstage_des.base import SPECIAL_ENTITY_CONTEXT_VAR, UpstageBase, UpstageError
+
+from .data_utils import TABLE_FORMAT, TABLE_FORMATS, _to_arrow
+
+CHANNEL_TIME = "Time"
 
 
 class DataRecorder(UpstageBase):
@@ -60,3 +69,273 @@ def get_recorded_data() -> list[tuple[float, Any]]:
     """
     dr = DataRecorder()
     return dr.get_recorded()
+
+
+CHANNEL_SINK = Callable[[dict[str, list[Any]]], None]
+
+
+def _schema_types(name: str, field: str, kind: Any) -> tuple[type, ...]:
+    """Get the classes a channel field's values are checked against.
+
+    Unions allow any of their members, and parameterized types such as
+    ``list[int]`` check only the outer class. A float field allows ints.
+
+    Args:
+        name (str): Channel name
+        field (str): Field name
+        kind (Any): The field's type in the schema
+
+    Returns:
+        tuple[type, ...]: The allowed classes.
+    """
+    origin = get_origin(kind)
+    if origin is Union or origin is UnionType:
+        return tuple(t for arg in get_args(kind) for t in _schema_types(name, field, arg))
+    if origin is not None:
+        kind = origin
+    if not isinstance(kind, type):
+        raise UpstageError(
+            f"Data channel '{name}' field '{field}' has type {kind!r}, expected a class"
+        )
+    return (int, float) if kind is float else (kind,)
+
+
+class DataChannel(UpstageBase):
+    """A named stream of recorded data with a fixed set of typed fields.
+
+    Records are stored column-wise: one list of values per field, plus a
+    "Time" column. This avoids building a dictionary or object for every
+    record, and the columns can go straight into a DataFrame or array.
+
+    Retention is controlled by ``max_records`` and ``sink``:
+
+    * Neither: every record is kept.
+    * ``max_records`` only: the newest ``max_records`` records are kept.
+    * ``sink`` only: records are kept until ``flush`` is called.
+    * Both: every ``max_records`` records are given to the sink and cleared.
+
+    The sink is called with a dictionary of column name to the list of values
+    being flushed. Call ``flush`` (or ``flush_data_channels``) at the end of
+    the simulation to send any remaining records to the sink.
+
+    Usage:
+
+    >>> with UP.EnvironmentContext() as env:
+    >>>     waits = DataChannel("waits", {"customer": str, "wait": float})
+    >>>     ...
+    >>>     waits.record("Bob", 3.0)
+    >>>     waits.record(customer="Alice", wait=2.5)
+    >>>     ...
+    >>>     df = pd.DataFrame(waits.get_table())
+    """
+
+    def __init__(
+        self,
+        name: str,
+        schema: dict[str, Any],
+        max_records: int | None = None,
+        sink: CHANNEL_SINK | None = None,
+        validate: bool = True,
+    ) -> None:
+        """Create and register a data channel in the current context.
+
+        Args:
+            name (str): The channel name. Must be unique in the context.
+            schema (dict[str, Any]): Field names and their types.
+            max_records (int | None, optional): Number of records to hold.
+                Defaults to None (no limit).
+            sink (CHANNEL_SINK | None, optional): Receives flushed records.
+                Defaults to None.
+            validate (bool, optional): If the types of recorded values are checked.
+                Defaults to True.
+        """
+        super().__init__()
+        if not schema:
+            raise UpstageError(f"Data channel '{name}' needs at least one field.")
+        if CHANNEL_TIME in schema:
+            raise UpstageError(f"'{CHANNEL_TIME}' is reserved and can't be a channel field.")
+        if max_records is not None and max_records < 1:
+            raise UpstageError(f"max_records must be at least 1, got {max_records}")
+        channels = self.get_data_channels()
+        if name in channels:
+            raise UpstageError(f"A data channel named '{name}' already exists.")
+        self.name = name
+        self.schema = dict(schema)
+        self.max_records = max_records
+        self.sink = sink
+        self.validate = validate
+        self._fields = tuple(schema)
+        self._types = tuple(_schema_types(name, field, kind) for field, kind in self.schema.items())
+        self._total = 0
+        self._new_columns()
+        channels[name] = self
+
+    def _new_columns(self) -> None:
+        """Start empty columns."""
+        columns = [CHANNEL_TIME, *self._fields]
+        self._columns: dict[str, list[Any] | deque[Any]]
+        if self.max_records is not None and self.sink is None:
+            self._columns = {col: deque(maxlen=self.max_records) for col in columns}
+        else:
+            self._columns = {col: [] for col in columns}
+        self._time = self._columns[CHANNEL_TIME]
+        self._appends = [self._columns[field].append for field in self._fields]
+
+    def __len__(self) -> int:
+        return len(self._time)
+
+    @property
+    def columns(self) -> list[str]:
+        """The column names of the channel's table."""
+        return [CHANNEL_TIME, *self._fields]
+
+    @property
+    def total_records(self) -> int:
+        """The number of records made, including dropped and flushed ones."""
+        return self._total
+
+    def record(self, *values: Any, **named_values: Any) -> None:
+        """Record values at the current time.
+
+        Give every field's value, either all by position in schema order,
+        or all by name.
+
+        Args:
+            *values (Any): Field values in schema order.
+            **named_values (Any): Field values by name.
+        """
+        if named_values and not values and named_values.keys() == set(self._fields):
+            values = tuple(named_values[field] for field in self._fields)
+        elif named_values or len(values) != len(self._fields):
+            raise UpstageError(
+                f"Data channel '{self.name}' needs values for exactly the fields {self._fields}"
+            )
+
+        if self.validate:
+            for field, kind, value in zip(self._fields, self._types, values):
+                if not isinstance(value, kind):
+                    raise TypeError(
+                        f"Data channel '{self.name}' field '{field}' got {value!r}, "
+                        f"expected {self.schema[field]}"
+                    )
+
+        self._time.append(self.env.now)
+        for append, value in zip(self._appends, values):
+            append(value)
+        self._total += 1
+        if self.sink is not None and self.max_records is not None:
+            if len(self._time) >= self.max_records:
+                self.flush()
+
+    def flush(self) -> None:
+        """Send the held records to the sink and clear them."""
+        if self.sink is None:
+            raise UpstageError(f"Data channel '{self.name}' has no sink to flush to.")
+        if not self._time:
+            return
+        data = cast(dict[str, list[Any]], self._columns)
+        self._new_columns()
+        self.sink(data)
+
+    def _column_data(self, start: int = 0) -> dict[str, list[Any]]:
+        """Copy the held columns.
+
+        Args:
+            start (int, optional): First held record to copy. Defaults to 0.
+
+        Returns:
+            dict[str, list[Any]]: Column name to column values.
+        """
+        return {col: list(islice(values, start, None)) for col, values in self._columns.items()}
+
+    def get_table(self, format: TABLE_FORMAT = "columns") -> Any:
+        """Get the held records as a table.
+
+        See ``create_table`` for the formats. The default is "columns", which
+        gives a dictionary that ``pandas.DataFrame`` accepts directly.
+
+        Args:
+            format (TABLE_FORMAT, optional): The output format. Defaults to "columns".
+
+        Returns:
+            Any: The table.
+        """
+        if format == "rows":
+            return list(zip(*self._columns.values())), self.columns
+        data = self._column_data()
+        if format == "columns":
+            return data
+        if format == "arrow":
+            return _to_arrow(data)
+        raise UpstageError(f"Unknown table format '{format}', expected one of {TABLE_FORMATS}")
+
+    def get_arrays(self) -> dict[str, Any]:
+        """Get the held records as NumPy arrays.
+
+        Requires ``numpy``. Fields typed as ``int``, ``float``, or ``bool`` get
+        arrays of that type.
+
+        Returns:
+            dict[str, numpy.ndarray]: Column name to column values.
+        """
+        try:
+            np = import_module("numpy")
+        except ImportError:
+            raise UpstageError("Data channel arrays require numpy to be installed.")
+        kinds: dict[str, Any] = {CHANNEL_TIME: float}
+        kinds.update(
+            {f: k for f, k in self.schema.items() if k in (int, float, bool)},
+        )
+        return {
+            col: np.asarray(values, dtype=kinds.get(col, object))
+            for col, values in self._column_data().items()
+        }
+
+
+def create_data_channel(
+    name: str,
+    schema: dict[str, Any],
+    max_records: int | None = None,
+    sink: CHANNEL_SINK | None = None,
+    validate: bool = True,
+) -> DataChannel:
+    """Create a named data channel in the current context.
+
+    See ``DataChannel`` for details.
+
+    Args:
+        name (str): The channel name. Must be unique in the context.
+        schema (dict[str, Any]): Field names and their types.
+        max_records (int | None, optional): Number of records to hold.
+            Defaults to None (no limit).
+        sink (CHANNEL_SINK | None, optional): Receives flushed records.
+            Defaults to None.
+        validate (bool, optional): If the types of recorded values are checked.
+            Defaults to True.
+
+    Returns:
+        DataChannel: The channel.
+    """
+    return DataChannel(name, schema, max_records=max_records, sink=sink, validate=validate)
+
+
+def get_data_channel(name: str) -> DataChannel:
+    """Get a data channel from the current context by name.
+
+    Args:
+        name (str): The channel name.
+
+    Returns:
+        DataChannel: The channel.
+    """
+    channels = UpstageBase().get_data_channels()
+    if name not in channels:
+        raise UpstageError(f"No data channel named '{name}'.")
+    return channels[name]
+
+
+def flush_data_channels() -> None:
+    """Flush every data channel in the current context that has a sink."""
+    for channel in UpstageBase().get_data_channels().values():
+        if channel.sink is not None:
+            channel.flush()
@@ -1,10 +1,12 @@
 """Utilities for gathering all recorded simulation data."""
 
-from dataclasses import asdict, fields, is_dataclass
-from typing import Any, cast
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, fields, is_dataclass
+from importlib import import_module
+from typing import Any, Literal, cast, overload
 
 from upstage_des.actor import Actor
-from upstage_des.base import UpstageBase
+from upstage_des.base import UpstageBase, UpstageError
 from upstage_des.data_types import CartesianLocation, GeodeticLocation
 from upstage_des.states import (
     ActiveState,
@@ -22,50 +24,334 @@ STATE_DATA_ROW = tuple[str, str, str, float, Any, str | None]
 LOCATION_DATA_ROW = tuple[str, str, str, float, float, float, float, str | None]
 COLUMN_NAMES = ["Entity Name", "Entity Type", "State Name", "Time"]
 ACTIVATION_STATUS_COL = "Activation Status"
+STATE_COLUMN_NAMES = COLUMN_NAMES + ["Value", ACTIVATION_STATUS_COL]
+
+TABLE_FORMAT = Literal["rows", "columns", "arrow"]
+TABLE_FORMATS: tuple[str, ...] = ("rows", "columns", "arrow")
+
+_DATACLASS_FIELDS: dict[type, tuple[str, ...]] = {}
+_ATOMIC_TYPES = {int, float, complex, bool, str, bytes, type(None)}
+
+
+class _RowSink:
+    """Collects table data as a list of row tuples."""
+
+    def __init__(self, columns: list[str]) -> None:
+        self.columns = columns
+        self.rows: list[tuple[Any, ...]] = []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(self, *values: Any) -> None:
+        """Add a row to the table.
+
+        Args:
+            values (Any): One value per column.
+        """
+        self.rows.append(values)
+
+    def set_last_status(self, status: str) -> None:
+        """Change the activation status of the most recent row.
+
+        Args:
+            status (str): The new activation status.
+        """
+        self.rows[-1] = self.rows[-1][:-1] + (status,)
+
+    def output(self) -> list[tuple[Any, ...]]:
+        """Return the gathered data.
+
+        Returns:
+            list[tuple[Any, ...]]: The rows.
+        """
+        return self.rows
+
+    def take(self, count: int) -> "_RowSink":
+        """Remove the oldest rows into a new sink.
+
+        Args:
+            count (int): The number of rows to remove.
+
+        Returns:
+            _RowSink: A sink holding the removed rows.
+        """
+        taken = _RowSink(self.columns)
+        taken.rows = self.rows[:count]
+        del self.rows[:count]
+        return taken
+
+
+class _ColumnSink:
+    """Collects table data directly into one list per column."""
+
+    def __init__(self, columns: list[str]) -> None:
+        self.columns = columns
+        self.data: dict[str, list[Any]] = {col: [] for col in columns}
+        self._appends = [values.append for values in self.data.values()]
+        self._status = self.data[columns[-1]]
+
+    def __len__(self) -> int:
+        return len(self._status)
+
+    def add(self, *values: Any) -> None:
+        """Add a row to the table.
+
+        Args:
+            values (Any): One value per column.
+        """
+        for append, value in zip(self._appends, values):
+            append(value)
+
+    def set_last_status(self, status: str) -> None:
+        """Change the activation status of the most recent row.
+
+        Args:
+            status (str): The new activation status.
+        """
+        self._status[-1] = status
+
+    def output(self) -> dict[str, list[Any]]:
+        """Return the gathered data.
+
+        Returns:
+            dict[str, list[Any]]: Column name to column values.
+        """
+        return self.data
+
+    def take(self, count: int) -> "_ColumnSink":
+        """Remove the oldest rows into a new sink.
+
+        Args:
+            count (int): The number of rows to remove.
+
+        Returns:
+            _ColumnSink: A sink holding the removed rows.
+        """
+        taken = _ColumnSink(self.columns)
+        for values, taken_values in zip(self.data.values(), taken.data.values()):
+            taken_values.extend(values[:count])
+            del values[:count]
+        return taken
+
+
+_TableSink = _RowSink | _ColumnSink
+_HistoryWriter = Callable[
+    [_TableSink, str, str, str, bool, list[tuple[float, Any]], str | None], str | None
+]
+
+
+def _make_sink(columns: list[str], format: str) -> _TableSink:
+    """Create the data collector for a table format.
+
+    Args:
+        columns (list[str]): Column names
+        format (str): One of TABLE_FORMATS
+
+    Returns:
+        _TableSink: The data collector.
+    """
+    if format not in TABLE_FORMATS:
+        raise UpstageError(f"Unknown table format '{format}', expected one of {TABLE_FORMATS}")
+    if format == "rows":
+        return _RowSink(columns)
+    return _ColumnSink(columns)
+
+
+def _to_arrow(data: dict[str, list[Any]]) -> Any:
+    """Convert columnar data to a pyarrow Table.
+
+    Args:
+        data (dict[str, list[Any]]): Column name to column values.
+
+    Returns:
+        pyarrow.Table: The table.
+    """
+    try:
+        pyarrow = import_module("pyarrow")
+    except ImportError:
+        raise UpstageError("The 'arrow' table format requires pyarrow to be installed.")
+    return pyarrow.table(data)
+
+
+def _finish(sink: _TableSink, format: str) -> Any:
+    """Produce the output for a table format from a sink.
+
+    Args:
+        sink (_TableSink): The data collector.
+        format (str): One of TABLE_FORMATS
+
+    Returns:
+        Any: The formatted table.
+    """
+    if format == "rows":
+        return sink.output(), sink.columns
+    data = cast(_ColumnSink, sink).output()
+    if format == "arrow":
+        return _to_arrow(data)
+    return data
+
+
+def _location_sink(format: str) -> _TableSink:
+    """Create the data collector for a location table.
+
+    The dimension names are only known once the data are seen, so they are
+    named generically and renamed by ``_finish_locations``.
+
+    Args:
+        format (str): One of TABLE_FORMATS
+
+    Returns:
+        _TableSink: The data collector.
+    """
+    return _make_sink(COLUMN_NAMES + ["_1", "_2", "_3", ACTIVATION_STATUS_COL], format)
+
+
+def _finish_locations(sink: _TableSink, is_xyz: bool, format: str) -> Any:
+    """Name the location dimensions and produce the output for a table format.
+
+    Args:
+        sink (_TableSink): The data collector from ``_location_sink``.
+        is_xyz (bool): If the locations are XYZ (otherwise LLA).
+        format (str): One of TABLE_FORMATS
+
+    Returns:
+        Any: The formatted table.
+    """
+    dims = ["X", "Y", "Z"] if is_xyz else ["Lat", "Lon", "Alt"]
+    columns = COLUMN_NAMES + dims + [ACTIVATION_STATUS_COL]
+    sink.columns = columns
+    if isinstance(sink, _ColumnSink):
+        sink.data = dict(zip(columns, sink.data.values()))
+    return _finish(sink, format)
+
+
+def _dataclass_items(value: Any) -> list[tuple[str, Any]]:
+    """Get the attribute names and values of a dataclass.
+
+    This matches the output of ``asdict``. Dataclasses with only atomic
+    values (numbers, strings, and None) skip the deep copy that ``asdict``
+    makes, since it isn't needed for them.
+
+    Args:
+        value (Any): A dataclass instance.
+
+    Returns:
+        list[tuple[str, Any]]: Attribute name and value pairs.
+    """
+    kind = type(value)
+    names = _DATACLASS_FIELDS.get(kind)
+    if names is None:
+        names = tuple(f.name for f in fields(value))
+        _DATACLASS_FIELDS[kind] = names
+    values = [getattr(value, name) for name in names]
+    if all(type(v) in _ATOMIC_TYPES for v in values):
+        return list(zip(names, values))
+    return list(asdict(value).items())
+
+
+def _initial_status(is_active: bool) -> str | None:
+    """The activation status of a history before any activation is seen.
+
+    Args:
+        is_active (bool): If the state is an active type
+
+    Returns:
+        str | None: The status
+    """
+    return "inactive" if is_active else None
 
 
 def _state_history_to_table(
+    sink: _TableSink,
     actor_name: str,
     actor_kind: str,
     state_name: str,
     is_active: bool,
     hist: list[tuple[float, Any]],
-) -> list[STATE_DATA_ROW]:
-    """Create a state history table from an actor.
+    active_value: str | None = None,
+) -> str | None:
+    """Add a state history to a data table.
 
     The final entry is a way to flag if a variable is becoming active or not.
 
     Args:
+        sink (_TableSink): The table data collector.
         actor_name (str): Actor name
         actor_kind (str): Actor kind
         state_name (str): State name
         is_active (bool): If the state is an active type
         hist (list[tuple[float, Any]]): History from _quantities or _state_histories
+        active_value (str | None, optional): Activation status at the start of
+            the history. Defaults to None, which is the status before any activation.
 
     Returns:
-        list[STATE_DATA_ROW]: A long-form data table of state data.
+        str | None: The activation status at the end of the history.
     """
-    data: list[STATE_DATA_ROW] = []
-    active_value = "inactive" if is_active else None
+    add = sink.add
+    if active_value is None:
+        active_value = _initial_status(is_active)
     for time, value in hist:
         if isinstance(value, ActiveStatus):
-            row = data.pop(-1)
-            rows = [tuple(list(row[:-1]) + [value.name])]
+            sink.set_last_status(value.name)
             active_value = "active" if value.name == "activating" else "inactive"
-        elif is_dataclass(value) and not isinstance(value, type):
-            rows = [
-                (actor_name, actor_kind, f"{state_name}.{k}", time, v, active_value)
-                for k, v in asdict(value).items()
-            ]
         elif isinstance(value, dict):
-            rows = [
-                (actor_name, actor_kind, f"{state_name}.{k}", time, v, active_value)
-                for k, v in value.items()
-            ]
+            for k, v in value.items():
+                add(actor_name, actor_kind, f"{state_name}.{k}", time, v, active_value)
+        elif is_dataclass(value) and not isinstance(value, type):
+            for k, v in _dataclass_items(value):
+                add(actor_name, actor_kind, f"{state_name}.{k}", time, v, active_value)
         else:
-            rows = [(actor_name, actor_kind, state_name, time, value, active_value)]
-        data.extend(rows)
-    return data
+            add(actor_name, actor_kind, state_name, time, value, active_value)
+    return active_value
+
+
+def _location_history_to_table(
+    sink: _TableSink,
+    actor_name: str,
+    actor_kind: str,
+    state_name: str,
+    is_active: bool,
+    hist: list[tuple[float, Any]],
+    active_value: str | None = None,
+) -> str | None:
+    """Add a location state history to a location data table.
+
+    Args:
+        sink (_TableSink): The table data collector.
+        actor_name (str): Actor name
+        actor_kind (str): Actor kind
+        state_name (str): State name
+        is_active (bool): If the state is an active type
+        hist (list[tuple[float, Any]]): History from _state_histories
+        active_value (str | None, optional): Activation status at the start of
+            the history. Defaults to None, which is the status before any activation.
+
+    Returns:
+        str | None: The activation status at the end of the history.
+    """
+    add = sink.add
+    if active_value is None:
+        active_value = _initial_status(is_active)
+    value: ACTUAL_LOCATION | ActiveStatus
+    for time, value in hist:
+        if isinstance(value, ActiveStatus):
+            sink.set_last_status(value.name)
+            active_value = "active" if value.name == "activating" else "inactive"
+        elif isinstance(value, GeodeticLocation):
+            add(
+                actor_name,
+                actor_kind,
+                state_name,
+                time,
+                value.lat,
+                value.lon,
+                value.alt,
+                active_value,
+            )
+        elif isinstance(value, CartesianLocation):
+            add(actor_name, actor_kind, state_name, time, value.x, value.y, value.z, active_value)
+    return active_value
 
 
 def _key_list(obj: Any) -> list[str]:
@@ -76,28 +362,34 @@ def _key_list(obj: Any) -> list[str]:
     raise ValueError(f"Unexpected data type for state history: {obj}")
 
 
-def _actor_state_data(
-    actor: Actor,
-    skip_locations: bool = True,
-    save_static: bool = False,
-) -> tuple[list[STATE_DATA_ROW], list[Any]]:
-    """Gather actor recorded data.
+@dataclass
+class _History:
+    """A recorded history that feeds a data table."""
+
+    name: str
+    is_active: bool
+    data: list[tuple[float, Any]]
+    resource: Any = None
+
+
+def _actor_histories(
+    actor: Actor, skip_locations: bool = True, committed: bool = False
+) -> tuple[list[_History], list[str]]:
+    """Find the recorded histories of an actor's states.
 
     Args:
         actor (Actor): The actor.
         skip_locations (bool, optional): If location states should be ignored.
             Defaults to True.
-        save_static (bool, optional): If non-recording states are saved.
-            Defaults to False.
+        committed (bool, optional): Leave out the latest level of a resource's open
+            ``history_interval`` window, which can still change. Defaults to False.
 
     Returns:
-        list[STATE_INFO]: List of state information
-        list[Any]: List of monitoring objects to ignore in a global search.
+        list[_History]: The recorded histories, including monitored resources.
+        list[str]: Names of the states that have no recorded history.
     """
-    data: list[STATE_DATA_ROW] = []
-    resources: list[Any] = []
-    name, kind = actor.name, actor.__class__.__name__
-
+    histories: list[_History] = []
+    unrecorded: list[str] = []
     for state_name, state in actor._state_defs.items():
         if skip_locations and isinstance(state, LOCATION_TYPES):
             continue
@@ -105,39 +397,89 @@ def _actor_state_data(
         is_active = isinstance(state, ActiveState)
         is_prefilled = any(key.startswith(f"{state_name}.") for key in actor._state_histories)
         if state_name in actor._state_histories:
-            data.extend(
-                _state_history_to_table(
-                    name, kind, state_name, is_active, actor._state_histories[state_name]
-                )
-            )
+            histories.append(_History(state_name, is_active, actor._state_histories[state_name]))
         elif is_prefilled:
             for key in _key_list(_value):
                 sname = f"{state_name}.{key}"
                 assert sname in actor._state_histories
-                data.extend(
-                    _state_history_to_table(
-                        name, kind, sname, is_active, actor._state_histories[sname]
-                    )
-                )
+                histories.append(_History(sname, is_active, actor._state_histories[sname]))
         elif hasattr(_value, "_quantities"):
-            resources.append(_value)
-            data.extend(_state_history_to_table(name, kind, state_name, False, _value._quantities))
-        elif save_static:
-            the_value = getattr(actor, state_name)
-            if isinstance(the_value, _DictionaryProxy):
-                data.extend(
-                    [
-                        (name, kind, f"{state_name}.{k}", 0.0, v, STATIC_STATE)
-                        for k, v in _value.items()
-                    ]
-                )
-            else:
-                data.append((name, kind, state_name, 0.0, the_value, STATIC_STATE))
-
-    return data, resources
-
-
-def _actor_location_data(actor: Actor) -> tuple[list[LOCATION_DATA_ROW], list[str]]:
+            data = _value._quantities if committed else _value._level_history()
+            histories.append(_History(state_name, False, data, _value))
+        else:
+            unrecorded.append(state_name)
+    return histories, unrecorded
+
+
+def _actor_location_histories(actor: Actor) -> list[_History]:
+    """Find the recorded histories of an actor's location states.
+
+    Args:
+        actor (Actor): The actor.
+
+    Returns:
+        list[_History]: The recorded location histories.
+    """
+    histories: list[_History] = []
+    for state_name, state_data in actor._state_histories.items():
+        _state = actor._state_defs.get(state_name, None)
+        if not isinstance(_state, LOCATION_TYPES):
+            continue
+        histories.append(_History(state_name, isinstance(_state, ActiveState), state_data))
+    return histories
+
+
+def _actor_state_data(
+    sink: _TableSink,
+    actor: Actor,
+    skip_locations: bool = True,
+    save_static: bool = False,
+) -> list[Any]:
+    """Gather actor recorded data.
+
+    Args:
+        sink (_TableSink): The table data collector.
+        actor (Actor): The actor.
+        skip_locations (bool, optional): If location states should be ignored.
+            Defaults to True.
+        save_static (bool, optional): If non-recording states are saved.
+            Defaults to False.
+
+    Returns:
+        list[Any]: List of monitoring objects to ignore in a global search.
+    """
+    resources: list[Any] = []
+    name, kind = actor.name, actor.__class__.__name__
+    histories, unrecorded = _actor_histories(actor, skip_locations=skip_locations)
+    for history in histories:
+        if history.resource is not None:
+            resources.append(history.resource)
+        _state_history_to_table(sink, name, kind, history.name, history.is_active, history.data)
+
+    if save_static:
+        _actor_static_data(sink, actor, unrecorded)
+    return resources
+
+
+def _actor_static_data(sink: _TableSink, actor: Actor, unrecorded: list[str]) -> None:
+    """Add the current values of non-recording states to a data table.
+
+    Args:
+        sink (_TableSink): The table data collector.
+        actor (Actor): The actor.
+        unrecorded (list[str]): Names of the states without a recorded history.
+    """
+    name, kind = actor.name, actor.__class__.__name__
+    for state_name in unrecorded:
+        the_value = getattr(actor, state_name)
+        if isinstance(the_value, _DictionaryProxy):
+            for k, v in actor.__dict__[state_name].items():
+                sink.add(name, kind, f"{state_name}.{k}", 0.0, v, STATIC_STATE)
+        else:
+            sink.add(name, kind, state_name, 0.0, the_value, STATIC_STATE)
+
+
+def _actor_location_data(sink: _TableSink, actor: Actor) -> bool:
     """Get actor location data, if it exists.
 
     The actor needs to have recording Location states:
@@ -145,50 +487,83 @@ def _actor_location_data(actor: Actor) -> tuple[list[LOCATION_DATA_ROW], list[st
         * GeodeticLocation(ChangingState)
 
     Args:
+        sink (_TableSink): The table data collector.
         actor (Actor): The actor.
 
     Returns:
-        list[LOCATION_DATA_ROW]: Time and XYZ/LLA data.
-        list[str]: name of XYZ/LLA
+        bool: If the location data are XYZ (otherwise LLA).
     """
-    data: list[LOCATION_DATA_ROW] = []
-    is_xyz = True
     name, kind = actor.name, actor.__class__.__name__
-    for state_name, state_data in actor._state_histories.items():
-        _state = actor._state_defs.get(state_name, None)
-        if not isinstance(_state, LOCATION_TYPES):
-            continue
-        value: ACTUAL_LOCATION | ActiveStatus
-        is_active = isinstance(_state, ActiveState)
-        active_value = "inactive" if is_active else None
-        for time, value in state_data:
-            if isinstance(value, ActiveStatus):
-                _row = data.pop(-1)
-                row = tuple(list(_row[:-1]) + [value.name])
-                active_value = "active" if value.name == "activating" else "inactive"
-            elif isinstance(value, GeodeticLocation):
-                row = (name, kind, state_name, time, value.lat, value.lon, value.alt, active_value)
-                is_xyz = False
-            elif isinstance(value, CartesianLocation):
-                row = (name, kind, state_name, time, value.x, value.y, value.z, active_value)
-            data.append(cast(LOCATION_DATA_ROW, row))
-    cols = ["X", "Y", "Z"] if is_xyz else ["Lat", "Lon", "Alt"]
-    return data, cols
+    histories = _actor_location_histories(actor)
+    for history in histories:
+        _location_history_to_table(sink, name, kind, history.name, history.is_active, history.data)
+    return not any(_is_geodetic(history.data) for history in histories)
 
 
+def _is_geodetic(hist: list[tuple[float, Any]]) -> bool:
+    """Test if a location history holds geodetic locations.
+
+    Args:
+        hist (list[tuple[float, Any]]): The location history
+
+    Returns:
+        bool: If the locations are GeodeticLocations.
+    """
+    for _, value in hist:
+        if not isinstance(value, ActiveStatus):
+            return isinstance(value, GeodeticLocation)
+    return False
+
+
+@overload
 def create_table(
-    skip_locations: bool = True, save_static: bool = False
-) -> tuple[list[STATE_DATA_ROW], list[str]]:
+    skip_locations: bool = True,
+    save_static: bool = False,
+    format: Literal["rows"] = "rows",
+) -> tuple[list[STATE_DATA_ROW], list[str]]: ...
+
+
+@overload
+def create_table(
+    skip_locations: bool = True,
+    save_static: bool = False,
+    *,
+    format: Literal["columns"],
+) -> dict[str, list[Any]]: ...
+
+
+@overload
+def create_table(
+    skip_locations: bool = True,
+    save_static: bool = False,
+    *,
+    format: Literal["arrow"],
+) -> Any: ...
+
+
+def create_table(
+    skip_locations: bool = True,
+    save_static: bool = False,
+    format: TABLE_FORMAT = "rows",
+) -> tuple[list[STATE_DATA_ROW], list[str]] | dict[str, list[Any]] | Any:
     """Create a data table of everything UPSTAGE has recorded.
 
     This uses the current environment context.
 
     The data columns are:
-        Time, Entity Name, Entity Type, State Name, State Value
+        Entity Name, Entity Type, State Name, Time, Value, Activation Status
 
     For SelfMonitoring<> resources that are not part of an actor, the name
     is pulled from the name entry to the resource. The Entity Type is the
-    class name, and the State Name is "Resource State".
+    class name, and the State Name is "Resource".
+
+    The ``format`` controls the output:
+
+    * ``"rows"``: A list of row tuples and a list of column names.
+    * ``"columns"``: A dictionary of column name to a list of the column values.
+      Values are added directly to the columns without building row tuples.
+    * ``"arrow"``: A ``pyarrow.Table`` built from the columns. Requires ``pyarrow``,
+      and each column must hold values that arrow can give a single type.
 
     Usage:
 
@@ -197,49 +572,67 @@ def create_table(
     >>>     ...
     >>>     env.run()
     >>>     table, cols = create_table()
-    >>>     df = pd.DataFrame(table, cols)
+    >>>     df = pd.DataFrame(table, columns=cols)
+    >>>     # or, with less memory used along the way
+    >>>     df = pd.DataFrame(create_table(format="columns"))
 
     Args:
         skip_locations (bool, optional): If location states should be ignored.
             Defaults to True.
         save_static (bool, optional): If non-recording states are saved.
             Defaults to False.
+        format (TABLE_FORMAT, optional): The output format. Defaults to "rows".
 
     Returns:
-        list[STATE_DATA_ROW]: Data table
-        list[str]]: Column names.
+        tuple[list[STATE_DATA_ROW], list[str]]: Data table and column names for "rows".
+        dict[str, list[Any]]: Column name to column values for "columns".
+        pyarrow.Table: The table for "arrow".
     """
+    sink = _make_sink(STATE_COLUMN_NAMES, format)
     _base = UpstageBase()
-    data: list[tuple[Any, ...]] = []
-    seen_resources: list[Any] = []
+    seen_resources: set[int] = set()
     for actor in _base.get_actors():
-        name = actor.name
-        kind = actor.__class__.__name__
-        _data, _resources = _actor_state_data(
-            actor, skip_locations=skip_locations, save_static=save_static
+        _resources = _actor_state_data(
+            sink, actor, skip_locations=skip_locations, save_static=save_static
         )
-        seen_resources.extend(_resources)
-        data.extend(_data)
+        seen_resources.update(id(res) for res in _resources)
 
     for monitoring in _base.get_monitored():
-        if monitoring in seen_resources:
+        if id(monitoring) in seen_resources:
             continue
         name = f"{monitoring.name}"
         kind = f"{monitoring.__class__.__name__}"
-        rows = [(name, kind, "Resource", t, value, None) for t, value in monitoring._quantities]
-        data.extend(rows)
+        for t, value in monitoring._level_history():
+            sink.add(name, kind, "Resource", t, value, None)
+
+    return _finish(sink, format)
+
+
+@overload
+def create_location_table(
+    format: Literal["rows"] = "rows",
+) -> tuple[list[LOCATION_DATA_ROW], list[str]]: ...
+
 
-    colnames = COLUMN_NAMES + ["Value", ACTIVATION_STATUS_COL]
-    return data, colnames
+@overload
+def create_location_table(format: Literal["columns"]) -> dict[str, list[Any]]: ...
 
 
-def create_location_table() -> tuple[list[LOCATION_DATA_ROW], list[str]]:
+@overload
+def create_location_table(format: Literal["arrow"]) -> Any: ...
+
+
+def create_location_table(
+    format: TABLE_FORMAT = "rows",
+) -> tuple[list[LOCATION_DATA_ROW], list[str]] | dict[str, list[Any]] | Any:
     """Create a data table of every location UPSTAGE has recorded.
 
     Assumes that all location types are the same.
 
     This uses the current environment context.
 
+    See ``create_table`` for the meaning of ``format``.
+
     Usage:
 
     >>> import pandas as pd
@@ -247,15 +640,19 @@ def create_location_table() -> tuple[list[LOCATION_DATA_ROW], list[str]]:
     >>>     ...
     >>>     env.run()
     >>>     table, cols = create_location_table()
-    >>>     df = pd.DataFrame(table, cols)
+    >>>     df = pd.DataFrame(table, columns=cols)
+
+    Args:
+        format (TABLE_FORMAT, optional): The output format. Defaults to "rows".
 
     Returns:
-        list[LOCATION_DATA_ROW]: Data table
-        list[str]]: Column names.
+        tuple[list[LOCATION_DATA_ROW], list[str]]: Data table and column names for "rows".
+        dict[str, list[Any]]: Column name to column values for "columns".
+        pyarrow.Table: The table for "arrow".
     """
     _base = UpstageBase()
-    data: list[LOCATION_DATA_ROW] = []
+    sink = _location_sink(format)
+    is_xyz = True
     for actor in _base.get_actors():
-        _data, cols = _actor_location_data(actor)
-        data.extend(_data)
-    return data, COLUMN_NAMES + cols + [ACTIVATION_STATUS_COL]
+        is_xyz = _actor_location_data(sink, actor) and is_xyz
+    return _finish_locations(sink, is_xyz, format)
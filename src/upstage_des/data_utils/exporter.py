@@ -0,0 +1,237 @@
+"""Incremental export of recorded simulation data."""
+
+from dataclasses import dataclass
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from upstage_des.actor import Actor
+from upstage_des.base import UpstageBase
+from upstage_des.states import ActiveStatus
+
+from .data_recorder import get_data_channel
+from .data_utils import (
+    STATE_COLUMN_NAMES,
+    TABLE_FORMAT,
+    _actor_histories,
+    _actor_location_histories,
+    _finish,
+    _finish_locations,
+    _History,
+    _HistoryWriter,
+    _is_geodetic,
+    _location_history_to_table,
+    _location_sink,
+    _make_sink,
+    _RowSink,
+    _state_history_to_table,
+    _TableSink,
+    _to_arrow,
+)
+
+
+@dataclass
+class _Cursor:
+    """Position in a recorded history that has already been exported."""
+
+    index: int = 0
+    active_value: str | None = None
+
+
+class IncrementalExporter(UpstageBase):
+    """Export recorded data in pieces, returning only what is new.
+
+    Each call to ``create_table``, ``create_location_table``, or
+    ``get_recorded_data`` returns the data recorded since the previous call
+    of the same method. Concatenating the outputs of every call gives the
+    same data as the matching ``create_table``, ``create_location_table``,
+    or ``get_recorded_data`` function run once at the end of the simulation.
+
+    This is useful for long simulations where the data should be written
+    out, or cleared from the analysis memory, while the simulation runs.
+
+    Actors and resources created between exports are picked up automatically.
+
+    There is one exception to the concatenation rule. Activation status updates
+    change the status of the row recorded before them. If that row was returned
+    in an earlier export, it is returned again, with the new status, ahead of
+    the new rows.
+
+    Resources with a ``history_interval`` only export entries that can no
+    longer change. The latest level of a window is exported once the window
+    closes, with the resource's next level change.
+
+    Usage:
+
+    >>> with UP.EnvironmentContext() as env:
+    >>>     exporter = IncrementalExporter(format="columns")
+    >>>     ...
+    >>>     for i in range(10):
+    >>>         env.run(until=(i + 1) * 100)
+    >>>         write_to_disk(exporter.create_table())
+    """
+
+    def __init__(self, skip_locations: bool = True, format: TABLE_FORMAT = "rows") -> None:
+        """Create an exporter that starts from the beginning of the recorded data.
+
+        Args:
+            skip_locations (bool, optional): If location states should be ignored
+                in ``create_table``. Defaults to True.
+            format (TABLE_FORMAT, optional): The output format of the tables. See
+                ``create_table``. Defaults to "rows".
+        """
+        _make_sink(STATE_COLUMN_NAMES, format)
+        self.skip_locations = skip_locations
+        self.format = format
+        self._state_cursors: WeakKeyDictionary[Actor, dict[str, _Cursor]] = WeakKeyDictionary()
+        self._location_cursors: WeakKeyDictionary[Actor, dict[str, _Cursor]] = WeakKeyDictionary()
+        self._resource_cursors: WeakKeyDictionary[Any, int] = WeakKeyDictionary()
+        self._recorded_cursor = 0
+        self._channel_cursors: dict[str, int] = {}
+        self._is_xyz: bool | None = None
+
+    @staticmethod
+    def _export_history(
+        sink: _TableSink,
+        writer: _HistoryWriter,
+        cursors: dict[str, _Cursor],
+        actor_name: str,
+        actor_kind: str,
+        history: _History,
+    ) -> None:
+        """Add the unexported part of a history to a table.
+
+        Args:
+            sink (_TableSink): The table data collector.
+            writer (_HistoryWriter): Function that adds history entries to the sink.
+            cursors (dict[str, _Cursor]): The actor's export cursors.
+            actor_name (str): Actor name
+            actor_kind (str): Actor kind
+            history (_History): The history to export.
+        """
+        cursor = cursors.get(history.name)
+        if cursor is None:
+            cursor = cursors[history.name] = _Cursor()
+        hist = history.data
+        start, end = cursor.index, len(hist)
+        if start >= end:
+            return
+        if start and isinstance(hist[start][1], ActiveStatus):
+            # The status applies to a row that was already exported. Send it
+            # again so the status has a row to land on.
+            previous = start - 1
+            while previous and isinstance(hist[previous][1], ActiveStatus):
+                previous -= 1
+            again = _RowSink(sink.columns)
+            writer(
+                again,
+                actor_name,
+                actor_kind,
+                history.name,
+                history.is_active,
+                hist[previous : previous + 1],
+                cursor.active_value,
+            )
+            if again.rows:
+                sink.add(*again.rows[-1])
+        cursor.active_value = writer(
+            sink,
+            actor_name,
+            actor_kind,
+            history.name,
+            history.is_active,
+            hist[start:end],
+            cursor.active_value,
+        )
+        cursor.index = end
+
+    def create_table(self) -> Any:
+        """Create a data table of the states recorded since the last call.
+
+        The columns match ``create_table``. Static (non-recording) states are
+        not exported.
+
+        Returns:
+            Any: The table in the exporter's format. See ``create_table``.
+        """
+        sink = _make_sink(STATE_COLUMN_NAMES, self.format)
+        seen_resources: set[int] = set()
+        for actor in self.get_actors():
+            cursors = self._state_cursors.setdefault(actor, {})
+            name, kind = actor.name, actor.__class__.__name__
+            histories, _ = _actor_histories(
+                actor, skip_locations=self.skip_locations, committed=True
+            )
+            for history in histories:
+                if history.resource is not None:
+                    seen_resources.add(id(history.resource))
+                self._export_history(sink, _state_history_to_table, cursors, name, kind, history)
+
+        for monitoring in self.get_monitored():
+            if id(monitoring) in seen_resources:
+                continue
+            name = f"{monitoring.name}"
+            kind = f"{monitoring.__class__.__name__}"
+            start = self._resource_cursors.get(monitoring, 0)
+            quantities = monitoring._quantities
+            for t, value in quantities[start:]:
+                sink.add(name, kind, "Resource", t, value, None)
+            self._resource_cursors[monitoring] = len(quantities)
+
+        return _finish(sink, self.format)
+
+    def create_location_table(self) -> Any:
+        """Create a data table of the locations recorded since the last call.
+
+        The columns match ``create_location_table``. The location dimension
+        names are decided by the first export that sees location data.
+
+        Returns:
+            Any: The table in the exporter's format. See ``create_location_table``.
+        """
+        sink = _location_sink(self.format)
+        for actor in self.get_actors():
+            cursors = self._location_cursors.setdefault(actor, {})
+            name, kind = actor.name, actor.__class__.__name__
+            for history in _actor_location_histories(actor):
+                if self._is_xyz is None and any(
+                    not isinstance(v, ActiveStatus) for _, v in history.data
+                ):
+                    self._is_xyz = not _is_geodetic(history.data)
+                self._export_history(sink, _location_history_to_table, cursors, name, kind, history)
+        is_xyz = True if self._is_xyz is None else self._is_xyz
+        return _finish_locations(sink, is_xyz, self.format)
+
+    def get_recorded_data(self) -> list[tuple[float, Any]]:
+        """Return the data recorded with record_data or DataRecorder since the last call.
+
+        Returns:
+            list[tuple[float, Any]]: The data.
+        """
+        recorded = self.get_recorded()
+        start = self._recorded_cursor
+        self._recorded_cursor = len(recorded)
+        return recorded[start:]
+
+    def get_channel_data(self, name: str) -> Any:
+        """Return the records of a data channel made since the last call for that channel.
+
+        Records that the channel has already dropped or flushed to its sink are
+        not returned. The "rows" format gives a list of rows and the column names.
+
+        Args:
+            name (str): The channel name.
+
+        Returns:
+            Any: The records in the exporter's format.
+        """
+        channel = get_data_channel(name)
+        total = channel.total_records
+        first_held = total - len(channel)
+        start = max(0, self._channel_cursors.get(name, 0) - first_held)
+        self._channel_cursors[name] = total
+        data = channel._column_data(start)
+        if self.format == "rows":
+            return list(zip(*data.values())), channel.columns
+        if self.format == "arrow":
+            return _to_arrow(data)
+        return data
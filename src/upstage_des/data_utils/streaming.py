@@ -0,0 +1,367 @@
+"""Generators for gathering recorded simulation data in bounded memory."""
+
+from collections.abc import Callable, Iterator
+from typing import Any, Literal, overload
+
+from upstage_des.base import UpstageBase, UpstageError
+
+from .data_utils import (
+    LOCATION_DATA_ROW,
+    STATE_COLUMN_NAMES,
+    STATE_DATA_ROW,
+    TABLE_FORMAT,
+    _actor_histories,
+    _actor_location_histories,
+    _actor_static_data,
+    _finish,
+    _finish_locations,
+    _HistoryWriter,
+    _is_geodetic,
+    _location_history_to_table,
+    _location_sink,
+    _make_sink,
+    _state_history_to_table,
+    _TableSink,
+)
+
+DEFAULT_CHUNK_ROWS = 10_000
+
+
+def _check_chunk_rows(chunk_rows: int) -> None:
+    """Make sure a chunk size is usable.
+
+    Args:
+        chunk_rows (int): Rows per chunk
+    """
+    if chunk_rows < 1:
+        raise UpstageError(f"chunk_rows must be at least 1, got {chunk_rows}")
+
+
+def _drain(sink: _TableSink, chunk_rows: int, finish: Callable[[_TableSink], Any]) -> Iterator[Any]:
+    """Yield full chunks from a sink.
+
+    At least one row is kept in the sink so that a following activation
+    status can still update it.
+
+    Args:
+        sink (_TableSink): The table data collector.
+        chunk_rows (int): Rows per chunk
+        finish (Callable[[_TableSink], Any]): Makes the output from a chunk.
+
+    Yields:
+        Any: Formatted chunks.
+    """
+    while len(sink) > chunk_rows:
+        yield finish(sink.take(chunk_rows))
+
+
+def _stream_history(
+    sink: _TableSink,
+    writer: _HistoryWriter,
+    chunk_rows: int,
+    finish: Callable[[_TableSink], Any],
+    actor_name: str,
+    actor_kind: str,
+    state_name: str,
+    is_active: bool,
+    hist: list[tuple[float, Any]],
+) -> Iterator[Any]:
+    """Add a history to a sink a slice at a time, yielding full chunks.
+
+    Args:
+        sink (_TableSink): The table data collector.
+        writer (_HistoryWriter): Function that adds history entries to the sink.
+        chunk_rows (int): Rows per chunk
+        finish (Callable[[_TableSink], Any]): Makes the output from a chunk.
+        actor_name (str): Actor name
+        actor_kind (str): Actor kind
+        state_name (str): State name
+        is_active (bool): If the state is an active type
+        hist (list[tuple[float, Any]]): The history
+
+    Yields:
+        Any: Formatted chunks.
+    """
+    active_value: str | None = None
+    for start in range(0, len(hist), chunk_rows):
+        active_value = writer(
+            sink,
+            actor_name,
+            actor_kind,
+            state_name,
+            is_active,
+            hist[start : start + chunk_rows],
+            active_value,
+        )
+        yield from _drain(sink, chunk_rows, finish)
+
+
+def _iter_state_rows(
+    chunk_rows: int,
+    skip_locations: bool,
+    save_static: bool,
+    format: str,
+    include_actors: bool = True,
+) -> Iterator[Any]:
+    """Stream the state table, or only its resource rows.
+
+    Args:
+        chunk_rows (int): Rows per chunk
+        skip_locations (bool): If location states should be ignored.
+        save_static (bool): If non-recording states are saved.
+        format (str): One of TABLE_FORMATS
+        include_actors (bool, optional): If actor states are included, otherwise
+            only monitored resources are. Defaults to True.
+
+    Yields:
+        Any: Formatted chunks.
+    """
+    _base = UpstageBase()
+    sink = _make_sink(STATE_COLUMN_NAMES, format)
+
+    def finish(chunk: _TableSink) -> Any:
+        return _finish(chunk, format)
+
+    seen_resources: set[int] = set()
+    for actor in _base.get_actors():
+        name, kind = actor.name, actor.__class__.__name__
+        histories, unrecorded = _actor_histories(actor, skip_locations=skip_locations)
+        for history in histories:
+            if history.resource is not None:
+                seen_resources.add(id(history.resource))
+            elif not include_actors:
+                continue
+            yield from _stream_history(
+                sink,
+                _state_history_to_table,
+                chunk_rows,
+                finish,
+                name,
+                kind,
+                history.name,
+                history.is_active,
+                history.data,
+            )
+        if save_static and include_actors:
+            _actor_static_data(sink, actor, unrecorded)
+            yield from _drain(sink, chunk_rows, finish)
+
+    for monitoring in _base.get_monitored():
+        if id(monitoring) in seen_resources:
+            continue
+        name = f"{monitoring.name}"
+        kind = f"{monitoring.__class__.__name__}"
+        quantities = monitoring._level_history()
+        for start in range(0, len(quantities), chunk_rows):
+            for t, value in quantities[start : start + chunk_rows]:
+                sink.add(name, kind, "Resource", t, value, None)
+            yield from _drain(sink, chunk_rows, finish)
+
+    if len(sink):
+        yield finish(sink)
+
+
+@overload
+def iter_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    skip_locations: bool = True,
+    save_static: bool = False,
+    format: Literal["rows"] = "rows",
+) -> Iterator[tuple[list[STATE_DATA_ROW], list[str]]]: ...
+
+
+@overload
+def iter_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    skip_locations: bool = True,
+    save_static: bool = False,
+    *,
+    format: Literal["columns"],
+) -> Iterator[dict[str, list[Any]]]: ...
+
+
+@overload
+def iter_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    skip_locations: bool = True,
+    save_static: bool = False,
+    *,
+    format: Literal["arrow"],
+) -> Iterator[Any]: ...
+
+
+def iter_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    skip_locations: bool = True,
+    save_static: bool = False,
+    format: TABLE_FORMAT = "rows",
+) -> Iterator[tuple[list[STATE_DATA_ROW], list[str]]] | Iterator[dict[str, list[Any]]] | Any:
+    """Create the ``create_table`` data table in chunks.
+
+    Each chunk holds ``chunk_rows`` rows, except the last. The chunks come
+    in the same order as the rows of ``create_table``, and each chunk is in
+    the same form as the output of ``create_table`` for the given ``format``.
+
+    Only a chunk or two of rows is held at a time, so the chunks can be
+    written to disk or aggregated without building the full table.
+
+    This uses the current environment context, and the simulation should not
+    be run while the chunks are being read.
+
+    Usage:
+
+    >>> with UP.EnvironmentContext() as env:
+    >>>     ...
+    >>>     env.run()
+    >>>     for i, chunk in enumerate(iter_table(chunk_rows=50_000, format="columns")):
+    >>>         pd.DataFrame(chunk).to_parquet(f"states_{i}.parquet")
+
+    Args:
+        chunk_rows (int, optional): Rows per chunk. Defaults to DEFAULT_CHUNK_ROWS.
+        skip_locations (bool, optional): If location states should be ignored.
+            Defaults to True.
+        save_static (bool, optional): If non-recording states are saved.
+            Defaults to False.
+        format (TABLE_FORMAT, optional): The output format. Defaults to "rows".
+
+    Returns:
+        Iterator[tuple[list[STATE_DATA_ROW], list[str]]]: Data and column names for "rows".
+        Iterator[dict[str, list[Any]]]: Column name to column values for "columns".
+        Iterator[pyarrow.Table]: Tables for "arrow".
+    """
+    _check_chunk_rows(chunk_rows)
+    _make_sink(STATE_COLUMN_NAMES, format)
+    return _iter_state_rows(chunk_rows, skip_locations, save_static, format)
+
+
+@overload
+def iter_resource_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    format: Literal["rows"] = "rows",
+) -> Iterator[tuple[list[STATE_DATA_ROW], list[str]]]: ...
+
+
+@overload
+def iter_resource_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    *,
+    format: Literal["columns"],
+) -> Iterator[dict[str, list[Any]]]: ...
+
+
+@overload
+def iter_resource_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    *,
+    format: Literal["arrow"],
+) -> Iterator[Any]: ...
+
+
+def iter_resource_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    format: TABLE_FORMAT = "rows",
+) -> Iterator[tuple[list[STATE_DATA_ROW], list[str]]] | Iterator[dict[str, list[Any]]] | Any:
+    """Create a data table of the SelfMonitoring<> resources in chunks.
+
+    The rows are the resource rows of ``create_table``: resources held by an
+    actor's state are named by the actor and state, and other resources by
+    their own name with a State Name of "Resource".
+
+    See ``iter_table`` for the chunking and ``format``.
+
+    Args:
+        chunk_rows (int, optional): Rows per chunk. Defaults to DEFAULT_CHUNK_ROWS.
+        format (TABLE_FORMAT, optional): The output format. Defaults to "rows".
+
+    Returns:
+        Iterator[tuple[list[STATE_DATA_ROW], list[str]]]: Data and column names for "rows".
+        Iterator[dict[str, list[Any]]]: Column name to column values for "columns".
+        Iterator[pyarrow.Table]: Tables for "arrow".
+    """
+    _check_chunk_rows(chunk_rows)
+    _make_sink(STATE_COLUMN_NAMES, format)
+    return _iter_state_rows(chunk_rows, True, False, format, include_actors=False)
+
+
+def _iter_location_rows(chunk_rows: int, format: str) -> Iterator[Any]:
+    """Stream the location table.
+
+    Args:
+        chunk_rows (int): Rows per chunk
+        format (str): One of TABLE_FORMATS
+
+    Yields:
+        Any: Formatted chunks.
+    """
+    _base = UpstageBase()
+    actor_histories = [(actor, _actor_location_histories(actor)) for actor in _base.get_actors()]
+    is_xyz = not any(
+        _is_geodetic(history.data) for _, histories in actor_histories for history in histories
+    )
+    sink = _location_sink(format)
+
+    def finish(chunk: _TableSink) -> Any:
+        return _finish_locations(chunk, is_xyz, format)
+
+    for actor, histories in actor_histories:
+        name, kind = actor.name, actor.__class__.__name__
+        for history in histories:
+            yield from _stream_history(
+                sink,
+                _location_history_to_table,
+                chunk_rows,
+                finish,
+                name,
+                kind,
+                history.name,
+                history.is_active,
+                history.data,
+            )
+
+    if len(sink):
+        yield finish(sink)
+
+
+@overload
+def iter_location_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    format: Literal["rows"] = "rows",
+) -> Iterator[tuple[list[LOCATION_DATA_ROW], list[str]]]: ...
+
+
+@overload
+def iter_location_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    *,
+    format: Literal["columns"],
+) -> Iterator[dict[str, list[Any]]]: ...
+
+
+@overload
+def iter_location_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    *,
+    format: Literal["arrow"],
+) -> Iterator[Any]: ...
+
+
+def iter_location_table(
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    format: TABLE_FORMAT = "rows",
+) -> Iterator[tuple[list[LOCATION_DATA_ROW], list[str]]] | Iterator[dict[str, list[Any]]] | Any:
+    """Create the ``create_location_table`` data table in chunks.
+
+    See ``iter_table`` for the chunking and ``format``.
+
+    Args:
+        chunk_rows (int, optional): Rows per chunk. Defaults to DEFAULT_CHUNK_ROWS.
+        format (TABLE_FORMAT, optional): The output format. Defaults to "rows".
+
+    Returns:
+        Iterator[tuple[list[LOCATION_DATA_ROW], list[str]]]: Data and column names for "rows".
+        Iterator[dict[str, list[Any]]]: Column name to column values for "columns".
+        Iterator[pyarrow.Table]: Tables for "arrow".
+    """
+    _check_chunk_rows(chunk_rows)
+    _location_sink(format)
+    return _iter_location_rows(chunk_rows, format)
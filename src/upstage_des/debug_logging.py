@@ -0,0 +1,155 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+
+"""Structured debug logs for actors."""
+
+from collections import deque
+from collections.abc import Iterable
+from enum import IntEnum
+from typing import Any, NamedTuple
+
+from .base import StageProtocol, pretty_time
+
+__all__ = ("LogLevel", "LogRecord", "LOG_MESSAGES")
+
+
+class LogLevel(IntEnum):
+    """Importance of an actor log record.
+
+    UPSTAGE logs its own events at ``DEBUG``, and ``Actor.log`` defaults to ``INFO``.
+    """
+
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+
+MESSAGE = "message"
+
+LOG_MESSAGES: dict[str, str] = {
+    MESSAGE: "{}",
+    "caller": "method '{}' called by '{}'",
+    "set_knowledge": "method 'set_knowledge '{}={}'' called by '{}'",
+    "clear_knowledge": "method 'clear_knowledge '{}'' called by '{}'",
+    "begin_task": "begin_next_task: Starting {} task",
+    "network_task": "Outer: starting {}",
+    "interrupted": "Interrupted by Interrupt({!r}).",
+    "on_interrupt": "Interrupted while performing {}. Reasons: {}",
+    "nucleus": "Attaching {} as a state listener!",
+}
+"""Message templates for the event codes of log records."""
+
+
+class _Snapshot:
+    """The ``str`` and ``repr`` of a logged value, taken when it was logged.
+
+    Formats like the value did, without keeping the value alive or showing
+    later changes to it.
+    """
+
+    __slots__ = ("_repr", "_str")
+
+    def __init__(self, value: Any) -> None:
+        self._str = str(value)
+        self._repr = repr(value)
+
+    def __str__(self) -> str:
+        return self._str
+
+    def __repr__(self) -> str:
+        return self._repr
+
+    def __format__(self, spec: str) -> str:
+        return format(self._str, spec)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _Snapshot):
+            return self._repr == other._repr
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._repr)
+
+
+_ATOMIC_TYPES = {int, float, bool, str, type(None)}
+
+
+class LogRecord(NamedTuple):
+    """A log record, stored without formatting.
+
+    Values in UPSTAGE's own records that aren't numbers, strings, or None
+    are stored as their ``str`` and ``repr`` when logged. Messages from
+    ``Actor.log`` are stored as given.
+    """
+
+    time: float
+    level: int
+    event: str
+    args: tuple[Any, ...]
+
+    @property
+    def message(self) -> Any:
+        """The log message, without the time.
+
+        Returns:
+            Any: The message. Messages logged by the user are returned as given.
+        """
+        if self.event == MESSAGE:
+            return self.args[0]
+        return LOG_MESSAGES[self.event].format(*self.args)
+
+
+class _ActorLog:
+    """Holds an actor's log records, optionally dropping the oldest ones."""
+
+    def __init__(self, stage: StageProtocol | None, max_records: int | None = None) -> None:
+        self.stage = stage
+        self.records: deque[LogRecord] | list[LogRecord]
+        if max_records is None:
+            self.records = []
+        else:
+            self.records = deque(maxlen=max_records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def add(self, time: float, level: int, event: str, args: tuple[Any, ...]) -> None:
+        """Store a log record.
+
+        Args:
+            time (float): Simulation time
+            level (int): Log level
+            event (str): Event code from LOG_MESSAGES
+            args (tuple[Any, ...]): Values for the event's message.
+        """
+        if event != MESSAGE:
+            args = tuple(a if type(a) in _ATOMIC_TYPES else _Snapshot(a) for a in args)
+        self.records.append(LogRecord(time, level, event, args))
+
+    def extend(self, records: Iterable[LogRecord]) -> None:
+        """Add existing records, as when cloning.
+
+        Args:
+            records (Iterable[LogRecord]): The records.
+        """
+        self.records.extend(records)
+
+    def format(self, with_time: bool) -> list[tuple[float | int, Any]]:
+        """Format the records as time and message pairs.
+
+        Args:
+            with_time (bool): If the formatted time is added to the messages.
+
+        Returns:
+            list[tuple[float | int, Any]]: The log.
+        """
+        if not with_time or self.stage is None:
+            return [(record.time, record.message) for record in self.records]
+        stage = self.stage
+        return [
+            (record.time, f"{pretty_time(record.time, stage)} {record.message}")
+            for record in self.records
+        ]
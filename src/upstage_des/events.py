@@ -5,7 +5,7 @@
 
 """Classes for UPSTAGE events that feed to simpy."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any as tyAny
 from warnings import warn
 
@@ -14,7 +14,14 @@ from simpy.resources.container import ContainerGet, ContainerPut
 from simpy.resources.resource import Release, Request
 from simpy.resources.store import StoreGet, StorePut
 
-from .base import SimulationError, UpstageBase, UpstageError
+from .base import (
+    STAGE_CONTEXT_VAR,
+    SimulationError,
+    StageProtocol,
+    UpstageBase,
+    UpstageError,
+    get_random_stream,
+)
 from .constants import PLANNING_FACTOR_OBJECT
 from .units import unit_convert
 
@@ -34,6 +41,18 @@ __all__ = (
 SIM_REQ_EVTS = ContainerGet | ContainerPut | StoreGet | StorePut | Request | Release
 
 
+def _stage() -> StageProtocol:
+    """Get the stage without making an UPSTAGE object.
+
+    Returns:
+        StageProtocol: The stage
+    """
+    try:
+        return STAGE_CONTEXT_VAR.get()
+    except LookupError:
+        raise UpstageError("No stage found or set.")
+
+
 class BaseEvent(UpstageBase):
     """Base class for framework events."""
 
@@ -216,6 +235,7 @@ class Wait(BaseEvent):
         timeout_unit: str | None = None,
         *,
         rehearsal_time_to_complete: float | int | None = None,
+        stream: tyAny = None,
     ) -> "Wait":
         """Create a wait from a random uniform time.
 
@@ -228,14 +248,142 @@ class Wait(BaseEvent):
             timeout_unit (str, optional): Units of time
             rehearsal_time_to_complete (float | int, optional): The rehearsal time
                 to complete. Defaults to None - meaning the random value drawn.
+            stream (Any, optional): Key (or tuple of key parts) of the named random
+                stream to draw from. Defaults to None, which uses ``stage.random``.
 
         Returns:
             Wait: The timeout event
         """
-        rng = UpstageBase().stage.random
+        if stream is None:
+            rng = _stage().random
+        elif isinstance(stream, tuple):
+            rng = get_random_stream(*stream)
+        else:
+            rng = get_random_stream(stream)
         timeout = rng.uniform(low, high)
         return cls(timeout, timeout_unit, rehearsal_time_to_complete=rehearsal_time_to_complete)
 
+    @classmethod
+    def from_exponential(
+        cls,
+        mean: float | int,
+        timeout_unit: str | None = None,
+        *,
+        rehearsal_time_to_complete: float | int | None = None,
+        stream: tyAny = None,
+    ) -> "Wait":
+        """Create a wait from an exponentially distributed time.
+
+        The time is drawn from ``stage.variates``, which draws values in blocks.
+
+        Args:
+            mean (float | int): Mean time (one over the rate)
+            timeout_unit (str, optional): Units of time
+            rehearsal_time_to_complete (float | int, optional): The rehearsal time
+                to complete. Defaults to None - meaning the random value drawn.
+            stream (Any, optional): Key (or tuple of key parts) of the variate
+                stream to draw from. Defaults to None, the default stream.
+
+        Returns:
+            Wait: The timeout event
+        """
+        timeout = _stage().variates.exponential(mean, stream)
+        return cls(timeout, timeout_unit, rehearsal_time_to_complete=rehearsal_time_to_complete)
+
+    @classmethod
+    def from_triangular(
+        cls,
+        low: float | int,
+        high: float | int,
+        mode: float | int,
+        timeout_unit: str | None = None,
+        *,
+        rehearsal_time_to_complete: float | int | None = None,
+        stream: tyAny = None,
+    ) -> "Wait":
+        """Create a wait from a triangular distributed time.
+
+        The time is drawn from ``stage.variates``, which draws values in blocks.
+
+        Args:
+            low (float | int): Shortest time
+            high (float | int): Longest time
+            mode (float | int): Most likely time
+            timeout_unit (str, optional): Units of time
+            rehearsal_time_to_complete (float | int, optional): The rehearsal time
+                to complete. Defaults to None - meaning the random value drawn.
+            stream (Any, optional): Key (or tuple of key parts) of the variate
+                stream to draw from. Defaults to None, the default stream.
+
+        Returns:
+            Wait: The timeout event
+        """
+        try:
+            timeout = _stage().variates.triangular(low, high, mode, stream)
+        except ValueError as e:
+            raise SimulationError(str(e))
+        return cls(timeout, timeout_unit, rehearsal_time_to_complete=rehearsal_time_to_complete)
+
+    @classmethod
+    def from_lognormal(
+        cls,
+        mu: float | int,
+        sigma: float | int,
+        timeout_unit: str | None = None,
+        *,
+        rehearsal_time_to_complete: float | int | None = None,
+        stream: tyAny = None,
+    ) -> "Wait":
+        """Create a wait from a lognormally distributed time.
+
+        The time is drawn from ``stage.variates``, which draws values in blocks.
+
+        Args:
+            mu (float | int): Mean of the time's natural logarithm
+            sigma (float | int): Standard deviation of the time's natural logarithm
+            timeout_unit (str, optional): Units of time
+            rehearsal_time_to_complete (float | int, optional): The rehearsal time
+                to complete. Defaults to None - meaning the random value drawn.
+            stream (Any, optional): Key (or tuple of key parts) of the variate
+                stream to draw from. Defaults to None, the default stream.
+
+        Returns:
+            Wait: The timeout event
+        """
+        timeout = _stage().variates.lognormal(mu, sigma, stream)
+        return cls(timeout, timeout_unit, rehearsal_time_to_complete=rehearsal_time_to_complete)
+
+    @classmethod
+    def from_empirical(
+        cls,
+        times: Sequence[float | int],
+        timeout_unit: str | None = None,
+        *,
+        rehearsal_time_to_complete: float | int | None = None,
+        stream: tyAny = None,
+    ) -> "Wait":
+        """Create a wait from one of a list of observed times.
+
+        Each time is equally likely. The pick is drawn from ``stage.variates``,
+        which draws values in blocks.
+
+        Args:
+            times (Sequence[float | int]): Observed times
+            timeout_unit (str, optional): Units of time
+            rehearsal_time_to_complete (float | int, optional): The rehearsal time
+                to complete. Defaults to None - meaning the random value drawn.
+            stream (Any, optional): Key (or tuple of key parts) of the variate
+                stream to draw from. Defaults to None, the default stream.
+
+        Returns:
+            Wait: The timeout event
+        """
+        try:
+            timeout = _stage().variates.empirical(times, stream)
+        except ValueError as e:
+            raise SimulationError(str(e))
+        return cls(timeout, timeout_unit, rehearsal_time_to_complete=rehearsal_time_to_complete)
+
     def as_event(self) -> SIM.Timeout:
         """Cast Wait event as a simpy Timeout event.
 
@@ -790,7 +938,7 @@ class Event(BaseEvent):
         super().__init__(rehearsal_time_to_complete=rehearsal_time_to_complete)
         # The usage is sometimes that events might succeed before being
         # yielded on
-        self._payload: dict[str, Any] = {}
+        self._payload: dict[str, tyAny] = {}
         self._auto_reset = auto_reset
         assert isinstance(self.env, SIM.Environment)
         self._event = SIM.Event(self.env)
@@ -0,0 +1,501 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+
+"""Run replications and parameter sweeps of a simulation model."""
+
+import hashlib
+import json
+import os
+import pickle
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from itertools import product
+from math import inf
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Generic, TypeVar, overload
+from warnings import warn
+
+from simpy import Environment
+
+from .base import EnvironmentContext, UpstageError, add_stage_variable
+from .data_utils import create_table
+
+__all__ = ("Replication", "run_replications", "combine_tables", "parameter_grid", "run_sweep")
+
+T = TypeVar("T")
+
+SEED_COLUMN = "Seed"
+
+
+@dataclass
+class Replication(Generic[T]):
+    """The result of one replication, and what it cost to run."""
+
+    seed: int
+    result: T
+    end_time: float
+    events: int
+    wall_time: float
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def _default_reducer(_: Any) -> dict[str, list[Any]]:
+    return create_table(format="columns")
+
+
+def _run_counted(env: Environment, until: float | None) -> int:
+    """Run an environment, counting the events it processes.
+
+    Args:
+        env (Environment): The environment.
+        until (float | None): Time to stop at, or None to run until there are no events.
+
+    Returns:
+        int: Number of events processed.
+    """
+    stop = inf if until is None else until
+    events = 0
+    while env.peek() < stop:
+        env.step()
+        events += 1
+    if until is not None and env.now < until:
+        env.run(until=until)
+    return events
+
+
+def _run_one(
+    build_fn: Callable[[], Any],
+    seed: int,
+    until: float | None,
+    reducer: Callable[[Any], T],
+    params: dict[str, Any],
+) -> Replication[T]:
+    """Build and run one replication in its own context.
+
+    Args:
+        build_fn (Callable[[], Any]): Makes the model.
+        seed (int): Random seed for the stage's RNG.
+        until (float | None): Time to run to.
+        reducer (Callable[[Any], T]): Makes the result from the ``build_fn`` output.
+        params (dict[str, Any]): Stage variables to add before building the model.
+
+    Returns:
+        Replication[T]: The replication result.
+    """
+    start = perf_counter()
+    with EnvironmentContext(random_seed=seed) as env:
+        for name, value in params.items():
+            add_stage_variable(name, value)
+        model = build_fn()
+        events = _run_counted(env, until)
+        result = reducer(model)
+        end_time = env.now
+    return Replication(
+        seed=seed,
+        result=result,
+        end_time=end_time,
+        events=events,
+        wall_time=perf_counter() - start,
+        params=params,
+    )
+
+
+@overload
+def run_replications(
+    build_fn: Callable[[], Any],
+    seeds: Iterable[int],
+    *,
+    until: float | None = None,
+    reducer: None = None,
+    workers: int | None = None,
+    on_result: Callable[[Replication[dict[str, list[Any]]]], None] | None = None,
+) -> list[Replication[dict[str, list[Any]]]]: ...
+
+
+@overload
+def run_replications(
+    build_fn: Callable[[], Any],
+    seeds: Iterable[int],
+    *,
+    until: float | None = None,
+    reducer: Callable[[Any], T],
+    workers: int | None = None,
+    on_result: Callable[[Replication[T]], None] | None = None,
+) -> list[Replication[T]]: ...
+
+
+def run_replications(
+    build_fn: Callable[[], Any],
+    seeds: Iterable[int],
+    *,
+    until: float | None = None,
+    reducer: Callable[[Any], Any] | None = None,
+    workers: int | None = None,
+    on_result: Callable[[Replication[Any]], None] | None = None,
+) -> list[Replication[Any]]:
+    """Run replications of a model, each in its own environment context.
+
+    For each seed, an ``EnvironmentContext`` is made with that ``random_seed``,
+    ``build_fn`` is called in it to make the actors and start their networks,
+    and the environment is run. The ``reducer`` is then called with what
+    ``build_fn`` returned, while the context is still open, to make the
+    replication's result. The default reducer returns
+    ``create_table(format="columns")``.
+
+    With more than one worker, replications run in a pool of processes.
+    ``build_fn`` and ``reducer`` must then be picklable, which means they are
+    defined at the top level of a module. If they aren't, or the pool can't
+    be started, the replications run in this process instead. If the pool
+    fails part way, the replications that didn't finish run in this process.
+
+    Example:
+        >>> def build() -> None:
+        >>>     cashier = Cashier(name="Ada")
+        >>>     cashier.add_task_network(factory.make_network())
+        >>>     cashier.start_network_loop("work", "Serve")
+        >>>
+        >>> runs = run_replications(build, range(100), until=480.0, workers=8)
+        >>> table = combine_tables(runs)
+
+    Args:
+        build_fn (Callable[[], Any]): Makes the model in the current context.
+        seeds (Iterable[int]): Random seeds, one per replication.
+        until (float, optional): Time to run each replication to. Defaults to None,
+            which runs until no events are left.
+        reducer (Callable[[Any], T], optional): Makes the result from the output of
+            ``build_fn``. Defaults to None, which gives the columnar state table.
+        workers (int, optional): Number of processes to use. Defaults to None,
+            which runs in this process.
+        on_result (Callable[[Replication[T]], None], optional): Called with each
+            replication as it finishes, which may be out of seed order when using
+            workers. Defaults to None.
+
+    Returns:
+        list[Replication[T]]: The replications, in the order of the seeds.
+    """
+    jobs: list[tuple[int, dict[str, Any]]] = [(seed, {}) for seed in seeds]
+    return _run_jobs(build_fn, jobs, until, reducer or _default_reducer, workers, on_result)
+
+
+def _run_jobs(
+    build_fn: Callable[[], Any],
+    jobs: list[tuple[int, dict[str, Any]]],
+    until: float | None,
+    reducer: Callable[[Any], T],
+    workers: int | None,
+    on_result: Callable[[Replication[T]], None] | None,
+) -> list[Replication[T]]:
+    """Run replications for seed and stage variable pairs.
+
+    Jobs that a worker pool didn't finish are run in this process.
+
+    Args:
+        build_fn (Callable[[], Any]): Makes the model in the current context.
+        jobs (list[tuple[int, dict[str, Any]]]): Seed and stage variables for each run.
+        until (float | None): Time to run each replication to.
+        reducer (Callable[[Any], T]): Makes the result from the ``build_fn`` output.
+        workers (int | None): Number of processes to use.
+        on_result (Callable[[Replication[T]], None] | None): Called once with each
+            replication as it finishes.
+
+    Returns:
+        list[Replication[T]]: The replications, in the order of the jobs.
+    """
+    results: list[Replication[T] | None] = [None] * len(jobs)
+    if workers is not None and workers > 1 and len(jobs) > 1:
+        _run_in_pool(build_fn, jobs, until, reducer, workers, on_result, results)
+
+    replications: list[Replication[T]] = []
+    for (seed, params), finished in zip(jobs, results):
+        if finished is not None:
+            replications.append(finished)
+            continue
+        replication = _run_one(build_fn, seed, until, reducer, params)
+        if on_result is not None:
+            on_result(replication)
+        replications.append(replication)
+    return replications
+
+
+def _run_in_pool(
+    build_fn: Callable[[], Any],
+    jobs: list[tuple[int, dict[str, Any]]],
+    until: float | None,
+    reducer: Callable[[Any], T],
+    workers: int,
+    on_result: Callable[[Replication[T]], None] | None,
+    results: list[Replication[T] | None],
+) -> None:
+    """Run replications in a process pool.
+
+    Finished replications are put in ``results``. If the replications can't be
+    sent to other processes, or the pool fails, the jobs that didn't finish are
+    left as None.
+
+    Args:
+        build_fn (Callable[[], Any]): Makes the model in the current context.
+        jobs (list[tuple[int, dict[str, Any]]]): Seed and stage variables for each run.
+        until (float | None): Time to run each replication to.
+        reducer (Callable[[Any], T]): Makes the result from the ``build_fn`` output.
+        workers (int): Number of processes to use.
+        on_result (Callable[[Replication[T]], None] | None): Called with each
+            replication as it finishes.
+        results (list[Replication[T] | None]): The replications, by job.
+    """
+    try:
+        pickle.dumps((build_fn, reducer, jobs))
+    except Exception as e:
+        warn(f"Running replications in this process, they can't be sent to workers: {e}")
+        return
+
+    failure: Exception | None = None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_run_one, build_fn, seed, until, reducer, params): i
+                for i, (seed, params) in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                try:
+                    replication = future.result()
+                except (BrokenProcessPool, pickle.PicklingError, AttributeError) as e:
+                    # Keep collecting the replications that did finish.
+                    failure = e
+                    continue
+                if on_result is not None:
+                    on_result(replication)
+                results[futures[future]] = replication
+    except (BrokenProcessPool, NotImplementedError, OSError) as e:
+        failure = e
+    if failure is not None:
+        warn(f"Running unfinished replications in this process, the worker pool failed: {failure}")
+
+
+def combine_tables(
+    replications: Sequence[Replication[dict[str, list[Any]]]],
+) -> dict[str, list[Any]]:
+    """Stack the columnar tables of replications, adding a seed column.
+
+    Args:
+        replications (Sequence[Replication[dict[str, list[Any]]]]): Replications whose
+            results are columnar tables. Columns missing from a table are filled with None.
+
+    Returns:
+        dict[str, list[Any]]: The combined table.
+    """
+    combined: dict[str, list[Any]] = {SEED_COLUMN: []}
+    for replication in replications:
+        table = replication.result
+        if not table:
+            continue
+        num_rows = len(next(iter(table.values())))
+        for column, values in table.items():
+            if column == SEED_COLUMN:
+                raise UpstageError(f"Replication tables can't have a '{SEED_COLUMN}' column")
+            if column not in combined:
+                combined[column] = [None] * len(combined[SEED_COLUMN])
+            combined[column].extend(values)
+        combined[SEED_COLUMN].extend([replication.seed] * num_rows)
+        for values in combined.values():
+            if len(values) < len(combined[SEED_COLUMN]):
+                values.extend([None] * (len(combined[SEED_COLUMN]) - len(values)))
+    return combined
+
+
+def parameter_grid(params: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """Make every combination of parameter values.
+
+    Example:
+        >>> parameter_grid({"arrival_rate": [1.0, 2.0], "num_servers": [1, 2, 3]})
+        [{'arrival_rate': 1.0, 'num_servers': 1}, {'arrival_rate': 1.0, 'num_servers': 2}, ...]
+
+    Args:
+        params (Mapping[str, Sequence[Any]]): Parameter names and the values to try.
+
+    Returns:
+        list[dict[str, Any]]: The design points.
+    """
+    names = list(params)
+    return [dict(zip(names, values)) for values in product(*params.values())]
+
+
+def _reducer_identity(reducer: Callable[[Any], Any], reducer_key: str | None) -> str:
+    """Name a reducer for the result cache.
+
+    Args:
+        reducer (Callable[[Any], Any]): The reducer.
+        reducer_key (str | None): A name given by the user.
+
+    Returns:
+        str: The given name, or the reducer's module and qualified name.
+    """
+    if reducer_key is not None:
+        return reducer_key
+    module = getattr(reducer, "__module__", None)
+    qualname = getattr(reducer, "__qualname__", None)
+    if module is None or qualname is None or "<" in qualname:
+        raise UpstageError(
+            f"Reducer {reducer!r} has no stable name for the sweep cache. "
+            "Define it at the top level of a module, or give a reducer_key."
+        )
+    return f"{module}.{qualname}"
+
+
+def _point_key(
+    model_version: str,
+    reducer: str,
+    until: float | None,
+    params: dict[str, Any],
+    seed: int,
+) -> str:
+    """Hash a sweep run for the result cache.
+
+    Args:
+        model_version (str): Version of the model.
+        reducer (str): Name of the reducer.
+        until (float | None): Time each replication runs to.
+        params (dict[str, Any]): Stage variables for the point.
+        seed (int): Random seed.
+
+    Returns:
+        str: The hex digest.
+    """
+    try:
+        text = json.dumps([model_version, reducer, until, params, seed], sort_keys=True)
+    except (TypeError, ValueError) as e:
+        raise UpstageError(f"Sweep point values must be JSON serializable to cache results: {e}")
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _write_result(path: Path, replication: Replication[Any]) -> None:
+    """Save a replication so a partly written file is never read.
+
+    Args:
+        path (Path): File to write.
+        replication (Replication[Any]): The replication.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(replication, f)
+    os.replace(tmp, path)
+
+
+@overload
+def run_sweep(
+    build_fn: Callable[[], Any],
+    points: Iterable[Mapping[str, Any]],
+    seeds: Iterable[int],
+    *,
+    model_version: str,
+    cache_dir: str | Path | None = None,
+    until: float | None = None,
+    reducer: None = None,
+    workers: int | None = None,
+    reducer_key: str | None = None,
+) -> list[Replication[dict[str, list[Any]]]]: ...
+
+
+@overload
+def run_sweep(
+    build_fn: Callable[[], Any],
+    points: Iterable[Mapping[str, Any]],
+    seeds: Iterable[int],
+    *,
+    model_version: str,
+    cache_dir: str | Path | None = None,
+    until: float | None = None,
+    reducer: Callable[[Any], T],
+    workers: int | None = None,
+    reducer_key: str | None = None,
+) -> list[Replication[T]]: ...
+
+
+def run_sweep(
+    build_fn: Callable[[], Any],
+    points: Iterable[Mapping[str, Any]],
+    seeds: Iterable[int],
+    *,
+    model_version: str,
+    cache_dir: str | Path | None = None,
+    until: float | None = None,
+    reducer: Callable[[Any], Any] | None = None,
+    workers: int | None = None,
+    reducer_key: str | None = None,
+) -> list[Replication[Any]]:
+    """Run replications of a model over a design of stage variable values.
+
+    Every design point is run with every seed. The point's values are added
+    as stage variables with ``add_stage_variable`` before ``build_fn`` is
+    called, so the model reads them from the stage. Otherwise, each run is
+    the same as in ``run_replications``.
+
+    With a ``cache_dir``, each run's ``Replication`` is saved there as soon as
+    it finishes, in a file named by a hash of the model version, the reducer,
+    ``until``, the point, and the seed. Runs with a saved file are loaded
+    instead of run, so an interrupted sweep picks up where it stopped, and
+    overlapping sweeps share results. Change ``model_version`` when the model
+    changes to stop using old results. Point values are hashed by their JSON
+    form, so they must be JSON serializable. The reducer is named by its
+    module and qualified name, or by ``reducer_key`` if it doesn't have a
+    stable one (such as a lambda).
+
+    Example:
+        >>> points = parameter_grid({"arrival_rate": [1.0, 2.0], "num_servers": [1, 2]})
+        >>> runs = run_sweep(
+        >>>     build, points, range(30),
+        >>>     model_version="1.2",
+        >>>     cache_dir="sweep_results",
+        >>>     until=480.0,
+        >>>     workers=8,
+        >>> )
+
+    Args:
+        build_fn (Callable[[], Any]): Makes the model in the current context.
+        points (Iterable[Mapping[str, Any]]): Stage variable values for each design point,
+            such as from ``parameter_grid`` or a sampled design.
+        seeds (Iterable[int]): Random seeds to run at each point.
+        model_version (str): Version of the model, used in the cache key.
+        cache_dir (str | Path, optional): Directory for saved results. Defaults to None,
+            which doesn't save or load results.
+        until (float, optional): Time to run each replication to. Defaults to None,
+            which runs until no events are left.
+        reducer (Callable[[Any], T], optional): Makes the result from the output of
+            ``build_fn``. Defaults to None, which gives the columnar state table.
+        workers (int, optional): Number of processes to use. Defaults to None,
+            which runs in this process.
+        reducer_key (str, optional): Name of the reducer in the cache key. Defaults to
+            None, which uses the reducer's module and qualified name.
+
+    Returns:
+        list[Replication[T]]: The runs, ordered by point and then by seed.
+    """
+    seeds = list(seeds)
+    reducer = reducer or _default_reducer
+    jobs = [(seed, dict(point)) for point in points for seed in seeds]
+    results: list[Replication[Any] | None] = [None] * len(jobs)
+    save: Callable[[Replication[Any]], None] | None = None
+    if cache_dir is not None:
+        reducer_name = _reducer_identity(reducer, reducer_key)
+        directory = Path(cache_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        for i, (seed, params) in enumerate(jobs):
+            key = _point_key(model_version, reducer_name, until, params, seed)
+            path = directory / f"{key}.pkl"
+            if path.exists():
+                with open(path, "rb") as f:
+                    results[i] = pickle.load(f)
+
+        def save(replication: Replication[Any]) -> None:
+            key = _point_key(
+                model_version, reducer_name, until, replication.params, replication.seed
+            )
+            _write_result(directory / f"{key}.pkl", replication)
+
+    todo = [job for job, result in zip(jobs, results) if result is None]
+    ran = iter(_run_jobs(build_fn, todo, until, reducer, workers, save))
+    return [next(ran) if result is None else result for result in results]
@@ -194,6 +194,35 @@ class SensorMotionManager(UpstageBase):
             )
             warn(msg, UserWarning)
 
+    def _retire_actor(self, actor: Actor) -> None:
+        """Forget an actor that is leaving the simulation, as a mover or a sensor.
+
+        Sensors that can see the actor are told that it exited their range.
+
+        Args:
+            actor (Actor): The retiring actor.
+        """
+        for sensor in self._in_view.pop(actor, set()):
+            sensor.entity_exited_range(actor)
+        for _, proc in self._events.pop(actor, []):
+            if proc.is_alive:
+                proc.interrupt()
+        self._movers.pop(actor, None)
+        self._debug_data.pop(actor, None)
+
+        if self._sensors.pop(actor, None) is None:  # type: ignore [call-overload]
+            return
+        for mover, events in self._events.items():
+            keep = []
+            for sensor, proc in events:
+                if sensor is not actor:
+                    keep.append((sensor, proc))
+                elif proc.is_alive:
+                    proc.interrupt()
+            self._events[mover] = keep
+        for sensors in self._in_view.values():
+            sensors.discard(actor)
+
     # TODO: remove sensor or 'not active'?
 
     def _process_mover_sensor_pair(
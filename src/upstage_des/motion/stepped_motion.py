@@ -8,6 +8,7 @@ from collections.abc import Callable, Generator
 from typing import Any, cast
 
 from simpy import Event as SimpyEvent
+from simpy.core import Infinity
 
 from upstage_des.actor import Actor
 from upstage_des.base import SimulationError, UpstageBase
@@ -172,7 +173,7 @@ class SteppedMotionManager(UpstageBase):
 
     def _only_event_test(self) -> bool:
         """Determine if there are no events in the queue."""
-        if len(self.env._queue) == 0:
+        if self.env.peek() == Infinity:
             return True
         return False
 
@@ -289,6 +290,19 @@ class SteppedMotionManager(UpstageBase):
                 to_rem.add((sensor, detect))
         self._in_view -= to_rem
 
+    def _retire_actor(self, actor: Actor) -> None:
+        """Forget an actor that is leaving the simulation, as a detectable or a sensor.
+
+        Sensors that can see the actor are told that it exited their range.
+
+        Args:
+            actor (Actor): The retiring actor.
+        """
+        self._mover_not_detectable(actor)
+        self._detectables.pop(actor, None)
+        self._sensors.pop(actor, None)  # type: ignore [call-overload]
+        self._in_view = {pair for pair in self._in_view if pair[0] is not actor}
+
     def _mover_became_detectable(self, detectable: Actor) -> None:
         """Called via DetectabilityState state when an object becomes detectable.
 
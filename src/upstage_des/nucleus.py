@@ -9,6 +9,7 @@ from typing import Any
 
 from upstage_des.actor import Actor
 from upstage_des.base import UpstageError
+from upstage_des.debug_logging import LogLevel
 from upstage_des.task_network import TaskNetwork
 
 
@@ -34,7 +35,7 @@ class TaskNetworkNucleus:
 
     def _attach(self) -> None:
         """Attach the nucleus to an actor."""
-        self._actor.log(f"Attaching {self} as a state listener!")
+        self._actor._log_event(LogLevel.DEBUG, "nucleus", self)
         if self._actor._state_listener is not None:
             raise UpstageError(f"{self._actor} already has a nucleus attached.")
         self._actor._state_listener = self
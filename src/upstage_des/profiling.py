@@ -0,0 +1,145 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+
+"""Measure the cost of rehearsals."""
+
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Literal, Self
+
+from .base import UpstageError
+
+__all__ = ("RehearsalProfiler",)
+
+PROFILE_COLUMNS = [
+    "Name",
+    "Kind",
+    "Rehearsals",
+    "Cloned Actors",
+    "Events",
+    "Cache Hits",
+    "Wall Time",
+]
+
+PROFILER_CONTEXT_VAR: ContextVar["RehearsalProfiler | None"] = ContextVar(
+    "RehearsalProfiler", default=None
+)
+
+
+@dataclass
+class _RehearsalCost:
+    """The running totals for one task class or network."""
+
+    rehearsals: int = 0
+    clones: int = 0
+    events: int = 0
+    cache_hits: int = 0
+    wall_time: float = 0.0
+
+
+class RehearsalProfiler:
+    """Count the rehearsals, cloned actors, events, and wall time spent rehearsing.
+
+    Rehearsals in the ``with`` block are totalled by task class (for ``Task`` and
+    ``DecisionTask`` rehearsals) and by task network name (for network
+    rehearsals). A network's wall time and events include those of its tasks,
+    which are also counted on their own rows. Rehearsals that raise an error
+    are still counted.
+
+    Example:
+        >>> with UP.RehearsalProfiler() as profiler:
+        >>>     understudy = plane.rehearse_network("flight", ["Fly", "Land"])
+        >>> table, cols = profiler.get_table()
+    """
+
+    def __init__(self) -> None:
+        """Create a profiler. Use it as a context manager to profile rehearsals."""
+        self._costs: dict[tuple[str, str], _RehearsalCost] = {}
+        # Events of task rehearsals, for networks to total their tasks.
+        self._task_events = 0
+        self._token: Token[RehearsalProfiler | None] | None = None
+
+    def __enter__(self) -> Self:
+        self._token = PROFILER_CONTEXT_VAR.set(self)
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        if self._token is not None:
+            PROFILER_CONTEXT_VAR.reset(self._token)
+            self._token = None
+
+    def _record(
+        self,
+        name: str,
+        kind: str,
+        start: float,
+        clones: int = 0,
+        events: int = 0,
+        cache_hit: bool = False,
+    ) -> None:
+        """Add a finished rehearsal to the totals.
+
+        Args:
+            name (str): Task class or network name.
+            kind (str): "Task", "DecisionTask", or "TaskNetwork".
+            start (float): ``perf_counter`` value when the rehearsal started.
+            clones (int, optional): Actors cloned. Defaults to 0.
+            events (int, optional): Events rehearsed. Defaults to 0.
+            cache_hit (bool, optional): If the result came from a cache. Defaults to False.
+        """
+        cost = self._costs.get((name, kind))
+        if cost is None:
+            cost = self._costs[(name, kind)] = _RehearsalCost()
+        cost.rehearsals += 1
+        cost.clones += clones
+        cost.events += events
+        cost.cache_hits += cache_hit
+        cost.wall_time += perf_counter() - start
+        if kind != "TaskNetwork":
+            self._task_events += events
+
+    def clear(self) -> None:
+        """Reset the totals."""
+        self._costs.clear()
+
+    def get_table(self, format: Literal["rows", "columns", "arrow"] = "rows") -> Any:
+        """Get the rehearsal costs as a table, like ``create_table``.
+
+        The columns are the name of the task class or network, the kind
+        ("Task", "DecisionTask", or "TaskNetwork"), the number of rehearsals,
+        cloned actors, rehearsed events, rehearsals served from a
+        ``RehearsalCache``, and the wall time in seconds.
+
+        Args:
+            format (str, optional): "rows" for a list of rows and the column names,
+                "columns" for a dictionary of columns, or "arrow" for a ``pyarrow.Table``.
+                Defaults to "rows".
+
+        Returns:
+            Any: The table.
+        """
+        rows = [
+            (
+                name,
+                kind,
+                cost.rehearsals,
+                cost.clones,
+                cost.events,
+                cost.cache_hits,
+                cost.wall_time,
+            )
+            for (name, kind), cost in self._costs.items()
+        ]
+        if format == "rows":
+            return rows, list(PROFILE_COLUMNS)
+        data = {col: [row[i] for row in rows] for i, col in enumerate(PROFILE_COLUMNS)}
+        if format == "columns":
+            return data
+        if format == "arrow":
+            from .data_utils.data_utils import _to_arrow
+
+            return _to_arrow(data)
+        raise UpstageError(f"Unknown table format '{format}', expected rows, columns, or arrow")
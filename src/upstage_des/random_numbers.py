@@ -0,0 +1,374 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+
+"""Named, independently seeded random number streams and variates."""
+
+from collections.abc import Callable, Hashable, Sequence
+from hashlib import sha256
+from importlib import import_module
+from math import exp, sqrt
+from random import Random
+from typing import Any, TypeVar
+
+__all__ = ("RandomStreams", "Variates")
+
+T = TypeVar("T")
+
+# Size of a stream's first block of variates. Blocks double up to the block size.
+_FIRST_BLOCK = 16
+
+
+def _stream_key(stream: Any) -> tuple[Hashable, ...]:
+    """Make a random stream key from a key part or a tuple of key parts.
+
+    Args:
+        stream (Any): Key part, tuple of key parts, or None for no parts.
+
+    Returns:
+        tuple[Hashable, ...]: The key, with classes and entities named.
+    """
+    if stream is None:
+        return ()
+    parts = stream if isinstance(stream, tuple) else (stream,)
+    return tuple(_stream_key_part(part) for part in parts)
+
+
+def _stream_key_part(part: Any) -> Any:
+    """Name classes and entities in a random stream key.
+
+    Args:
+        part (Any): Part of a stream key.
+
+    Returns:
+        Any: The part, or the name that stands in for it.
+    """
+    if isinstance(part, str | int | float):
+        return part
+    if isinstance(part, type):
+        return part.__qualname__
+    from .base import NamedUpstageEntity
+
+    if isinstance(part, NamedUpstageEntity):
+        return getattr(part, "name", part)
+    return part
+
+
+def _release_keys(
+    keys_by_part: dict[Hashable, set[tuple[Hashable, ...]]], part: Hashable
+) -> set[tuple[Hashable, ...]]:
+    """Remove the stream keys that have a part from an index of keys by part.
+
+    Args:
+        keys_by_part (dict[Hashable, set[tuple[Hashable, ...]]]): The index.
+        part (Hashable): Part of a stream key.
+
+    Returns:
+        set[tuple[Hashable, ...]]: The removed keys.
+    """
+    released = keys_by_part.pop(_stream_key_part(part), set())
+    for key in released:
+        for other in key:
+            keys = keys_by_part.get(other)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del keys_by_part[other]
+    return released
+
+
+class RandomStreams:
+    """Random number generators for named streams, seeded from one base seed.
+
+    Each stream's seed is derived from the base seed and the stream's key, so a
+    stream gives the same draws no matter how many draws other streams make.
+    Giving each source of randomness its own stream keeps scenarios comparable
+    (common random numbers): a change that adds draws in one place doesn't shift
+    the draws everywhere else.
+
+    Example:
+        >>> streams = RandomStreams(seed=12)
+        >>> arrivals = streams.get("arrivals")
+        >>> service = streams.get("service", "Alice")
+        >>> arrivals.expovariate(2.0)
+
+    Each stream is kept until ``release`` is called with a part of its key.
+    ``Actor.retire`` releases the streams whose keys name the actor.
+    """
+
+    def __init__(
+        self,
+        seed: int | None = None,
+        factory: Callable[[int], Any] = Random,
+    ) -> None:
+        """Create the streams.
+
+        Args:
+            seed (int | None, optional): Base seed. Defaults to None, which picks a
+                random base seed, available on ``seed``.
+            factory (Callable[[int], Any], optional): Makes a generator from a seed.
+                Defaults to ``random.Random``.
+        """
+        self.seed: int = Random().getrandbits(64) if seed is None else seed
+        self._factory = factory
+        self._streams: dict[tuple[Hashable, ...], Any] = {}
+        self._keys_by_part: dict[Hashable, set[tuple[Hashable, ...]]] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return _stream_key(key) in self._streams
+
+    def seed_for(self, *key: Hashable) -> int:
+        """Get the seed of a stream.
+
+        The seed comes from the ``repr`` of the key, so keys should be made of
+        strings, numbers, and tuples of them. Classes in the key are named by
+        their qualified name, and named entities (such as actors) by their name.
+
+        Args:
+            *key (Hashable): The parts of the stream's key.
+
+        Returns:
+            int: The 64 bit seed.
+        """
+        digest = sha256(f"{self.seed}:{_stream_key(key)!r}".encode()).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    def get(self, *key: Hashable) -> Any:
+        """Get a stream's generator, making it on first use.
+
+        Args:
+            *key (Hashable): The parts of the stream's key.
+
+        Returns:
+            Any: The generator, a ``random.Random`` unless another factory was given.
+        """
+        key = _stream_key(key)
+        rng = self._streams.get(key)
+        if rng is None:
+            rng = self._streams[key] = self._factory(self.seed_for(*key))
+            for part in key:
+                self._keys_by_part.setdefault(part, set()).add(key)
+        return rng
+
+    def release(self, part: Hashable) -> None:
+        """Drop every stream whose key has a part.
+
+        A released stream starts over from its seed if it is used again.
+
+        Args:
+            part (Hashable): Part of a stream key, such as an actor.
+        """
+        for key in _release_keys(self._keys_by_part, part):
+            del self._streams[key]
+
+
+class Variates:
+    """Serve random variates from blocks drawn ahead of time.
+
+    Standard uniform, exponential, and normal values are drawn in blocks for
+    each stream key, and each distribution is made from them. A key's first
+    block is small, and each block after is twice the size, up to
+    ``block_size``, so keys that are only used a few times stay cheap. With
+    NumPy generators, drawing in blocks cuts the cost per draw. Streams are
+    seeded from the ``RandomStreams`` they are made with, so they are
+    independent of each other and of ``stage.random``.
+
+    Each key's generator and blocks are kept until ``release`` is called with
+    a part of the key. ``Actor.retire`` releases the keys that name the actor.
+
+    Without NumPy, blocks are drawn with ``random.Random``, which is no faster
+    than drawing one value at a time. The two give different values for the
+    same seed.
+
+    Example:
+        >>> variates = Variates(RandomStreams(seed=12), use_numpy=True)
+        >>> service_time = variates.exponential(4.0, ("service",))
+    """
+
+    def __init__(
+        self,
+        streams: RandomStreams,
+        block_size: int = 1024,
+        use_numpy: bool = False,
+    ) -> None:
+        """Create the variate service.
+
+        Args:
+            streams (RandomStreams): Streams to seed the generators from.
+            block_size (int, optional): Number of values to draw at once. Defaults to 1024.
+            use_numpy (bool, optional): Draw blocks with ``numpy.random.Generator``.
+                Requires NumPy. Defaults to False.
+        """
+        self.block_size = block_size
+        self._streams = streams
+        self._numpy: Any = None
+        if use_numpy:
+            try:
+                self._numpy = import_module("numpy")
+            except ImportError:
+                from .base import UpstageError
+
+                raise UpstageError("NumPy variates require numpy to be installed.")
+        self._generators: dict[tuple[Hashable, ...], Any] = {}
+        self._blocks: dict[tuple[str, tuple[Hashable, ...]], list[float]] = {}
+        self._block_sizes: dict[tuple[str, tuple[Hashable, ...]], int] = {}
+        self._keys_by_part: dict[Hashable, set[tuple[Hashable, ...]]] = {}
+
+    def _generator(self, key: tuple[Hashable, ...]) -> Any:
+        gen = self._generators.get(key)
+        if gen is None:
+            seed = self._streams.seed_for("variates", *key)
+            if self._numpy is None:
+                gen = Random(seed)
+            else:
+                gen = self._numpy.random.default_rng(seed)
+            self._generators[key] = gen
+            for part in key:
+                self._keys_by_part.setdefault(part, set()).add(key)
+        return gen
+
+    def release(self, part: Hashable) -> None:
+        """Drop the generators and blocks of every stream key that has a part.
+
+        A released key starts over from its seed if it is used again.
+
+        Args:
+            part (Hashable): Part of a stream key, such as an actor.
+        """
+        for key in _release_keys(self._keys_by_part, part):
+            del self._generators[key]
+            for kind in ("uniform", "exponential", "normal"):
+                self._blocks.pop((kind, key), None)
+                self._block_sizes.pop((kind, key), None)
+
+    def _draw_block(self, kind: str, key: tuple[Hashable, ...]) -> list[float]:
+        """Draw a block of standard values, reversed so they pop off in order.
+
+        Args:
+            kind (str): "uniform", "exponential", or "normal".
+            key (tuple[Hashable, ...]): Stream key.
+
+        Returns:
+            list[float]: The values.
+        """
+        gen = self._generator(key)
+        size = self._block_sizes.get((kind, key), min(_FIRST_BLOCK, self.block_size))
+        self._block_sizes[(kind, key)] = min(2 * size, self.block_size)
+        values: list[float]
+        if self._numpy is not None:
+            if kind == "uniform":
+                values = gen.random(size).tolist()
+            elif kind == "exponential":
+                values = gen.standard_exponential(size).tolist()
+            else:
+                values = gen.standard_normal(size).tolist()
+        elif kind == "uniform":
+            values = [gen.random() for _ in range(size)]
+        elif kind == "exponential":
+            values = [gen.expovariate(1.0) for _ in range(size)]
+        else:
+            values = [gen.gauss(0.0, 1.0) for _ in range(size)]
+        values.reverse()
+        return values
+
+    def _next(self, kind: str, key: tuple[Hashable, ...]) -> float:
+        block = self._blocks.get((kind, key))
+        if not block:
+            block = self._blocks[(kind, key)] = self._draw_block(kind, key)
+        return block.pop()
+
+    def uniform(self, low: float, high: float, key: Hashable = ()) -> float:
+        """Draw from a uniform distribution.
+
+        Args:
+            low (float): Lower bound.
+            high (float): Upper bound.
+            key (Hashable, optional): Stream key part, or tuple of key parts.
+                Defaults to ().
+
+        Returns:
+            float: The value.
+        """
+        return low + (high - low) * self._next("uniform", _stream_key(key))
+
+    def exponential(self, mean: float, key: Hashable = ()) -> float:
+        """Draw from an exponential distribution.
+
+        Args:
+            mean (float): The mean (one over the rate).
+            key (Hashable, optional): Stream key part, or tuple of key parts.
+                Defaults to ().
+
+        Returns:
+            float: The value.
+        """
+        return mean * self._next("exponential", _stream_key(key))
+
+    def normal(self, mu: float, sigma: float, key: Hashable = ()) -> float:
+        """Draw from a normal distribution.
+
+        Args:
+            mu (float): The mean.
+            sigma (float): The standard deviation.
+            key (Hashable, optional): Stream key part, or tuple of key parts.
+                Defaults to ().
+
+        Returns:
+            float: The value.
+        """
+        return mu + sigma * self._next("normal", _stream_key(key))
+
+    def lognormal(self, mu: float, sigma: float, key: Hashable = ()) -> float:
+        """Draw from a lognormal distribution.
+
+        Args:
+            mu (float): Mean of the underlying normal distribution.
+            sigma (float): Standard deviation of the underlying normal distribution.
+            key (Hashable, optional): Stream key part, or tuple of key parts.
+                Defaults to ().
+
+        Returns:
+            float: The value.
+        """
+        return exp(mu + sigma * self._next("normal", _stream_key(key)))
+
+    def triangular(self, low: float, high: float, mode: float, key: Hashable = ()) -> float:
+        """Draw from a triangular distribution.
+
+        Args:
+            low (float): Lower bound.
+            high (float): Upper bound.
+            mode (float): Most likely value.
+            key (Hashable, optional): Stream key part, or tuple of key parts.
+                Defaults to ().
+
+        Returns:
+            float: The value.
+        """
+        if not low <= mode <= high:
+            raise ValueError(f"Triangular mode {mode} must be between {low} and {high}")
+        u = self._next("uniform", _stream_key(key))
+        width = high - low
+        if width == 0:
+            return low
+        if u < (mode - low) / width:
+            return low + sqrt(u * width * (mode - low))
+        return high - sqrt((1 - u) * width * (high - mode))
+
+    def empirical(self, values: Sequence[T], key: Hashable = ()) -> T:
+        """Pick one of the given values, each equally likely.
+
+        Repeat a value in the sequence to make it more likely.
+
+        Args:
+            values (Sequence[T]): Observed values.
+            key (Hashable, optional): Stream key part, or tuple of key parts.
+                Defaults to ().
+
+        Returns:
+            T: One of the values.
+        """
+        if not values:
+            raise ValueError("Empirical draws need at least one value")
+        return values[int(self._next("uniform", _stream_key(key)) * len(values))]
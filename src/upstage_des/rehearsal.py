@@ -0,0 +1,588 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+"""Tools for rehearsing actors on many plans."""
+
+import pickle
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from copy import copy
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar, overload
+from warnings import warn
+
+from simpy import Container, Store
+
+from .base import STAGE_CONTEXT_VAR, EnvironmentContext, UpstageError
+from .states import ResourceState, _KeyValueBase
+from .task_network import TaskLinks, TaskNetwork
+
+if TYPE_CHECKING:
+    from .actor import Actor
+    from .task import Task
+
+__all__ = ("rehearse_many", "RehearsalResult", "RehearsalCache")
+
+T = TypeVar("T")
+A = TypeVar("A", bound="Actor")
+
+
+@dataclass
+class RehearsalResult:
+    """The outcome of rehearsing one plan.
+
+    Resource states are given as their items (stores) or level (containers).
+    """
+
+    time: float
+    states: dict[str, Any]
+
+
+def _rehearsal_result(understudy: "Actor") -> RehearsalResult:
+    """Summarize a rehearsed actor with its states and the rehearsal end time.
+
+    This is the default summary for ``rehearse_many``.
+
+    Args:
+        understudy (Actor): The actor returned from a rehearsal.
+
+    Returns:
+        RehearsalResult: The time and state values.
+    """
+    states: dict[str, Any] = {}
+    for name, state in understudy._state_defs.items():
+        if isinstance(state, _KeyValueBase):
+            states[name] = state._make_clone(understudy)
+            continue
+        value = getattr(understudy, name)
+        if isinstance(value, Store):
+            value = list(value.items)
+        elif isinstance(value, Container):
+            value = value.level
+        states[name] = copy(value)
+    return RehearsalResult(time=understudy.env.now, states=states)
+
+
+@dataclass
+class _RehearsalPayload:
+    """Everything needed to rebuild an actor for rehearsal in another process."""
+
+    actor_class: type["Actor"]
+    name: str
+    now: float
+    network_name: str
+    task_classes: dict[str, type["Task"]]
+    task_links: dict[str, TaskLinks]
+    states: dict[str, Any] = field(default_factory=dict)
+    no_init_states: dict[str, Any] = field(default_factory=dict)
+    contents: dict[str, Any] = field(default_factory=dict)
+    knowledge: dict[str, Any] = field(default_factory=dict)
+    task_queue: list[str] = field(default_factory=list)
+    stage: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def snapshot(cls, actor: "Actor", network_name: str) -> "_RehearsalPayload":
+        """Record an actor's current states, knowledge, and network.
+
+        Args:
+            actor (Actor): The actor to rehearse.
+            network_name (str): The network to rehearse on.
+
+        Returns:
+            _RehearsalPayload: The snapshot.
+        """
+        network = actor._task_networks[network_name]
+        payload = cls(
+            actor_class=type(actor),
+            name=actor.name,
+            now=actor.env.now,
+            network_name=network_name,
+            task_classes=dict(network.task_classes),
+            task_links=dict(network.task_links),
+            knowledge={k: copy(v) for k, v in actor._knowledge.items()},
+            task_queue=list(actor._task_queue.get(network_name, [])),
+        )
+        for name, state in actor._state_defs.items():
+            if isinstance(state, ResourceState):
+                resource = getattr(actor, name)
+                memory = actor.__dict__.get(f"_memory_for_{name}", {})
+                payload.states[name] = {"kind": type(resource), **memory}
+                if isinstance(resource, Store):
+                    payload.contents[name] = list(resource.items)
+                elif isinstance(resource, Container):
+                    payload.contents[name] = resource.level
+                continue
+            if isinstance(state, _KeyValueBase):
+                value = state._make_clone(actor)
+            else:
+                value = copy(getattr(actor, name))
+            if state._no_init:
+                payload.no_init_states[name] = value
+            else:
+                payload.states[name] = value
+        # Only stage variables that can be sent to another process.
+        for key, value in STAGE_CONTEXT_VAR.get().items():
+            try:
+                pickle.dumps(value)
+            except Exception:
+                continue
+            payload.stage[key] = value
+        return payload
+
+    def build(self) -> "Actor":
+        """Make the actor in the current environment context.
+
+        Returns:
+            Actor: The rebuilt actor, with its task network.
+        """
+        STAGE_CONTEXT_VAR.get().update(self.stage)
+        actor = self.actor_class(name=self.name, debug_log=False, **self.states)
+        actor.__dict__.update(self.no_init_states)
+        for name, contents in self.contents.items():
+            resource = getattr(actor, name)
+            if isinstance(resource, Store):
+                resource.items = list(contents)
+            else:
+                resource._level = contents
+        actor._knowledge.update(self.knowledge)
+        if self.task_queue:
+            actor._task_queue[self.network_name] = list(self.task_queue)
+        network = TaskNetwork(self.network_name, self.task_classes, self.task_links)
+        actor.add_task_network(network)
+        return actor
+
+
+_MISSING = object()
+
+
+def _fingerprint(value: Any) -> Hashable:
+    """Make a hashable stand-in for a state or knowledge value.
+
+    Args:
+        value (Any): The value
+
+    Returns:
+        Hashable: The value, or a tuple/frozenset made from its contents.
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _fingerprint(v)) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_fingerprint(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    hashable: Hashable = value
+    hash(hashable)
+    return hashable
+
+
+def _state_values(actor: "Actor") -> dict[str, Any]:
+    """Copy an actor's state values, except for resources.
+
+    Args:
+        actor (Actor): The actor
+
+    Returns:
+        dict[str, Any]: State names and values.
+    """
+    values: dict[str, Any] = {}
+    for name, state in actor._state_defs.items():
+        if isinstance(state, ResourceState):
+            continue
+        if isinstance(state, _KeyValueBase):
+            values[name] = state._make_clone(actor)
+        else:
+            values[name] = copy(getattr(actor, name))
+    return values
+
+
+def _same(first: Any, second: Any) -> bool:
+    try:
+        return bool(first == second)
+    except Exception:
+        return False
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+@dataclass
+class _RehearsalStart:
+    """An understudy's states and knowledge before it rehearses."""
+
+    now: float
+    states: dict[str, Any]
+    knowledge: dict[str, Any]
+    task_queue: dict[str, list[str]]
+
+
+@dataclass
+class _CachedRehearsal:
+    """The changes a rehearsal made to an understudy."""
+
+    elapsed: float
+    states: dict[str, Any]
+    deltas: dict[str, int | float]
+    knowledge: dict[str, Any]
+    cleared: tuple[str, ...]
+    task_queue: dict[str, list[str]] | None
+
+
+class RehearsalCache:
+    """Reuse the results of rehearsals from matching actor states.
+
+    A rehearsal is looked up by the task (or task network path) rehearsed, the
+    actor's class, and the values of the states and knowledge named when making
+    the cache. Network rehearsals with an ``end_task`` are also looked up by the
+    actor's task queue for the network, which picks the tasks after the path.
+    Matching rehearsals skip running the tasks, and the understudy is given the
+    state and knowledge changes and elapsed time of the first one.
+
+    Only declare a cache for rehearsals that depend on nothing but the named
+    states and knowledge. Resource states aren't cached, since rehearsal doesn't
+    change them, and the named values must be hashable or made of dictionaries,
+    lists, tuples, and sets of hashable values.
+
+    Named states are given the value the first rehearsal ended with. Other
+    numeric states are given the same change (e.g. ``trips + 1``), since their
+    starting values may differ. Rehearsals that change other states that
+    aren't numbers aren't stored, since their result may not apply to the
+    next match.
+
+    Example:
+        >>> cache = UP.RehearsalCache(states=["fuel"], knowledge=["destination"])
+        >>> for plane in planes:
+        >>>     understudy = plane.rehearse_network("flight", ["Fly", "Land"], cache=cache)
+        >>> print(cache.hits, cache.misses, cache.hit_rate)
+    """
+
+    def __init__(
+        self,
+        states: Iterable[str] = (),
+        knowledge: Iterable[str] = (),
+        max_size: int | None = 1024,
+    ) -> None:
+        """Create a rehearsal cache.
+
+        Args:
+            states (Iterable[str], optional): State names that rehearsals depend on.
+                Defaults to ().
+            knowledge (Iterable[str], optional): Knowledge names that rehearsals
+                depend on. Defaults to ().
+            max_size (int | None, optional): Number of results to keep, dropping the least
+                recently used. Defaults to 1024. None keeps all results.
+        """
+        self.states = tuple(states)
+        self.knowledge = tuple(knowledge)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results: OrderedDict[Hashable, _CachedRehearsal] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that reused a rehearsal.
+
+        Returns:
+            float: Hits over lookups, or 0.0 before any lookups.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Remove the stored results and reset the counters."""
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _key(self, actor: "Actor", plan: tuple[Any, ...], knowledge: dict[str, Any]) -> Hashable:
+        """Fingerprint a rehearsal.
+
+        Args:
+            actor (Actor): The actor that will be cloned for the rehearsal.
+            plan (tuple[Any, ...]): What is being rehearsed.
+            knowledge (dict[str, Any]): Knowledge given to the understudy.
+
+        Returns:
+            Hashable: The cache key.
+        """
+        try:
+            rehearsed = _fingerprint(plan)
+            states = tuple(_fingerprint(getattr(actor, name)) for name in self.states)
+            known = tuple(
+                _fingerprint(knowledge.get(name, actor._knowledge.get(name, _MISSING)))
+                for name in self.knowledge
+            )
+        except TypeError as e:
+            raise UpstageError(f"Rehearsal cache values on {actor} must be hashable: {e}")
+        return (type(actor), rehearsed, states, known)
+
+    def _lookup(self, key: Hashable) -> _CachedRehearsal | None:
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._results.move_to_end(key)
+        return result
+
+    def _start(self, understudy: "Actor") -> _RehearsalStart:
+        return _RehearsalStart(
+            now=understudy.env.now,
+            states=_state_values(understudy),
+            knowledge={k: copy(v) for k, v in understudy._knowledge.items()},
+            task_queue={k: list(v) for k, v in understudy._task_queue.items()},
+        )
+
+    def _store(self, key: Hashable, start: _RehearsalStart, understudy: "Actor") -> None:
+        """Record the changes a rehearsal made.
+
+        Args:
+            key (Hashable): The cache key.
+            start (_RehearsalStart): The understudy before rehearsing.
+            understudy (Actor): The understudy after rehearsing.
+        """
+        states: dict[str, Any] = {}
+        deltas: dict[str, int | float] = {}
+        for name, value in _state_values(understudy).items():
+            first = start.states[name]
+            if _same(value, first):
+                continue
+            if name in self.states:
+                states[name] = value
+            elif _is_number(value) and _is_number(first):
+                deltas[name] = value - first
+            else:
+                # The change can't be made relative to another actor's value.
+                return
+        knowledge = {
+            name: copy(value)
+            for name, value in understudy._knowledge.items()
+            if name not in start.knowledge or not _same(value, start.knowledge[name])
+        }
+        cleared = tuple(name for name in start.knowledge if name not in understudy._knowledge)
+        task_queue = None
+        if understudy._task_queue != start.task_queue:
+            task_queue = {k: list(v) for k, v in understudy._task_queue.items()}
+        self._results[key] = _CachedRehearsal(
+            elapsed=understudy.env.now - start.now,
+            states=states,
+            deltas=deltas,
+            knowledge=knowledge,
+            cleared=cleared,
+            task_queue=task_queue,
+        )
+        if self.max_size is not None and len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+            self.evictions += 1
+
+    def _apply(self, result: _CachedRehearsal, understudy: "Actor") -> None:
+        """Give an understudy the changes from a stored rehearsal.
+
+        Args:
+            result (_CachedRehearsal): The stored rehearsal.
+            understudy (Actor): The understudy, which hasn't rehearsed.
+        """
+        for name, value in result.states.items():
+            setattr(understudy, name, copy(value))
+        for name, delta in result.deltas.items():
+            setattr(understudy, name, getattr(understudy, name) + delta)
+        for name in result.cleared:
+            understudy._knowledge.pop(name, None)
+        for name, value in result.knowledge.items():
+            understudy._knowledge[name] = copy(value)
+        if result.task_queue is not None:
+            understudy._task_queue = {k: list(v) for k, v in result.task_queue.items()}
+        understudy.env.now += result.elapsed  # type: ignore [misc]
+
+
+# The payload in a worker process, set once when the worker starts.
+_WORKER_PAYLOAD: dict[str, _RehearsalPayload] = {}
+
+
+@dataclass
+class _Unsendable:
+    """Stands in for a worker result that can't be pickled."""
+
+    reason: str
+
+
+def _start_worker(data: bytes) -> None:
+    _WORKER_PAYLOAD["payload"] = pickle.loads(data)
+
+
+def _rehearse_in_worker(
+    plan: list[str],
+    knowledge: dict[str, Any] | None,
+    end_task: str | None,
+    summary: Callable[[Any], Any],
+) -> Any:
+    payload = _WORKER_PAYLOAD["payload"]
+    with EnvironmentContext(initial_time=payload.now):
+        actor = payload.build()
+        understudy = actor.rehearse_network(
+            payload.network_name, plan, knowledge=knowledge, end_task=end_task
+        )
+        result = summary(understudy)
+    try:
+        pickle.dumps(result)
+    except Exception as e:
+        return _Unsendable(f"{type(e).__name__}: {e}")
+    return result
+
+
+@overload
+def rehearse_many(
+    actor: A,
+    plans: Sequence[list[str]],
+    *,
+    network_name: str | None = None,
+    knowledge: dict[str, Any] | None = None,
+    end_task: str | None = None,
+    summary: None = None,
+    workers: int | None = None,
+) -> list[RehearsalResult]: ...
+
+
+@overload
+def rehearse_many(
+    actor: A,
+    plans: Sequence[list[str]],
+    *,
+    network_name: str | None = None,
+    knowledge: dict[str, Any] | None = None,
+    end_task: str | None = None,
+    summary: Callable[[A], T],
+    workers: int | None = None,
+) -> list[T]: ...
+
+
+def rehearse_many(
+    actor: A,
+    plans: Sequence[list[str]],
+    *,
+    network_name: str | None = None,
+    knowledge: dict[str, Any] | None = None,
+    end_task: str | None = None,
+    summary: Callable[[A], Any] | None = None,
+    workers: int | None = None,
+) -> list[Any]:
+    """Rehearse many task plans for an actor, optionally in parallel.
+
+    Each plan is a list of task names to rehearse on the actor's task network,
+    as given to ``Actor.rehearse_network``. The summary function is called on
+    each rehearsed actor, and the summaries are returned in plan order.
+
+    With more than one worker, the actor is snapshotted once and the plans
+    are rehearsed in a pool of processes. The actor's class, tasks, state
+    values, knowledge, the summary function, and its results must be
+    picklable, and tasks only see stage variables that are. If they aren't,
+    or the pool can't be started, the plans are rehearsed in this process
+    instead.
+
+    Example:
+        >>> def fuel_left(plane: Plane) -> float:
+        >>>     return plane.fuel
+        >>>
+        >>> fuel = rehearse_many(
+        >>>     plane,
+        >>>     [["Fly", "Land"], ["Fly", "Loiter", "Land"]],
+        >>>     summary=fuel_left,
+        >>>     workers=4,
+        >>> )
+
+    Args:
+        actor (Actor): The actor to rehearse.
+        plans (Sequence[list[str]]): Task name lists to rehearse.
+        network_name (str, optional): The task network to rehearse on. Defaults to
+            None, which uses the actor's only network.
+        knowledge (dict[str, Any], optional): Knowledge to give the rehearsing
+            actors. Defaults to None.
+        end_task (str, optional): A task to end each rehearsal on. Defaults to None.
+        summary (Callable[[Actor], T], optional): Makes the result for a rehearsed
+            actor. Defaults to None, which gives a ``RehearsalResult``.
+        workers (int, optional): Number of processes to use. Defaults to None,
+            which rehearses in this process.
+
+    Returns:
+        list[T] | list[RehearsalResult]: The summaries, in the order of the plans.
+    """
+    if summary is None:
+        summary = _rehearsal_result
+    if network_name is None:
+        if len(actor._task_networks) != 1:
+            raise UpstageError(
+                f"{actor} has {len(actor._task_networks)} task networks, give a network_name."
+            )
+        network_name = next(iter(actor._task_networks))
+    elif network_name not in actor._task_networks:
+        raise UpstageError(f"{actor} has no task network named {network_name}")
+
+    if workers is not None and workers > 1 and len(plans) > 1:
+        results = _rehearse_in_pool(
+            actor, plans, network_name, knowledge, end_task, summary, workers
+        )
+        if results is not None:
+            return results
+
+    return [
+        summary(
+            actor.rehearse_network(network_name, list(plan), knowledge=knowledge, end_task=end_task)
+        )
+        for plan in plans
+    ]
+
+
+def _rehearse_in_pool(
+    actor: A,
+    plans: Sequence[list[str]],
+    network_name: str,
+    knowledge: dict[str, Any] | None,
+    end_task: str | None,
+    summary: Callable[[A], Any],
+    workers: int,
+) -> list[Any] | None:
+    """Rehearse plans in a process pool.
+
+    Returns:
+        list[Any] | None: The summaries, or None if the rehearsal can't be sent to
+            other processes.
+    """
+    try:
+        data = pickle.dumps(_RehearsalPayload.snapshot(actor, network_name))
+        pickle.dumps((knowledge, summary))
+    except Exception as e:
+        warn(f"Rehearsing {actor} in this process, it can't be sent to workers: {e}")
+        return None
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_start_worker, initargs=(data,)
+        ) as pool:
+            futures = [
+                pool.submit(_rehearse_in_worker, list(plan), knowledge, end_task, summary)
+                for plan in plans
+            ]
+            results = []
+            for future in futures:
+                result = future.result()
+                if isinstance(result, _Unsendable):
+                    pool.shutdown(cancel_futures=True)
+                    warn(
+                        f"Rehearsing {actor} in this process, a worker result can't be "
+                        f"sent back: {result.reason}"
+                    )
+                    return None
+                results.append(result)
+            return results
+    except (BrokenProcessPool, NotImplementedError, OSError) as e:
+        warn(f"Rehearsing {actor} in this process, the worker pool failed: {e}")
+        return None
@@ -11,11 +11,12 @@ from simpy import Container, Environment, Event, FilterStore, Store
 from simpy.resources.container import ContainerGet, ContainerPut
 from simpy.resources.store import FilterStoreGet, StoreGet, StorePut
 
-from upstage_des.base import SPECIAL_ENTITY_CONTEXT_VAR, NamedUpstageEntity
+from upstage_des.base import SPECIAL_ENTITY_CONTEXT_VAR, NamedUpstageEntity, UpstageError
 
 from .container import ContinuousContainer
 from .reserve import ReserveContainer
 from .sorted import SortedFilterStore, _SortedFilterStoreGet
+from .statistics import StatisticsSummary, TimeWeightedStatistics
 
 __all__ = (
     "SelfMonitoringStore",
@@ -36,16 +37,118 @@ class MonitoringMixin(NamedUpstageEntity, skip_classname=True):
 
     name: str | None
     _quantities: list[tuple[float, Any]]
+    _last_quantity: tuple[float, Any]
+    _statistics: TimeWeightedStatistics | None = None
+    _keep_history: bool = True
+    _history_interval: float | None = None
+    _history_window_end: float = float("-inf")
+    _pending_quantity: tuple[float, Any] | None = None
 
     def _add_special_group(self) -> None:
         """Add self the the monitored context group.
 
         Called by the NamedUpstageEntity on group inits.
         """
-        ans = SPECIAL_ENTITY_CONTEXT_VAR.get().monitored
-        if self in ans:
+        SPECIAL_ENTITY_CONTEXT_VAR.get().monitored.add(self)
+
+    def _remove_special_group(self) -> None:
+        """Remove self from the monitored context group."""
+        SPECIAL_ENTITY_CONTEXT_VAR.get().monitored.discard(self)
+
+    def _start_monitoring(
+        self,
+        time: float,
+        value: Any,
+        statistics: bool = False,
+        keep_history: bool = True,
+        history_interval: float | None = None,
+        histogram_width: float | None = None,
+    ) -> None:
+        """Set up recording of the resource's level.
+
+        Args:
+            time (float): The current time.
+            value (Any): The starting level.
+            statistics (bool, optional): Keep time-weighted statistics. Defaults to False.
+            keep_history (bool, optional): Keep the level history in ``_quantities``.
+                Defaults to True.
+            history_interval (float | None, optional): Keep at most the first and latest
+                level per interval in the history. Defaults to None.
+            histogram_width (float | None, optional): Width of the statistics histogram
+                bins. Defaults to None.
+        """
+        if history_interval is not None and history_interval <= 0:
+            raise UpstageError(f"history_interval must be positive, got {history_interval}")
+        self._statistics = (
+            TimeWeightedStatistics(time, value, histogram_width=histogram_width)
+            if statistics
+            else None
+        )
+        self._keep_history = keep_history
+        self._history_interval = history_interval
+        self._last_quantity = (time, value)
+        self._pending_quantity = None
+        self._quantities = []
+        if keep_history:
+            self._quantities.append(self._last_quantity)
+            if history_interval is not None:
+                self._history_window_end = time + history_interval
+
+    def _add_quantity(self, time: float, value: Any) -> None:
+        """Record a new level of the resource.
+
+        Args:
+            time (float): The time of the level.
+            value (Any): The level.
+        """
+        reading = (time, value)
+        self._last_quantity = reading
+        if self._statistics is not None:
+            self._statistics.update(time, value)
+        if not self._keep_history:
             return
-        ans.append(self)
+        if self._history_interval is None:
+            self._quantities.append(reading)
+        elif time < self._history_window_end:
+            # Hold the latest reading of the window until the window closes.
+            self._pending_quantity = reading
+        else:
+            if self._pending_quantity is not None:
+                self._quantities.append(self._pending_quantity)
+                self._pending_quantity = None
+            self._quantities.append(reading)
+            self._history_window_end = time + self._history_interval
+
+    def _level_history(self) -> list[tuple[float, Any]]:
+        """Get the level history, including the latest level of an open window.
+
+        With ``history_interval``, ``_quantities`` holds the first reading of
+        each window and the last reading of each closed window. Entries are
+        only ever appended to it.
+
+        Returns:
+            list[tuple[float, Any]]: The history.
+        """
+        if self._pending_quantity is None:
+            return self._quantities
+        return [*self._quantities, self._pending_quantity]
+
+    @property
+    def statistics(self) -> TimeWeightedStatistics:
+        """The time-weighted statistics accumulator of the resource."""
+        if self._statistics is None:
+            raise UpstageError(f"Statistics are not turned on for {self}. Use statistics=True.")
+        return self._statistics
+
+    def get_statistics(self) -> StatisticsSummary:
+        """Get the time-weighted statistics of the level up to the current time.
+
+        Requires the resource to be made with ``statistics=True``.
+
+        Returns:
+            StatisticsSummary: The statistics.
+        """
+        return self.statistics.summary(self._env.now)  # type: ignore [attr-defined]
 
 
 class SelfMonitoringStore(
@@ -61,6 +164,10 @@ class SelfMonitoringStore(
         capacity: float | int = float("inf"),
         item_func: RECORDER_FUNC | None = None,
         name: str | None = None,
+        statistics: bool = False,
+        keep_history: bool = True,
+        history_interval: float | None = None,
+        histogram_width: float | None = None,
     ) -> None:
         """A monitoring version of the SimPy Store.
 
@@ -75,16 +182,31 @@ class SelfMonitoringStore(
                 Defaults to None.
             name (str, optional): The name of the store, if it doesn't exist as a state.
                 Defaults to None.
+            statistics (bool, optional): Keep time-weighted statistics of the recorded
+                level. Defaults to False.
+            keep_history (bool, optional): Keep the history of the recorded level in
+                ``_quantities``. Defaults to True.
+            history_interval (float | None, optional): Keep at most the first and latest
+                level in each interval of time in the history. Defaults to None.
+            histogram_width (float | None, optional): Width of the level bins for the
+                statistics histogram. Defaults to None, which makes a bin for every level.
         """
         super().__init__(env, capacity=capacity)
         self.name = name
         self.item_func = item_func if item_func is not None else len
-        self._quantities = [(self._env.now, self.item_func(self.items))]
+        self._start_monitoring(
+            self._env.now,
+            self.item_func(self.items),
+            statistics=statistics,
+            keep_history=keep_history,
+            history_interval=history_interval,
+            histogram_width=histogram_width,
+        )
 
     def _record(self, call: str) -> None:
         v = self.item_func(self.items)
-        if v != self._quantities[-1][1] or call == "environment":
-            self._quantities.append((self._env.now, v))
+        if v != self._last_quantity[1] or call == "environment":
+            self._add_quantity(self._env.now, v)
 
     def _trigger_put(self, event: Event) -> None:  # type: ignore [override]
         super()._trigger_put(event)
@@ -120,6 +242,10 @@ class SelfMonitoringFilterStore(
         capacity: float | int = float("inf"),
         item_func: RECORDER_FUNC | None = None,
         name: str | None = None,
+        statistics: bool = False,
+        keep_history: bool = True,
+        history_interval: float | None = None,
+        histogram_width: float | None = None,
     ) -> None:
         """A monitoring version of the SimPy FilterStore.
 
@@ -134,16 +260,31 @@ class SelfMonitoringFilterStore(
                 Defaults to None.
             name (str, optional): The name of the store, if it doesn't exist as a state.
                 Defaults to None.
+            statistics (bool, optional): Keep time-weighted statistics of the recorded
+                level. Defaults to False.
+            keep_history (bool, optional): Keep the history of the recorded level in
+                ``_quantities``. Defaults to True.
+            history_interval (float | None, optional): Keep at most the first and latest
+                level in each interval of time in the history. Defaults to None.
+            histogram_width (float | None, optional): Width of the level bins for the
+                statistics histogram. Defaults to None, which makes a bin for every level.
         """
         super().__init__(env, capacity=capacity)
         self.name = name
         self.item_func = item_func if item_func is not None else len
-        self._quantities = [(self._env.now, self.item_func(self.items))]
+        self._start_monitoring(
+            self._env.now,
+            self.item_func(self.items),
+            statistics=statistics,
+            keep_history=keep_history,
+            history_interval=history_interval,
+            histogram_width=histogram_width,
+        )
 
     def _record(self, call: str) -> None:
         v = self.item_func(self.items)
-        if v != self._quantities[-1][1] or call == "environment":
-            self._quantities.append((self._env.now, v))
+        if v != self._last_quantity[1] or call == "environment":
+            self._add_quantity(self._env.now, v)
 
     def _trigger_put(self, event: Event) -> None:  # type: ignore [override]
         super()._trigger_put(event)
@@ -178,6 +319,10 @@ class SelfMonitoringContainer(
         capacity: float = float("inf"),
         init: float = 0.0,
         name: str | None = None,
+        statistics: bool = False,
+        keep_history: bool = True,
+        history_interval: float | None = None,
+        histogram_width: float | None = None,
     ) -> None:
         """A monitoring version of a SimPy container.
 
@@ -187,15 +332,30 @@ class SelfMonitoringContainer(
             init (float, optional): Initial amount. Defaults to 0.0.
             name (str, optional): The name of the store, if it doesn't exist as a state.
                 Defaults to None.
+            statistics (bool, optional): Keep time-weighted statistics of the recorded
+                level. Defaults to False.
+            keep_history (bool, optional): Keep the history of the recorded level in
+                ``_quantities``. Defaults to True.
+            history_interval (float | None, optional): Keep at most the first and latest
+                level in each interval of time in the history. Defaults to None.
+            histogram_width (float | None, optional): Width of the level bins for the
+                statistics histogram. Defaults to None, which makes a bin for every level.
         """
         super().__init__(env, capacity=capacity, init=init)
         self.name = name
-        self._quantities: list[tuple[float, float]] = [(self._env.now, self._level)]
+        self._start_monitoring(
+            self._env.now,
+            self._level,
+            statistics=statistics,
+            keep_history=keep_history,
+            history_interval=history_interval,
+            histogram_width=histogram_width,
+        )
 
     def _record(self) -> None:
         reading = (self._env.now, self._level)
-        if reading != self._quantities[-1]:
-            self._quantities.append(reading)
+        if reading != self._last_quantity:
+            self._add_quantity(*reading)
 
     def _trigger_put(self, event: Event) -> None:  # type: ignore [override]
         super()._trigger_put(event)
@@ -233,6 +393,10 @@ class SelfMonitoringContinuousContainer(
         error_empty: bool = True,
         error_full: bool = True,
         name: str | None = None,
+        statistics: bool = False,
+        keep_history: bool = True,
+        history_interval: float | None = None,
+        histogram_width: float | None = None,
     ) -> None:
         """A monitoring version of the Continuous container.
 
@@ -246,10 +410,25 @@ class SelfMonitoringContinuousContainer(
             error_full (bool, optional): Error when it gets full. Defaults to True.
             name (str, optional): The name of the store, if it doesn't exist as a state.
                 Defaults to None.
+            statistics (bool, optional): Keep time-weighted statistics of the recorded
+                level. Defaults to False.
+            keep_history (bool, optional): Keep the history of the recorded level in
+                ``_quantities``. Defaults to True.
+            history_interval (float | None, optional): Keep at most the first and latest
+                level in each interval of time in the history. Defaults to None.
+            histogram_width (float | None, optional): Width of the level bins for the
+                statistics histogram. Defaults to None, which makes a bin for every level.
         """
         super().__init__(env, capacity, init, error_empty, error_full)
         self.name = name
-        self._quantities = [(self._env.now, self._level)]
+        self._start_monitoring(
+            self._env.now,
+            self._level,
+            statistics=statistics,
+            keep_history=keep_history,
+            history_interval=history_interval,
+            histogram_width=histogram_width,
+        )
 
     def _set_level(self) -> float:
         """Set the level of the container based on the active gets/puts.
@@ -259,8 +438,8 @@ class SelfMonitoringContinuousContainer(
         """
         amt = super()._set_level()
         now = self._env.now
-        if (now, amt) != self._quantities[-1]:
-            self._quantities.append((now, amt))
+        if (now, amt) != self._last_quantity:
+            self._add_quantity(now, amt)
         return amt
 
 
@@ -287,6 +466,10 @@ class SelfMonitoringReserveContainer(
         capacity: float = float("inf"),
         init: float = 0.0,
         name: str | None = None,
+        statistics: bool = False,
+        keep_history: bool = True,
+        history_interval: float | None = None,
+        histogram_width: float | None = None,
     ) -> None:
         """Create a store-like object that allows reservations, and records.
 
@@ -301,17 +484,32 @@ class SelfMonitoringReserveContainer(
             capacity (float, optional): Total capacity. Defaults to float("inf").
             name (str, optional): The name of the store, if it doesn't exist as a state.
                 Defaults to None.
+            statistics (bool, optional): Keep time-weighted statistics of the recorded
+                level. Defaults to False.
+            keep_history (bool, optional): Keep the history of the recorded level in
+                ``_quantities``. Defaults to True.
+            history_interval (float | None, optional): Keep at most the first and latest
+                level in each interval of time in the history. Defaults to None.
+            histogram_width (float | None, optional): Width of the level bins for the
+                statistics histogram. Defaults to None, which makes a bin for every level.
         """
         super().__init__(env, init, capacity)
         self.name = name
-        self._quantities = [(env.now, init)]
+        self._start_monitoring(
+            env.now,
+            init,
+            statistics=statistics,
+            keep_history=keep_history,
+            history_interval=history_interval,
+            histogram_width=histogram_width,
+        )
 
     def _record(self) -> None:
         """Record the level of the store."""
         now = self._env.now
         data = (now, self._real_level)
-        if data != self._quantities[-1]:
-            self._quantities.append(data)
+        if data != self._last_quantity:
+            self._add_quantity(*data)
 
     def take(self, requester: Any) -> float:
         """Take some amount from the store, by a requester.
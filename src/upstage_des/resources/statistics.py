@@ -0,0 +1,185 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+"""Online time-weighted statistics for monitored resources."""
+
+from dataclasses import dataclass, field
+from math import floor, sqrt
+from numbers import Real
+from typing import Any
+
+from upstage_des.base import UpstageError
+
+__all__ = ("TimeWeightedStatistics", "StatisticsSummary")
+
+
+@dataclass(frozen=True)
+class StatisticsSummary:
+    """Time-weighted statistics of a level at a point in time."""
+
+    time: float
+    elapsed: float
+    mean: float
+    variance: float
+    minimum: float
+    maximum: float
+    busy_fraction: float
+    changes: int
+    time_at_level: dict[float, float] = field(repr=False)
+
+    @property
+    def std(self) -> float:
+        """The time-weighted standard deviation."""
+        return sqrt(self.variance)
+
+    def percentile(self, q: float) -> float:
+        """The time-weighted percentile of the level.
+
+        This is the smallest level (or histogram bin start) that the resource
+        was at or below for at least ``q`` percent of the elapsed time.
+
+        Args:
+            q (float): Percentile, between 0 and 100.
+
+        Returns:
+            float: The level.
+        """
+        if not 0 <= q <= 100:
+            raise UpstageError(f"Percentile must be between 0 and 100, got {q}")
+        levels = sorted(self.time_at_level)
+        if not levels:
+            return self.maximum
+        target = self.elapsed * q / 100
+        total = 0.0
+        for level in levels:
+            total += self.time_at_level[level]
+            if total >= target:
+                return level
+        return levels[-1]
+
+
+class TimeWeightedStatistics:
+    """Accumulate time-weighted statistics of a level in constant memory.
+
+    Each level is weighted by how long it was held. The mean and variance are
+    kept with a weighted version of Welford's algorithm, and the time at each
+    level is kept in a histogram. If ``histogram_width`` is given, levels are
+    grouped into bins of that width (keyed by the bin's start), which keeps
+    the histogram small for continuously changing levels.
+
+    The level that is currently held counts up to the time the statistics
+    are queried.
+    """
+
+    def __init__(self, time: float, value: Any, histogram_width: float | None = None) -> None:
+        """Start accumulating statistics.
+
+        Args:
+            time (float): The starting time.
+            value (Any): The starting level. Must be a number.
+            histogram_width (float | None, optional): Width of the histogram bins.
+                Defaults to None, which keeps a bin for every level.
+        """
+        if histogram_width is not None and histogram_width <= 0:
+            raise UpstageError(f"histogram_width must be positive, got {histogram_width}")
+        self.histogram_width = histogram_width
+        self.start_time = time
+        self._check(value)
+        self._time = time
+        self._value = value
+        self._weight = 0.0
+        self._mean = 0.0
+        self._sum_squares = 0.0
+        self._busy = 0.0
+        self._minimum = value
+        self._maximum = value
+        self._changes = 0
+        self._histogram: dict[float, float] = {}
+
+    @staticmethod
+    def _check(value: Any) -> None:
+        if not isinstance(value, Real):
+            raise UpstageError(
+                f"Statistics need numeric levels, got {value!r}. "
+                "Use an item_func that returns a number, or turn off statistics."
+            )
+
+    def _bin(self, value: float) -> float:
+        if self.histogram_width is None:
+            return value
+        return floor(value / self.histogram_width) * self.histogram_width
+
+    @staticmethod
+    def _fold(
+        weight: float, mean: float, sum_squares: float, dt: float, value: float
+    ) -> tuple[float, float, float]:
+        """Add a held level to the running weighted mean and sum of squares."""
+        if dt <= 0:
+            return weight, mean, sum_squares
+        weight += dt
+        delta = value - mean
+        mean += delta * dt / weight
+        sum_squares += dt * delta * (value - mean)
+        return weight, mean, sum_squares
+
+    def update(self, time: float, value: Any) -> None:
+        """Record a change in the level.
+
+        Args:
+            time (float): The time of the change.
+            value (Any): The new level. Must be a number.
+        """
+        self._check(value)
+        dt = time - self._time
+        old = self._value
+        if dt > 0:
+            self._weight, self._mean, self._sum_squares = self._fold(
+                self._weight, self._mean, self._sum_squares, dt, old
+            )
+            key = self._bin(old)
+            self._histogram[key] = self._histogram.get(key, 0.0) + dt
+            if old > 0:
+                self._busy += dt
+        self._time = time
+        self._value = value
+        self._changes += 1
+        if value < self._minimum:
+            self._minimum = value
+        if value > self._maximum:
+            self._maximum = value
+
+    def summary(self, now: float) -> StatisticsSummary:
+        """Get the statistics up to a time.
+
+        Args:
+            now (float): The time to compute the statistics at.
+
+        Returns:
+            StatisticsSummary: The statistics.
+        """
+        dt = max(now - self._time, 0.0)
+        weight, mean, sum_squares = self._fold(
+            self._weight, self._mean, self._sum_squares, dt, self._value
+        )
+        histogram = dict(self._histogram)
+        busy = self._busy
+        if dt > 0:
+            key = self._bin(self._value)
+            histogram[key] = histogram.get(key, 0.0) + dt
+            if self._value > 0:
+                busy += dt
+        if weight <= 0:
+            # No time has passed, so the level is all there is.
+            mean = float(self._value)
+        return StatisticsSummary(
+            time=now,
+            elapsed=weight,
+            mean=mean,
+            variance=sum_squares / weight if weight > 0 else 0.0,
+            minimum=self._minimum,
+            maximum=self._maximum,
+            busy_fraction=busy / weight if weight > 0 else float(self._value > 0),
+            changes=self._changes,
+            time_at_level=histogram,
+        )
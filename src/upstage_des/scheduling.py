@@ -0,0 +1,120 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+
+"""Alternative event schedulers for the simulation environment."""
+
+from collections import deque
+from heapq import heappop, heappush
+
+from simpy import Environment as SimpyEnv
+from simpy.core import EmptySchedule, Infinity, SimTime, StopSimulation
+from simpy.events import NORMAL, Event, EventPriority
+
+__all__ = ("BucketedEnvironment",)
+
+
+class BucketedEnvironment(SimpyEnv):
+    """A SimPy environment that groups scheduled events by time.
+
+    SimPy keeps every scheduled event in one heap. This environment keeps a heap
+    of the distinct times of normal priority events, and a first-in first-out
+    queue of the events at each time. Urgent events, such as starting a process,
+    stay in SimPy's heap. Events run in the same order as with SimPy: by time,
+    then priority, then the order they were scheduled.
+
+    Events at a time that already has events are queued without touching the
+    heap, so models with many events at the same times (such as integer time
+    steps or batched arrivals) run faster. Models whose events are all at
+    different times run a little slower.
+
+    Use it with ``EnvironmentContext(scheduler=BucketedEnvironment)``.
+    """
+
+    def __init__(self, initial_time: SimTime = 0) -> None:
+        """Create the environment.
+
+        Args:
+            initial_time (SimTime, optional): Time to start the clock at. Defaults to 0.
+        """
+        super().__init__(initial_time)
+        self._times: list[SimTime] = []
+        self._buckets: dict[SimTime, Event | deque[Event]] = {}
+
+    def schedule(
+        self,
+        event: Event,
+        priority: EventPriority = NORMAL,
+        delay: SimTime = 0,
+    ) -> None:
+        """Schedule an *event* with a given *priority* and a *delay*.
+
+        Args:
+            event (Event): The event.
+            priority (EventPriority, optional): Priority. Defaults to NORMAL.
+            delay (SimTime, optional): Time from now. Defaults to 0.
+        """
+        at = self._now + delay
+        if priority != NORMAL:
+            heappush(self._queue, (at, priority, next(self._eid), event))
+            return
+        # A time with one event holds it directly; a deque is made for the second.
+        buckets = self._buckets
+        bucket = buckets.get(at)
+        if bucket is None:
+            buckets[at] = event
+            heappush(self._times, at)
+        elif isinstance(bucket, deque):
+            bucket.append(event)
+        else:
+            buckets[at] = deque((bucket, event))
+
+    def peek(self) -> SimTime:
+        """Get the time of the next scheduled event.
+
+        Returns:
+            SimTime: The time, or ``Infinity`` if no events are scheduled.
+        """
+        if self._queue:
+            return min(self._queue[0][0], self._times[0]) if self._times else self._queue[0][0]
+        return self._times[0] if self._times else Infinity
+
+    def step(self) -> None:
+        """Process the next event.
+
+        Raise an ``EmptySchedule`` if no further events are available.
+        """
+        times = self._times
+        queue = self._queue
+        if queue and (not times or queue[0][0] <= times[0]):
+            self._now, _, _, event = heappop(queue)
+        elif times:
+            at = times[0]
+            bucket = self._buckets[at]
+            if isinstance(bucket, deque):
+                event = bucket.popleft()
+                if not bucket:
+                    heappop(times)
+                    del self._buckets[at]
+            else:
+                event = bucket
+                heappop(times)
+                del self._buckets[at]
+            self._now = at
+        else:
+            raise EmptySchedule
+
+        # The rest matches simpy.Environment.step.
+        callbacks, event.callbacks = event.callbacks, None  # type: ignore[assignment]
+        try:
+            for callback in callbacks:
+                callback(event)
+        except StopSimulation:
+            event.callbacks = callbacks[callbacks.index(callback) + 1 :]
+            self.schedule(event, EventPriority(-1))
+            raise
+        if not event._ok and not hasattr(event, "_defused"):
+            exc = type(event._value)(*event._value.args)
+            exc.__cause__ = event._value
+            raise exc
@@ -42,6 +42,9 @@ ST = TypeVar("ST")
 
 RECORD_FUNC = Callable[[float, ST], Any]
 
+# Values of these types are recorded without a deepcopy.
+_ATOMIC_TYPES = frozenset({int, float, bool, str, bytes, complex, type(None)})
+
 
 @runtime_checkable
 class RecordClass(Protocol):
@@ -149,17 +152,11 @@ class State(Generic[ST]):
         self._frozen = frozen
         self._recording = recording
         self._record_duplicates = record_duplicates
-        self._change_callbacks: dict[Any, CALLBACK_FUNC] = {}
         self._allow_none_default = allow_none_default
-        self._recording_functions: list[tuple[RECORD_FUNC, str]] = []
+        # Recording classes are made per actor when first used.
+        self._recording_functions: list[tuple[RECORD_FUNC | type, str]] = []
         if recording_functions is not None:
-            for thing, name in recording_functions:
-                if isinstance(thing, type):
-                    use = thing()
-                    assert isinstance(use, RecordClass)
-                    self._recording_functions.append((use, name))
-                else:
-                    self._recording_functions.append((thing, name))
+            self._recording_functions.extend(recording_functions)
 
         self._types: tuple[type, ...]
 
@@ -170,10 +167,32 @@ class State(Generic[ST]):
         else:
             self._types = valid_types
         self.IGNORE_LOCK: bool = False
+        # Decided once here so setting the state only checks what it uses.
+        self._check_on_set = self._frozen or bool(self._types)
+
+    def _get_recorder(self, instance: "Actor", func: RECORD_FUNC | type, name: str) -> RECORD_FUNC:
+        """Get the recording function, making the actor's own instance of a recording class.
+
+        Args:
+            instance (Actor): The actor holding the state
+            func (RECORD_FUNC | type): The recording function or class
+            name (str): The name the function records to
+
+        Returns:
+            RECORD_FUNC: The recording function
+        """
+        if not isinstance(func, type):
+            return func
+        recorder = instance._state_recorders.get(name)
+        if recorder is None:
+            recorder = func()
+            assert isinstance(recorder, RecordClass)
+            instance._state_recorders[name] = recorder
+        return recorder
 
     def _do_record_funcs(self, instance: "Actor", now: float, value: ST) -> None:
         for func, name in self._recording_functions:
-            result = func(now, value)
+            result = self._get_recorder(instance, func, name)(now, value)
             new_append = (now, result)
             if name not in instance._state_histories:
                 instance._state_histories[name] = [new_append]
@@ -192,13 +211,14 @@ class State(Generic[ST]):
         """
         if not self._recording:
             return
-        if getattr(instance, "env", None) is None:
+        env = getattr(instance, "env", None)
+        if env is None:
             raise SimulationError(
                 f"Actor {instance} does not have an `env` attribute for state {self.name}"
             )
-        now = float(instance.env.now)
+        now = float(env.now)
         use = value if override is None else override
-        to_append = (now, deepcopy(use))
+        to_append = (now, use if type(use) in _ATOMIC_TYPES else deepcopy(use))
         if self.name not in instance._state_histories:
             instance._state_histories[self.name] = [to_append]
         elif self._record_duplicates or not _compare(
@@ -215,8 +235,10 @@ class State(Generic[ST]):
             instance (Actor): The actor holding the state
             value (Any): The value of the state
         """
-        for _, callback in self._change_callbacks.items():
-            callback(instance, value)
+        callbacks = instance._state_callbacks.get(self.name)
+        if callbacks:
+            for callback in list(callbacks.values()):
+                callback(instance, value)
 
     def _broadcast_change(self, instance: "Actor", name: str, value: ST) -> None:
         """Send state change values to nucleus.
@@ -249,35 +271,44 @@ class State(Generic[ST]):
             instance (Actor): The actor holding the state
             value (Any): The state's value
         """
-        if self._frozen:
-            old_value = instance.__dict__.get(self.name, None)
-            if old_value is not None:
-                raise SimulationError(
-                    f"State '{self}' on '{instance}' has already been frozen "
-                    f"to value of {old_value}. It cannot be changed once set!"
-                )
-
-        self._type_check(value, throw=True)
-
-        instance.__dict__[self.name] = value
-
-        self._do_record(instance, value)
-        self._do_callback(instance, value)
-
-        self._broadcast_change(instance, self.name, value)
+        if self._check_on_set:
+            if self._frozen:
+                old_value = instance.__dict__.get(self.name, None)
+                if old_value is not None:
+                    raise SimulationError(
+                        f"State '{self}' on '{instance}' has already been frozen "
+                        f"to value of {old_value}. It cannot be changed once set!"
+                    )
+            self._type_check(value, throw=True)
+
+        values = instance.__dict__
+        values[self.name] = value
+
+        if self._recording:
+            self._do_record(instance, value)
+        # Read from the dict so actors don't make their callback containers here.
+        if values.get("_state_callbacks"):
+            self._do_callback(instance, value)
+        if instance._state_listener is not None:
+            self._broadcast_change(instance, self.name, value)
 
     def __get__(self, instance: "Actor", objtype: type | None = None) -> ST:
         if instance is None:
             # instance attribute accessed on class, return self
             return self  # pragma: no cover
-        if self.name in instance._mimic_states:
-            actor, name = instance._mimic_states[self.name]
+        values = instance.__dict__
+        # Read from the dict so actors don't make their mimic containers here.
+        mimics = values.get("_mimic_states")
+        if mimics and self.name in mimics:
+            actor, name = mimics[self.name]
             value = getattr(actor, name)
             self.__set__(instance, value)
-        if self.name not in instance.__dict__:
+        try:
+            # Annotated instead of cast to save a call on every read.
+            v: ST = values[self.name]
+        except KeyError:
             raise SimulationError(f"State {self.name} should have been set.")
-        v = instance.__dict__[self.name]
-        return cast(ST, v)
+        return v
 
     def __set_name__(self, owner: "Actor", name: str) -> None:
         self.name = name
@@ -313,22 +344,30 @@ class State(Generic[ST]):
             return True
         return self._default is not None or self._default_factory is not None
 
-    def _add_callback(self, source: Any, callback: CALLBACK_FUNC) -> None:
+    def _add_callback(self, instance: "Actor", source: Any, callback: CALLBACK_FUNC) -> None:
         """Add a recording callback.
 
+        Callbacks are stored on the actor, not the state, so they only run
+        for changes to that actor's state.
+
         Args:
+            instance (Actor): The actor holding the state
             source (Any): A key for the callback
             callback (Callable[[Actor, Any], None]): A function to call
         """
-        self._change_callbacks[source] = callback
+        instance._state_callbacks.setdefault(self.name, {})[source] = callback
 
-    def _remove_callback(self, source: Any) -> None:
+    def _remove_callback(self, instance: "Actor", source: Any) -> None:
         """Remove a callback.
 
         Args:
+            instance (Actor): The actor holding the state
             source (Any): The callback's key
         """
-        del self._change_callbacks[source]
+        callbacks = instance._state_callbacks[self.name]
+        del callbacks[source]
+        if not callbacks:
+            del instance._state_callbacks[self.name]
 
     @property
     def is_recording(self) -> bool:
@@ -411,8 +450,9 @@ class ActiveState(State, Generic[ST]):
         if instance is None:
             # instance attribute accessed on class, return self
             return self  # pragma: no cover
-        if self.name in instance._mimic_states:
-            actor, name = instance._mimic_states[self.name]
+        mimics = instance.__dict__.get("_mimic_states")
+        if mimics and self.name in mimics:
+            actor, name = mimics[self.name]
             value = getattr(actor, name)
             self.__set__(instance, value)
             return cast(ST, value)
@@ -992,7 +1032,6 @@ class ResourceState(State, Generic[T]):
             valid_types=valid_types,
         )
         self._default_kwargs = default_kwargs.copy() if default_kwargs is not None else {}
-        self._been_set: set[Actor] = set()
 
     def __set__(self, instance: "Actor", value: dict | Any) -> None:
         """Set the state value.
@@ -1001,7 +1040,7 @@ class ResourceState(State, Generic[T]):
             instance (Actor): The actor instance
             value (dict | Any): Either a dictionary of resource data OR an actual resource
         """
-        if instance in self._been_set:
+        if self.name in instance.__dict__:
             raise UpstageError(
                 f"State '{self}' on '{instance}' has already been created "
                 "It cannot be changed once set!"
@@ -1012,7 +1051,6 @@ class ResourceState(State, Generic[T]):
             if not isinstance(value, self._types):
                 raise UpstageError(f"Resource object: '{value}' is not an expected type.")
             instance.__dict__[self.name] = value
-            self._been_set.add(instance)
             return
 
         resource_type = value.get("kind", self._default)
@@ -1042,7 +1080,6 @@ class ResourceState(State, Generic[T]):
             raise UpstageError(f"Exception in ResourceState init: {e}")
 
         instance.__dict__[self.name] = resource_obj
-        self._been_set.add(instance)
         # remember what we did for cloning
         instance.__dict__["_memory_for_" + self.name] = kwargs.copy()
 
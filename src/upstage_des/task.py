@@ -8,6 +8,7 @@
 from collections.abc import Callable, Generator, Iterable
 from enum import IntFlag
 from functools import wraps
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, TypeVar
 from warnings import warn
 
@@ -17,11 +18,14 @@ from simpy import Interrupt, Process
 
 if TYPE_CHECKING:
     from .actor import Actor
+    from .rehearsal import RehearsalCache
     from .task_network import TaskNetwork
 
 from .base import ENV_CONTEXT_VAR, MockEnvironment, SettableEnv, SimulationError
 from .constants import PLANNING_FACTOR_OBJECT
+from .debug_logging import LogLevel
 from .events import BaseEvent, Event
+from .profiling import PROFILER_CONTEXT_VAR
 from .routines import Routine
 
 __all__ = ("DecisionTask", "Task", "process", "TerminalTask", "InterruptStates")
@@ -40,6 +44,16 @@ class InterruptStates(IntFlag):
     RESTART = 2
 
 
+class _StopCause:
+    """Interrupt cause used when a task network is stopped."""
+
+    def __repr__(self) -> str:
+        return "task network stopped"
+
+
+STOP_CAUSE = _StopCause()
+
+
 def process(
     func: Callable[..., Generator[SimpyEvent, Any, None]],
 ) -> Callable[..., Process]:
@@ -127,7 +141,7 @@ class Task(SettableEnv):
             actor (Actor): the actor using the task
             cause (Any): Optional data for the interrupt
         """
-        actor.log(f"Interrupted while performing {self}. Reasons: {cause}")
+        actor._log_event(LogLevel.DEBUG, "on_interrupt", self, cause)
         return self._interrupt_action
 
     def set_marker(
@@ -362,6 +376,8 @@ class Task(SettableEnv):
         understudy = actor.clone(
             new_env=mocked_env,
             knowledge=knowledge,
+            copy_history=False,
+            register=False,
         )
         return understudy
 
@@ -371,6 +387,7 @@ class Task(SettableEnv):
         actor: REH_ACTOR,
         knowledge: dict[str, Any] | None = None,
         cloned_actor: bool = False,
+        cache: "RehearsalCache | None" = None,
         **kwargs: Any,
     ) -> REH_ACTOR:
         """Rehearse the task to evaluate its feasibility.
@@ -379,47 +396,73 @@ class Task(SettableEnv):
             actor (Actor): The actor to rehearse in the task
             knowledge (dict[str, Any], optional): Knowledge to add to the actor. Defaults to None.
             cloned_actor (bool, optional): If the actor is a clone or not. Defaults to False.
+            cache (RehearsalCache, optional): A cache to reuse matching rehearsals from.
+                Defaults to None.
             kwargs (Any): Optional args to send to the task.
 
         Returns:
             Actor: The cloned actor with a state reflecting the task flow.
         """
         knowledge = {} if knowledge is None else knowledge
+        profiler = PROFILER_CONTEXT_VAR.get()
+        began = perf_counter() if profiler is not None else 0.0
         _old_env = self.env
         understudy = actor
-        if not cloned_actor:
-            understudy = self._clone_actor(actor, knowledge)
-        if not isinstance(understudy.env, MockEnvironment):
-            raise SimulationError("Bad actor cloning.")
-        self.env = understudy.env
-        mocked_env: MockEnvironment = understudy.env
-
-        self._rehearsing = True
-        generator = self.task(actor=understudy, **kwargs)
-        returned_item = None
-        while True:
-            try:
-                if returned_item is None:
-                    next_event = next(generator)
-                else:
-                    next_event = generator.send(returned_item)
-                    returned_item = None
-                if not issubclass(next_event.__class__, BaseEvent | Routine):
-                    msg = f"Task {self} event {next_event}"
-                    if isinstance(next_event, Process):
-                        raise SimulationError(msg + " cannot be a process during rehearsal.")
-                    raise SimulationError(msg + " must be a subclass of BaseEvent or Routine.")
-                time_advance, returned_item = next_event.rehearse()
-                mocked_env.now += time_advance
-
-            except StopIteration:
-                # warn(f"Stopping rehearsal of task '{self.__class__.__name__}' "
-                #      f"for actor '{actor}'! [Rehearsal duration: "
-                #      f"{self.env.now - _old_env.now:.3g}]")
-                break
-
-        self.env = _old_env
-        self._rehearsing = False
+        num_events = 0
+        cache_hit = False
+        try:
+            if cache is not None:
+                key = cache._key(actor, (self.__class__, kwargs), knowledge)
+                cached = cache._lookup(key)
+                if cached is not None:
+                    if not cloned_actor:
+                        understudy = self._clone_actor(actor, knowledge)
+                    cache._apply(cached, understudy)
+                    cache_hit = True
+                    return understudy
+            if not cloned_actor:
+                understudy = self._clone_actor(actor, knowledge)
+            if not isinstance(understudy.env, MockEnvironment):
+                raise SimulationError("Bad actor cloning.")
+            if cache is not None:
+                before = cache._start(understudy)
+            self.env = understudy.env
+            mocked_env: MockEnvironment = understudy.env
+
+            self._rehearsing = True
+            generator = self.task(actor=understudy, **kwargs)
+            returned_item = None
+            while True:
+                try:
+                    if returned_item is None:
+                        next_event = next(generator)
+                    else:
+                        next_event = generator.send(returned_item)
+                        returned_item = None
+                    if not issubclass(next_event.__class__, BaseEvent | Routine):
+                        msg = f"Task {self} event {next_event}"
+                        if isinstance(next_event, Process):
+                            raise SimulationError(msg + " cannot be a process during rehearsal.")
+                        raise SimulationError(msg + " must be a subclass of BaseEvent or Routine.")
+                    time_advance, returned_item = next_event.rehearse()
+                    mocked_env.now += time_advance
+                    num_events += 1
+
+                except StopIteration:
+                    # warn(f"Stopping rehearsal of task '{self.__class__.__name__}' "
+                    #      f"for actor '{actor}'! [Rehearsal duration: "
+                    #      f"{self.env.now - _old_env.now:.3g}]")
+                    break
+
+            if cache is not None:
+                cache._store(key, before, understudy)
+        finally:
+            self.env = _old_env
+            self._rehearsing = False
+            if profiler is not None:
+                name = self.__class__.__qualname__
+                clones = 0 if understudy is actor else 1
+                profiler._record(name, "Task", began, clones, num_events, cache_hit=cache_hit)
         return understudy
 
     def _handle_interruption(
@@ -436,15 +479,19 @@ class Task(SettableEnv):
             InterruptStates: action to take
         """
         # test the interrupt behavior:
-        _interrupt_action = self.on_interrupt(
-            actor=actor,
-            cause=interrupt.cause,
-        )
+        if interrupt.cause is STOP_CAUSE:
+            # A stopped network always ends, and the user's handling is skipped.
+            _interrupt_action = InterruptStates.END
+        else:
+            _interrupt_action = self.on_interrupt(
+                actor=actor,
+                cause=interrupt.cause,
+            )
         if _interrupt_action is None:
             raise SimulationError("No interrupt behavior returned from `on_interrupt`")
 
         if _interrupt_action in (InterruptStates.END, InterruptStates.RESTART):
-            actor.log(f"Interrupted by {interrupt}.")
+            actor._log_event(LogLevel.DEBUG, "interrupted", interrupt.cause)
             actor.deactivate_all_states(task=self)
             actor.deactivate_all_mimic_states(task=self)
             if isinstance(next_event, BaseEvent):
@@ -591,17 +638,24 @@ class DecisionTask(Task):
             Actor: Cloned actor after rehearsing this task.
         """
         knowledge = {} if knowledge is None else knowledge
+        profiler = PROFILER_CONTEXT_VAR.get()
+        began = perf_counter() if profiler is not None else 0.0
         _old_env = self.env
         understudy = actor
-        if not cloned_actor:
-            understudy = self._clone_actor(actor, knowledge)
-        self.env = understudy.env
-
-        self._rehearsing = True
-
-        self.rehearse_decision(actor=understudy)
-        self.env = _old_env
-        self._rehearsing = False
+        try:
+            if not cloned_actor:
+                understudy = self._clone_actor(actor, knowledge)
+            self.env = understudy.env
+
+            self._rehearsing = True
+
+            self.rehearse_decision(actor=understudy)
+        finally:
+            self.env = _old_env
+            self._rehearsing = False
+            if profiler is not None:
+                name = self.__class__.__qualname__
+                profiler._record(name, "DecisionTask", began, 0 if understudy is actor else 1)
         return understudy
 
     @process
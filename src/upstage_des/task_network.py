@@ -7,15 +7,19 @@
 
 from collections.abc import Generator, Mapping, Sequence
 from dataclasses import dataclass
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     from upstage_des.actor import Actor
+    from upstage_des.rehearsal import RehearsalCache
 
-from simpy import Process
+from simpy import Interrupt, Process
 
 from upstage_des.base import SimulationError
-from upstage_des.task import DecisionTask, Task, TerminalTask, process
+from upstage_des.debug_logging import LogLevel
+from upstage_des.profiling import PROFILER_CONTEXT_VAR
+from upstage_des.task import STOP_CAUSE, DecisionTask, Task, TerminalTask, process
 
 REH_ACTOR = TypeVar("REH_ACTOR", bound="Actor")
 
@@ -54,6 +58,7 @@ class TaskNetwork:
         self._current_task_name: str | None = None
         self._current_task_inst: Task | None = None
         self._current_task_proc: Process | None = None
+        self._stopped = False
 
     def is_feasible(self, curr: str, new: str) -> bool:
         """Determine if a task can follow another one.
@@ -114,10 +119,10 @@ class TaskNetwork:
 
         self._current_task_name = next_name
 
-        while True:
+        while not self._stopped:
             task_name = self._current_task_name
             assert isinstance(task_name, str)
-            actor.log(f"Outer: starting {task_name}")
+            actor._log_event(LogLevel.DEBUG, "network_task", task_name)
             actor._begin_next_task(self.name, task_name)
             task_cls = self.task_classes[task_name]
             task_instance: Task = task_cls()
@@ -132,11 +137,37 @@ class TaskNetwork:
                 self._current_task_inst.run_skip(actor=actor)
             else:
                 self._current_task_proc = self._current_task_inst.run(actor=actor)
-                yield self._current_task_proc
-
+                try:
+                    yield self._current_task_proc
+                except Interrupt:
+                    # A task stopped before it started fails with the interrupt.
+                    if not self._stopped:
+                        raise
+
+            if self._stopped:
+                break
             next_name = self._next_task_name(task_name, actor)
             self._current_task_name = next_name
 
+        self._current_task_name = None
+        self._current_task_inst = None
+        self._current_task_proc = None
+
+    def stop(self) -> None:
+        """Stop the network loop and end its running task.
+
+        The running task ends as if it were interrupted with
+        ``InterruptStates.END``, but its ``on_interrupt`` is not called. No
+        further tasks are started.
+
+        If the running task is the process calling this method, it is not
+        interrupted. It runs until it finishes, and then the loop stops.
+        """
+        self._stopped = True
+        proc = self._current_task_proc
+        if proc is not None and proc.is_alive and proc is not proc.env.active_process:
+            proc.interrupt(cause=STOP_CAUSE)
+
     def rehearse_network(
         self,
         *,
@@ -144,6 +175,7 @@ class TaskNetwork:
         task_name_list: list[str],
         knowledge: dict[str, Any] | None = None,
         end_task: str | None = None,
+        cache: "RehearsalCache | None" = None,
     ) -> REH_ACTOR:
         """Rehearse a path through the task network.
 
@@ -152,6 +184,8 @@ class TaskNetwork:
             task_name_list (list[str]): The tasks to be performed in order
             knowledge (dict[str, Any], optional): Knowledge to give to the cloned/rehearsing actor
             end_task (str, optional): A task name to end on
+            cache (RehearsalCache, optional): A cache to reuse matching rehearsals from.
+                Defaults to None.
 
         Returns:
             Actor: A copy of the original actor with state changes associated with the network.
@@ -161,38 +195,65 @@ class TaskNetwork:
         _old_proc = self._current_task_proc
         knowledge = {} if knowledge is None else knowledge
         num_tasks = len(task_name_list)
-        # pre-clone the actor to get a hold of the new environment
-        new_actor = actor.clone(knowledge=knowledge)
-        task_idx = 0
-        while True:
-            if task_idx < num_tasks:
-                task_name = task_name_list[task_idx]
-            elif end_task is None:
-                break
-            else:
-                # Grab the default or one from the queue, clearing the queue to prevent loops
-                task_name = self._next_task_name(task_name, new_actor, clear_queue=True)
-            if end_task is not None and end_task == task_name:
-                break  # pragma: no cover
-            self._current_task_name = task_name
-            self._current_task_inst = self.task_classes[task_name]()
-            self._current_task_inst._set_network_name(self.name)
-            new_actor = self._current_task_inst.rehearse(
-                actor=new_actor,
-                cloned_actor=True,
-            )
-            # The next name should be feasible
-            if task_idx < num_tasks - 1:
-                follow_on = task_name_list[task_idx + 1]
-                if not self.is_feasible(task_name, follow_on):
-                    raise SimulationError(  # pragma: no cover
-                        f"Task {follow_on} not allowed after '{task_name}' in network"
-                    )
-            task_idx += 1
-        # reset the internal parameters
-        self._current_task_name = _old_name
-        self._current_task_inst = _old_inst
-        self._current_task_proc = _old_proc
+        profiler = PROFILER_CONTEXT_VAR.get()
+        began = perf_counter() if profiler is not None else 0.0
+        first_event = profiler._task_events if profiler is not None else 0
+        cache_hit = False
+        try:
+            if cache is not None:
+                tasks = tuple(task_name_list)
+                classes = tuple(self.task_classes[name] for name in tasks)
+                plan: tuple[Any, ...] = (self.name, tasks, classes, end_task)
+                if end_task is not None:
+                    # Tasks after the list come from the actor's queue.
+                    plan += (tuple(actor._task_queue.get(self.name, ())),)
+                key = cache._key(actor, plan, knowledge)
+                cached = cache._lookup(key)
+            # pre-clone the actor to get a hold of the new environment
+            new_actor = actor.clone(knowledge=knowledge, copy_history=False, register=False)
+            if cache is not None:
+                if cached is not None:
+                    cache._apply(cached, new_actor)
+                    cache_hit = True
+                    return new_actor
+                before = cache._start(new_actor)
+            task_idx = 0
+            while True:
+                if task_idx < num_tasks:
+                    task_name = task_name_list[task_idx]
+                elif end_task is None:
+                    break
+                else:
+                    # Grab the default or one from the queue, clearing the queue to prevent loops
+                    task_name = self._next_task_name(task_name, new_actor, clear_queue=True)
+                if end_task is not None and end_task == task_name:
+                    break  # pragma: no cover
+                self._current_task_name = task_name
+                self._current_task_inst = self.task_classes[task_name]()
+                self._current_task_inst._set_network_name(self.name)
+                new_actor = self._current_task_inst.rehearse(
+                    actor=new_actor,
+                    cloned_actor=True,
+                )
+                # The next name should be feasible
+                if task_idx < num_tasks - 1:
+                    follow_on = task_name_list[task_idx + 1]
+                    if not self.is_feasible(task_name, follow_on):
+                        raise SimulationError(  # pragma: no cover
+                            f"Task {follow_on} not allowed after '{task_name}' in network"
+                        )
+                task_idx += 1
+            if cache is not None:
+                cache._store(key, before, new_actor)
+        finally:
+            # reset the internal parameters
+            self._current_task_name = _old_name
+            self._current_task_inst = _old_inst
+            self._current_task_proc = _old_proc
+            if profiler is not None:
+                # The network's events are the events of its task rehearsals.
+                events = profiler._task_events - first_event
+                profiler._record(self.name, "TaskNetwork", began, 1, events, cache_hit=cache_hit)
         return new_actor
 
     def __repr__(self) -> str:
@@ -3,15 +3,21 @@
 # Licensed under the BSD 3-Clause License.
 # See the LICENSE file in the project root for complete license terms and disclaimers.
 
+import gc
+import weakref
+from collections.abc import Iterator
 from inspect import signature
 from typing import Any
 
 import pytest
 
+import upstage_des.actor as actor_module
 import upstage_des.api as UP
 from upstage_des.actor import Actor
 from upstage_des.base import EnvironmentContext, SimulationError
 from upstage_des.states import State
+from upstage_des.task import Task
+from upstage_des.type_help import TASK_GEN
 
 
 def test_actor_creation() -> None:
@@ -273,6 +279,65 @@ def test_actor_copying() -> None:
         assert actor.kind == clone.kind
 
 
+def test_clone_without_history() -> None:
+    class Aging(Actor):
+        age = State[int](default=0, recording=True)
+
+    class Birthday(Task):
+        def task(self, *, actor: Aging) -> TASK_GEN:
+            yield UP.Wait(1.0)
+            actor.age += 1
+
+    with EnvironmentContext() as env:
+        actor = Aging(name="aging")
+        for _ in range(50):
+            env.run(until=env.now + 1)
+            actor.age += 1
+            actor.log("birthday")
+
+        full = actor.clone()
+        assert full._state_histories["age"] == actor._state_histories["age"]
+        assert len(full.get_log()) == 50
+
+        light = actor.clone(copy_history=False)
+        assert light._state_histories["age"] == [(50.0, 50)]
+        assert light.get_log() == []
+
+        understudy = Birthday().rehearse(actor=actor)
+        assert understudy.age == 51
+        assert understudy._state_histories["age"] == [(50.0, 50), (51.0, 51)]
+        assert len(actor._state_histories["age"]) == 51
+
+
+def test_unregistered_clones() -> None:
+    class Holder(Actor, entity_groups=["holders"]):
+        bag = UP.ResourceState[UP.SelfMonitoringStore](default=UP.SelfMonitoringStore)
+        count = State[int](default=0, recording=True)
+
+    class Fill(Task):
+        def task(self, *, actor: Holder) -> TASK_GEN:
+            yield UP.Put(actor.bag, "thing")
+            actor.count += 1
+
+    with EnvironmentContext():
+        actor = Holder(name="holder")
+        registered = actor.clone()
+        assert actor.get_actors() == [actor, registered]
+        assert len(actor.get_monitored()) == 2
+
+        sandboxed = actor.clone(register=False)
+        understudy = Fill().rehearse(actor=actor)
+        assert understudy.count == 1
+        assert actor.get_actors() == [actor, registered]
+        assert actor.get_entity_group("holders") == [actor, registered]
+        assert len(actor.get_monitored()) == 2
+
+        ref = weakref.ref(sandboxed)
+        del sandboxed
+        gc.collect()
+        assert ref() is None
+
+
 def test_actor_copy_with_knowledge() -> None:
     class SomeActor(Actor):
         kind = "a simple actor for testing"
@@ -325,3 +390,199 @@ def test_no_init_state() -> None:
 
         with pytest.raises(SimulationError, match="Initializing a no_init state is disallowed"):
             NoInitExample(name="exam", a=2, c="hello")
+
+
+def test_actor_log_levels() -> None:
+    class Quiet(UP.Actor):
+        LOG_LEVEL = UP.LogLevel.INFO
+        LOG_MAX_RECORDS = 3
+
+    with UP.EnvironmentContext() as env:
+        UP.add_stage_variable("time_unit", "min")
+        loud = Actor(name="loud")
+        quiet = Quiet(name="quiet")
+        silent = Actor(name="silent", debug_log=False)
+        for actor in (loud, quiet, silent):
+            actor.set_knowledge("thing", 1, caller="test")
+            actor.log("hello")
+            actor.log("problem", level=UP.LogLevel.WARNING)
+        env.run(until=1.5)
+        quiet.log("later")
+        quiet.log("much later")
+
+    # The log is formatted after the context closes.
+    assert loud.get_log() == [
+        (0.0, "[Day    0 - 00:00:00] method 'set_knowledge 'thing=1'' called by 'test'"),
+        (0.0, "[Day    0 - 00:00:00] hello"),
+        (0.0, "[Day    0 - 00:00:00] problem"),
+    ]
+    assert loud.log() == loud.get_log()
+    assert silent.get_log() == []
+
+    # Debug records are skipped, and only the last 3 are kept.
+    assert [msg for _, msg in quiet.get_log()] == [
+        "[Day    0 - 00:00:00] problem",
+        "[Day    0 - 00:01:30] later",
+        "[Day    0 - 00:01:30] much later",
+    ]
+    records = loud.get_log_records()
+    assert records[0].event == "set_knowledge"
+    assert records[0].args == ("thing", 1, "test")
+    assert records[0].level == UP.LogLevel.DEBUG
+    assert [r.message for r in loud.get_log_records(UP.LogLevel.INFO)] == ["hello", "problem"]
+
+
+def test_actor_log_snapshots() -> None:
+    with UP.EnvironmentContext():
+        actor = Actor(name="logger")
+        task = UP.Task()
+        actor._log_event(UP.LogLevel.DEBUG, "on_interrupt", task, ["cause"])
+        actor._log_event(UP.LogLevel.DEBUG, "interrupted", "stop")
+        message = {"data": 1}
+        actor.log(message)  # type: ignore [arg-type]
+        expected = f"Interrupted while performing {task}. Reasons: ['cause']"
+        task_ref = weakref.ref(task)
+        del task
+
+    # The task isn't kept alive by the log.
+    assert task_ref() is None
+    records = actor.get_log_records()
+    assert records[0].message == expected
+    assert records[1].message == "Interrupted by Interrupt('stop')."
+    assert records[2].message is message
+
+
+def test_knowledge_log_keeps_set_value() -> None:
+    with UP.EnvironmentContext():
+        actor = Actor(name="knower")
+        plan = ["A"]
+        actor.set_knowledge("plan", plan, caller="test")
+        plan.append("B")
+        actor.set_knowledge("plan", plan, overwrite=True, caller="test")
+
+    assert [r.message for r in actor.get_log_records()] == [
+        "method 'set_knowledge 'plan=['A']'' called by 'test'",
+        "method 'set_knowledge 'plan=['A', 'B']'' called by 'test'",
+    ]
+
+
+def test_knowledge_skips_caller_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_lookup(caller_level: int = 1) -> str:
+        raise AssertionError("Caller lookup should be skipped")
+
+    monkeypatch.setattr(actor_module, "get_caller_info", no_lookup)
+
+    class Quiet(Actor):
+        LOG_LEVEL = UP.LogLevel.INFO
+
+    with EnvironmentContext():
+        silent = Actor(name="silent", debug_log=False)
+        silent.set_knowledge("thing", 1)
+        silent.clear_knowledge("thing")
+        quiet = Quiet(name="quiet")
+        quiet.set_knowledge("thing", 1)
+        assert quiet.get_log() == []
+
+
+class _Column:
+    """Stands in for an array with a tolist method."""
+
+    def __init__(self, values: list[Any]) -> None:
+        self.values = values
+
+    def __iter__(self) -> Iterator[Any]:
+        raise AssertionError("tolist should be used")
+
+    def tolist(self) -> list[Any]:
+        return list(self.values)
+
+
+class Bulk(Actor, entity_groups=["bulk"]):
+    speed = State[float](recording=True, valid_types=float)
+    count = State[int](default=1)
+    items = State[list](default_factory=list)
+    note = State[str](allow_none_default=True)
+    bag = UP.ResourceState[UP.SelfMonitoringStore](default=UP.SelfMonitoringStore)
+    loc = UP.CartesianLocationChangingState(recording=True)
+
+
+def test_create_many() -> None:
+    with EnvironmentContext():
+        first = Bulk(name="first", speed=0.5, loc=UP.CartesianLocation(0, 0))
+        locs = [UP.CartesianLocation(i, 0) for i in range(3)]
+        actors = Bulk.create_many(
+            ["a", "b", "c"],
+            speed=_Column([1.0, 2.0, 3.0]),
+            loc=locs,
+            count=(4, 5, 6),
+        )
+        assert [a.name for a in actors] == ["a", "b", "c"]
+        assert [a.speed for a in actors] == [1.0, 2.0, 3.0]
+        assert [a.count for a in actors] == [4, 5, 6]
+        assert actors[0].items is not actors[1].items
+        assert actors[2].loc == locs[2]
+        assert "note" not in actors[0].__dict__
+        assert actors[0]._state_histories["speed"] == [(0.0, 1.0)]
+        assert actors[1]._state_histories["loc"] == [(0.0, locs[1])]
+        assert actors[0].bag is not actors[1].bag
+
+        assert first.get_actors() == [first, *actors]
+        assert first.get_entity_group("bulk") == [first, *actors]
+        assert first.get_entity_group("Bulk") == [first, *actors]
+        assert len(first.get_monitored()) == 4
+
+        with pytest.raises(UP.UpstageError, match="has 2 values for 3 actor names"):
+            Bulk.create_many(["d", "e", "f"], speed=[1.0, 2.0], loc=locs)
+        with pytest.raises(UP.UpstageError, match="Missing values for states"):
+            Bulk.create_many(["d"], speed=[1.0])
+        with pytest.raises(UP.UpstageError, match="was not expected"):
+            Bulk.create_many(["d"], speed=[1.0], loc=locs[:1], other=[1])
+        with pytest.raises(TypeError):
+            Bulk.create_many(["d", "e"], speed=[1.0, "fast"], loc=locs[:2])
+        assert len(first.get_actors()) == 4
+
+
+class CountedBulk(Bulk):
+    made: list[str] = []
+
+    def __actual_init__(self, **kwargs: Any) -> None:
+        super().__actual_init__(**kwargs)
+        self.made.append(self.name)
+
+
+def test_create_many_custom_init() -> None:
+    assert Bulk._has_default_init()
+    assert not CountedBulk._has_default_init()
+    with EnvironmentContext():
+        locs = [UP.CartesianLocation(i, 0) for i in range(2)]
+        actors = CountedBulk.create_many(["a", "b"], speed=[1.0, 2.0], loc=locs)
+        assert CountedBulk.made == ["a", "b"]
+        assert [a.speed for a in actors] == [1.0, 2.0]
+        assert actors[1].loc == locs[1]
+        assert actors[0].get_entity_group("bulk") == actors
+        with pytest.raises(UP.UpstageError, match="Missing values for states"):
+            CountedBulk.create_many(["c"], speed=[1.0])
+
+
+def test_lazy_containers() -> None:
+    class Passive(Actor):
+        level = State[float](default=0.0, recording=True)
+        other = State[float](default=1.0)
+
+    with EnvironmentContext():
+        actor = Passive(name="passive")
+        assert actor.other == 1.0
+        actor.other = 2.0
+        assert set(actor.__dict__) == {"name", "level", "other", "_state_histories"}
+        assert not hasattr(actor, "not_an_attribute")
+
+        assert actor.get_knowledge("thing") is None
+        assert "_knowledge" in actor.__dict__
+        actor.set_knowledge("thing", 1)
+        assert actor._knowledge == {"thing": 1}
+        assert actor._tasks_by_state["level"] == set()
+
+        quiet = Passive(name="quiet", debug_log=False, debug_log_time=False)
+        assert not quiet._debug_logging
+        assert actor._debug_logging
+        assert not quiet._debug_log_time
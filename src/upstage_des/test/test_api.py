@@ -14,6 +14,8 @@ def test_api() -> None:
         "SimulationError",
         "RulesError",
         "Actor",
+        "LogLevel",
+        "LogRecord",
         "PLANNING_FACTOR_OBJECT",
         "UpstageBase",
         "NamedUpstageEntity",
@@ -21,6 +23,11 @@ def test_api() -> None:
         "add_stage_variable",
         "get_stage_variable",
         "get_stage",
+        "get_random_stream",
+        "RandomStreams",
+        "Variates",
+        "BucketedEnvironment",
+        "remove_entity",
         "All",
         "Any",
         "Event",
@@ -64,6 +71,10 @@ def test_api() -> None:
         "TaskNetwork",
         "TaskNetworkFactory",
         "TaskLinks",
+        "rehearse_many",
+        "RehearsalResult",
+        "RehearsalCache",
+        "RehearsalProfiler",
         "PointToPointCommsManager",
         "RoutingTableCommsManager",
         "Message",
@@ -7,6 +7,7 @@
 # Licensed under the 3-Clause BSD License.
 # See the LICENSE file in the project root for complete license terms and disclaimers.
 import multiprocessing as mp
+from importlib.util import find_spec
 
 import pytest
 import simpy as SIM
@@ -18,7 +19,9 @@ from upstage_des.base import (
     UpstageBase,
     UpstageError,
     add_stage_variable,
+    get_random_stream,
 )
+from upstage_des.random_numbers import RandomStreams, Variates
 
 
 def test_context() -> None:
@@ -86,7 +89,9 @@ def test_stage() -> None:
         ans = STAGE_CONTEXT_VAR.get()
         assert ans.get("A variable", 0.1) == 3.14
         assert ans.get("random") is not None
-        assert len(ans) == 2
+        assert ans.get("random_streams") is not None
+        assert ans.get("variates") is not None
+        assert len(ans) == 4
         with pytest.raises(UpstageError):
             add_stage_variable("A variable", 2)
 
@@ -109,6 +114,118 @@ def test_random() -> None:
         num = cl.stage.random.uniform(1, 3)
 
 
+class Named(NamedUpstageEntity):
+    def __init__(self, name: str) -> None:
+        self.name = name
+        super().__init__()
+
+
+def _draws(*extra: str) -> tuple[list[float], list[float]]:
+    with EnvironmentContext(random_seed=7):
+        for key in extra:
+            get_random_stream(key).random()
+        arrivals = get_random_stream("arrivals")
+        first = [arrivals.random() for _ in range(3)]
+        for key in extra:
+            get_random_stream(key).random()
+        per_actor = get_random_stream(Named, Named("Ada"))
+        return first, [per_actor.random() for _ in range(3)]
+
+
+def test_random_streams() -> None:
+    expected = _draws()
+    assert _draws("service", "repairs") == expected
+
+    with EnvironmentContext(random_seed=7):
+        streams = UpstageBase().stage.random_streams
+        assert streams.seed == 7
+        stage_draw = UpstageBase().stage.random.random()
+        assert get_random_stream("arrivals") is streams.get("arrivals")
+        assert get_random_stream(Named, Named("Ada")) is streams.get("Named", "Ada")
+        assert ("Named", "Ada") in streams
+        assert get_random_stream("arrivals").random() == expected[0][0]
+        assert UpstageBase().stage.random.random() != stage_draw
+
+    with EnvironmentContext(random_seed=8):
+        assert get_random_stream("arrivals").random() != expected[0][0]
+
+    streams = RandomStreams(seed=7)
+    ada = streams.get("service", "Ada")
+    first = ada.random()
+    streams.get("arrivals")
+    streams.release("Ada")
+    assert ("service", "Ada") not in streams
+    assert "arrivals" in streams
+    assert streams.get("service", "Ada").random() == first
+
+    with EnvironmentContext():
+        assert isinstance(UpstageBase().stage.random_streams.seed, int)
+
+
+def test_variates() -> None:
+    variates = Variates(RandomStreams(seed=7), block_size=4)
+    draws = [variates.exponential(2.0, ("service",)) for _ in range(10)]
+    assert all(d > 0 for d in draws)
+
+    # Block size and other streams don't change a stream's draws.
+    other = Variates(RandomStreams(seed=7))
+    other.exponential(2.0, ("arrivals",))
+    assert [other.exponential(2.0, ("service",)) for _ in range(10)] == draws
+
+    tri = [variates.triangular(1.0, 4.0, 2.0) for _ in range(50)]
+    assert all(1.0 <= t <= 4.0 for t in tri)
+    assert variates.triangular(3.0, 3.0, 3.0) == 3.0
+    assert all(variates.lognormal(0.0, 0.5) > 0 for _ in range(10))
+    assert {variates.empirical([1, 5, 9]) for _ in range(50)} == {1, 5, 9}
+    assert all(2 <= variates.uniform(2, 3) < 3 for _ in range(10))
+    with pytest.raises(ValueError, match="mode"):
+        variates.triangular(1.0, 4.0, 5.0)
+    with pytest.raises(ValueError, match="at least one"):
+        variates.empirical([])
+
+    with EnvironmentContext(random_seed=7):
+        stage_variates = UpstageBase().stage.variates
+        assert stage_variates.exponential(2.0, ("service",)) == draws[0]
+
+    # Blocks start small and double up to the block size.
+    growing = Variates(RandomStreams(seed=7), block_size=64)
+    sizes = []
+    for _ in range(4):
+        sizes.append(len(growing._draw_block("uniform", ("sizes",))))
+    assert sizes == [16, 32, 64, 64]
+    assert [growing.exponential(2.0, "service") for _ in range(10)] == draws
+
+    # Released keys drop their generators and blocks, and start over if used again.
+    first = growing.uniform(0, 1, ("service", "Ada"))
+    growing.uniform(0, 1, ("arrivals", "Ada"))
+    growing.release("Ada")
+    assert set(growing._generators) == {("sizes",), ("service",)}
+    assert set(growing._keys_by_part) == {"sizes", "service"}
+    assert ("uniform", ("service", "Ada")) not in growing._blocks
+    growing.release("Ada")
+    assert growing.uniform(0, 1, ("service", "Ada")) == first
+
+    # Keys are named the same way as get_random_stream keys.
+    named = Variates(RandomStreams(seed=7))
+    by_name = Variates(RandomStreams(seed=7))
+    with EnvironmentContext():
+        ada = Named("Ada")
+        assert named.exponential(2.0, "service") == draws[0]
+        assert named.uniform(0, 1, (Named, ada)) == by_name.uniform(0, 1, ("Named", "Ada"))
+        streams = RandomStreams(seed=7)
+        assert streams.get(Named, ada) is streams.get("Named", "Ada")
+        assert (Named, ada) in streams
+
+    if find_spec("numpy") is None:
+        with pytest.raises(UpstageError, match="numpy"):
+            with EnvironmentContext(random_seed=7, numpy_variates=True):
+                pass
+    else:
+        with EnvironmentContext(random_seed=7, numpy_variates=True):
+            stage_variates = UpstageBase().stage.variates
+            assert isinstance(stage_variates.normal(0.0, 1.0), float)
+
+
 def a_simulation(t: float) -> float:
     with EnvironmentContext() as env:
         env.run(until=env.now + t)
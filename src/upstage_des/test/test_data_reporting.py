@@ -1,17 +1,29 @@
 """Test the data recording/reporting capabilities."""
 
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from importlib import import_module
+from typing import Any
 
+import pytest
 import simpy as SIM
 
 import upstage_des.api as UP
 from upstage_des.data_utils import (
+    DataChannel,
+    IncrementalExporter,
+    create_data_channel,
     create_location_table,
     create_table,
+    flush_data_channels,
+    get_data_channel,
     get_recorded_data,
+    iter_location_table,
+    iter_resource_table,
+    iter_table,
     record_data,
 )
+from upstage_des.data_utils.data_utils import _dataclass_items
 from upstage_des.type_help import SIMPY_GEN
 
 
@@ -156,6 +168,9 @@ def test_data_reporting() -> None:
         loc_state_table, loc_cols = create_location_table()
         new_table, _ = create_table(skip_locations=True, save_static=True)
         orig_table, _ = create_table(skip_locations=True, save_static=False)
+        col_table = create_table(skip_locations=False, save_static=True, format="columns")
+        all_static_table, _ = create_table(skip_locations=False, save_static=True)
+        loc_col_table = create_location_table(format="columns")
 
     ctr = Counter([row[:3] for row in state_table])
     assert ctr[("Ertha", "Cashier", "items_scanned")] == 5
@@ -251,6 +266,12 @@ def test_data_reporting() -> None:
     # Only the two "other" states should show up, and the new DictionaryState
     assert len(new_table) - len(orig_table) == 4
 
+    # The columnar output has the same data as the rows
+    assert list(col_table.keys()) == cols
+    assert list(zip(*col_table.values())) == all_static_table
+    assert list(loc_col_table.keys()) == loc_cols
+    assert list(zip(*loc_col_table.values())) == loc_state_table
+
 
 def test_store_failure() -> None:
     class Exam(UP.Actor):
@@ -274,6 +295,225 @@ def test_store_failure() -> None:
         assert data == []
 
 
+def test_table_formats() -> None:
+    with UP.EnvironmentContext() as env:
+        cash = Cashier(
+            name="Ertha",
+            other=0.0,
+            items_scanned=0,
+            cue=UP.SelfMonitoringStore(env),
+            info=Information(0, 0),
+            dicttype={"Coupons": 0},
+            nrdt={"Special": 4},
+            dc_state=Information(1, 1.0),
+        )
+        cash.items_scanned += 1
+        env.run(until=1.0)
+        cash.items_scanned += 1
+
+        with pytest.raises(UP.UpstageError, match="Unknown table format"):
+            create_table(format="bad")  # type: ignore [call-overload]
+
+        columns = create_table(format="columns")
+        assert columns["Time"][:3] == [0.0, 0.0, 1.0]
+        assert columns["Value"][:3] == [0, 1, 2]
+        assert set(columns["Entity Name"]) == {"Ertha"}
+
+        try:
+            import_module("pyarrow")
+        except ImportError:
+            with pytest.raises(UP.UpstageError, match="requires pyarrow"):
+                create_table(format="arrow")
+        else:
+            table = create_table(format="arrow")
+            assert table.column_names == list(columns)
+            assert table.num_rows == len(columns["Time"])
+            assert table.column("Value").to_pylist() == columns["Value"]
+            assert create_location_table(format="arrow").num_rows == 0
+
+
+@dataclass
+class Crate:
+    label: str
+    contents: list[Information]
+
+
+def test_dataclass_items() -> None:
+    info = Information(1, 2.0)
+    assert _dataclass_items(info) == list(asdict(info).items())
+
+    crate = Crate("a", [Information(3, 4.0)])
+    items = _dataclass_items(crate)
+    assert items == list(asdict(crate).items())
+    assert items[1][1] == [{"value_1": 3, "value_2": 4.0}]
+    crate.contents.append(Information(5, 6.0))
+    assert len(items[1][1]) == 1
+
+
+def test_incremental_export() -> None:
+    with UP.EnvironmentContext() as env:
+        exporter = IncrementalExporter(skip_locations=False)
+        cart = Cart(
+            name="Wobbly Wheel",
+            location=UP.CartesianLocation(1.0, 1.0),
+            location_two=UP.CartesianLocation(1.0, 1.0),
+            some_data={"exam": 2.0},
+        )
+        cart.holding += 1
+        store = UP.SelfMonitoringStore(env, name="Shelf")
+        store.put("A")
+        record_data("First")
+
+        first, cols = exporter.create_table()
+        assert cols == create_table()[1]
+        assert len(first) == len(create_table(skip_locations=False)[0])
+        assert exporter.get_recorded_data() == [(0.0, "First")]
+        assert exporter.create_table()[0] == []
+        assert exporter.get_recorded_data() == []
+
+        env.run(until=2.0)
+        cart.holding += 1
+        store.put("B")
+        later = Cart(
+            name="Late",
+            location=UP.CartesianLocation(0.0, 0.0),
+            location_two=UP.CartesianLocation(0.0, 0.0),
+            some_data={},
+        )
+        record_data("Second")
+
+        second, _ = exporter.create_table()
+        assert (cart.name, "Cart", "holding", 2.0, 2.0, None) in second
+        assert ("Shelf", "SelfMonitoringStore", "Resource", 2.0, 2, None) in second
+        assert sum(row[0] == later.name for row in second) == 3
+        assert sorted(first + second, key=str) == sorted(
+            create_table(skip_locations=False)[0], key=str
+        )
+        assert exporter.get_recorded_data() == [(2.0, "Second")]
+
+        loc_first, loc_cols = exporter.create_location_table()
+        assert loc_cols == create_location_table()[1]
+        assert loc_first == create_location_table()[0]
+        assert exporter.create_location_table()[0] == []
+
+
+def test_incremental_export_decimated() -> None:
+    with UP.EnvironmentContext() as env:
+        exporter = IncrementalExporter()
+        store = UP.SelfMonitoringStore(env, name="Bin", history_interval=1.0)
+
+        def _fill() -> SIMPY_GEN:
+            for _ in range(3):
+                yield env.timeout(0.25)
+                yield store.put("a")
+            yield env.timeout(1.0)
+            yield store.put("a")
+
+        env.process(_fill())
+        env.run(until=1.0)
+        first, _ = exporter.create_table()
+        # The open window's latest level waits for the window to close.
+        assert [row[3:5] for row in first] == [(0.0, 0)]
+        assert create_table()[0][-1][3:5] == (0.75, 3)
+
+        env.run()
+        second, _ = exporter.create_table()
+        assert [row[3:5] for row in second] == [(0.75, 3), (1.75, 4)]
+        assert first + second == create_table()[0]
+
+
+def test_incremental_export_activation() -> None:
+    with UP.EnvironmentContext() as env:
+        cart = Cart(
+            name="Wobbly Wheel",
+            location=UP.CartesianLocation(1.0, 1.0),
+            location_two=UP.CartesianLocation(1.0, 1.0),
+            some_data={},
+        )
+        exporter = IncrementalExporter(format="columns")
+        first = exporter.create_location_table()
+        assert first["Activation Status"] == ["inactive", "inactive"]
+
+        task = UP.Task()
+        cart.activate_location_state(
+            state="location",
+            speed=1.0,
+            task=task,
+            waypoints=[UP.CartesianLocation(4.0, 5.0)],
+        )
+        second = exporter.create_location_table()
+        # The row before the activation is sent again with its new status
+        assert second["State Name"] == ["location"]
+        assert second["Time"] == [0.0]
+        assert second["Activation Status"] == ["activating"]
+
+        env.run(until=1.0)
+        cart.deactivate_state(state="location", task=task)
+        third = exporter.create_location_table()
+        assert third["Time"] == [1.0]
+        assert third["Activation Status"] == ["deactivating"]
+        full = create_location_table(format="columns")
+        assert full["Activation Status"] == ["activating", "deactivating", "inactive"]
+
+
+def test_streaming_tables() -> None:
+    with UP.EnvironmentContext() as env:
+        cash = Cashier(
+            name="Ertha",
+            other=0.0,
+            items_scanned=0,
+            cue=UP.SelfMonitoringStore(env),
+            info=Information(0, 0),
+            dicttype={"Coupons": 0},
+            nrdt={"Special": 4},
+            dc_state=Information(1, 1.0),
+        )
+        cart = Cart(
+            name="Wobbly Wheel",
+            location=UP.CartesianLocation(1.0, 1.0),
+            location_two=UP.CartesianLocation(1.0, 1.0),
+            some_data={"exam": 2.0},
+        )
+        store = UP.SelfMonitoringStore(env, name="Shelf")
+        task = UP.Task()
+        cart.activate_location_state(
+            state="location", speed=1.0, waypoints=[UP.CartesianLocation(9.0, 9.0)], task=task
+        )
+        for i in range(7):
+            cash.items_scanned += 1
+            cash.dicttype["Coupons"] += 1
+            cash.cue.put(i)
+            store.put(i)
+            env.run(until=i + 1)
+            cart.holding += 1
+        cart.deactivate_state(state="location", task=task)
+
+        with pytest.raises(UP.UpstageError, match="chunk_rows"):
+            iter_table(chunk_rows=0)
+
+        for chunk_rows in [1, 3, 1000]:
+            full, cols = create_table(skip_locations=False, save_static=True)
+            chunks = list(iter_table(chunk_rows=chunk_rows, skip_locations=False, save_static=True))
+            assert all(len(rows) == chunk_rows for rows, _ in chunks[:-1])
+            assert all(chunk_cols == cols for _, chunk_cols in chunks)
+            assert [row for rows, _ in chunks for row in rows] == full
+
+            loc_full, loc_cols = create_location_table()
+            loc_chunks = list(iter_location_table(chunk_rows=chunk_rows))
+            assert all(chunk_cols == loc_cols for _, chunk_cols in loc_chunks)
+            assert [row for rows, _ in loc_chunks for row in rows] == loc_full
+
+            resource_rows = [
+                row for rows, _ in iter_resource_table(chunk_rows=chunk_rows) for row in rows
+            ]
+            assert resource_rows == [row for row in full if row[2] in ("cue", "cue2", "Resource")]
+
+        col_chunks = list(iter_location_table(chunk_rows=2, format="columns"))
+        assert len(col_chunks[0]["X"]) == 2
+        merged = {key: [v for chunk in col_chunks for v in chunk[key]] for key in col_chunks[0]}
+        assert merged == create_location_table(format="columns")
+
+
 def test_data_recorder() -> None:
     with UP.EnvironmentContext() as env:
         record_data("First")
@@ -304,5 +544,75 @@ def test_data_recorder() -> None:
         assert id(info_stored_2) == id(info)
 
 
+def test_data_channels() -> None:
+    with UP.EnvironmentContext() as env:
+        waits = create_data_channel("waits", {"customer": str, "wait": float})
+        assert get_data_channel("waits") is waits
+        waits.record("Bob", 3)
+        env.run(until=2.0)
+        waits.record(wait=2.5, customer="Alice")
+        assert waits.get_table() == {
+            "Time": [0.0, 2.0],
+            "customer": ["Bob", "Alice"],
+            "wait": [3, 2.5],
+        }
+        rows, cols = waits.get_table(format="rows")
+        assert cols == ["Time", "customer", "wait"]
+        assert rows == [(0.0, "Bob", 3), (2.0, "Alice", 2.5)]
+
+        with pytest.raises(TypeError, match="expected"):
+            waits.record("Bob", "late")
+        with pytest.raises(UP.UpstageError, match="exactly"):
+            waits.record("Bob")
+        with pytest.raises(UP.UpstageError, match="exactly"):
+            waits.record(customer="Bob", delay=1.0)
+        with pytest.raises(UP.UpstageError, match="already exists"):
+            DataChannel("waits", {"other": int})
+        with pytest.raises(UP.UpstageError, match="reserved"):
+            DataChannel("timed", {"Time": float})
+
+        typed = DataChannel("typed", {"tags": list[int], "count": int | None})
+        typed.record([1, 2], None)
+        typed.record([], True)
+        with pytest.raises(TypeError, match="expected"):
+            typed.record((1, 2), 3)
+        with pytest.raises(UP.UpstageError, match="expected a class"):
+            DataChannel("untyped", {"value": "int"})
+        with pytest.raises(UP.UpstageError, match="No data channel"):
+            get_data_channel("missing")
+        assert len(waits) == 2
+
+        recent = DataChannel("recent", {"value": int}, max_records=3, validate=False)
+        for i in range(5):
+            recent.record(i)
+        assert recent.get_table()["value"] == [2, 3, 4]
+        assert recent.total_records == 5
+
+        flushed: list[dict[str, list[Any]]] = []
+        blocks = DataChannel("blocks", {"value": int}, max_records=2, sink=flushed.append)
+        exporter = IncrementalExporter(format="columns")
+        for i in range(5):
+            blocks.record(i)
+            recent.record(i + 5)
+        assert [block["value"] for block in flushed] == [[0, 1], [2, 3]]
+        assert exporter.get_channel_data("blocks")["value"] == [4]
+        assert exporter.get_channel_data("recent")["value"] == [7, 8, 9]
+        recent.record(10)
+        assert exporter.get_channel_data("recent")["value"] == [10]
+        flush_data_channels()
+        assert flushed[-1]["value"] == [4]
+        assert len(blocks) == 0
+
+        try:
+            import_module("numpy")
+        except ImportError:
+            with pytest.raises(UP.UpstageError, match="numpy"):
+                waits.get_arrays()
+        else:
+            arrays = waits.get_arrays()
+            assert arrays["wait"].dtype == float
+            assert arrays["customer"].dtype == object
+
+
 if __name__ == "__main__":
     test_data_reporting()
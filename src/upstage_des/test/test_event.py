@@ -15,7 +15,9 @@ from upstage_des.api import (
     SimulationError,
     State,
     Task,
+    UpstageBase,
     add_stage_variable,
+    get_random_stream,
 )
 from upstage_des.events import (
     All,
@@ -81,6 +83,45 @@ def test_wait_event() -> None:
             Wait(timeout=[1, 2, 3])  # type: ignore [arg-type]
 
 
+def test_wait_from_stream() -> None:
+    with EnvironmentContext(random_seed=3):
+        expected = get_random_stream("service", 2).uniform(1, 3)
+        other = get_random_stream("service").uniform(1, 3)
+
+    with EnvironmentContext(random_seed=3):
+        wait = Wait.from_random_uniform(1, 3, stream=("service", 2))
+        assert wait._time_to_complete == expected
+        wait = Wait.from_random_uniform(1, 3, stream="service")
+        assert wait._time_to_complete == other
+
+
+def test_wait_from_distributions() -> None:
+    with EnvironmentContext(random_seed=3):
+        variates = UpstageBase().stage.variates
+        expected = [
+            variates.exponential(2.0, ("service", 2)),
+            variates.triangular(1, 4, 2, ("repair",)),
+            variates.lognormal(0.0, 0.5),
+            variates.empirical([1.0, 2.5, 4.0], ("Actor", "ada")),
+        ]
+
+    with EnvironmentContext(random_seed=3):
+        waits = [
+            Wait.from_exponential(2.0, stream=("service", 2)),
+            Wait.from_triangular(1, 4, 2, stream="repair"),
+            Wait.from_lognormal(0.0, 0.5),
+            Wait.from_empirical([1.0, 2.5, 4.0], stream=(Actor, Actor(name="ada"))),
+        ]
+        assert [w._time_to_complete for w in waits] == expected
+
+        wait = Wait.from_exponential(1.0, "min", rehearsal_time_to_complete=0.5)
+        assert wait.rehearsal_time_to_complete == 0.5
+        with pytest.raises(SimulationError, match="mode"):
+            Wait.from_triangular(1, 2, 3)
+        with pytest.raises(SimulationError, match="at least one"):
+            Wait.from_empirical([])
+
+
 def test_base_request_event() -> None:
     init_time = 1.23
     with EnvironmentContext(initial_time=init_time) as env:
@@ -0,0 +1,215 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+
+
+import os
+from pathlib import Path
+
+import pytest
+
+import upstage_des.api as UP
+from upstage_des.experiments import (
+    Replication,
+    combine_tables,
+    parameter_grid,
+    run_replications,
+    run_sweep,
+)
+from upstage_des.type_help import TASK_GEN
+
+
+class Clerk(UP.Actor):
+    served = UP.State[int](default=0, recording=True)
+
+
+class Serve(UP.Task):
+    def task(self, *, actor: Clerk) -> TASK_GEN:
+        scale = actor.stage.get("scale", 1.0)
+        yield UP.Wait(scale * actor.stage.random.uniform(1.0, 3.0))
+        actor.served += 1
+
+
+def build() -> Clerk:
+    clerk = Clerk(name="clerk")
+    net = UP.TaskNetworkFactory.from_single_looping("work", Serve).make_network()
+    clerk.add_task_network(net)
+    clerk.start_network_loop("work", "Serve")
+    return clerk
+
+
+def served(clerk: Clerk) -> int:
+    return clerk.served
+
+
+def test_run_replications() -> None:
+    finished: list[int] = []
+    runs = run_replications(
+        build, [1, 2, 3], until=20.0, on_result=lambda r: finished.append(r.seed)
+    )
+    assert [r.seed for r in runs] == finished == [1, 2, 3]
+    assert all(r.end_time == 20.0 for r in runs)
+    assert all(r.events > 0 and r.wall_time > 0 for r in runs)
+    assert runs[0].result["Entity Name"][0] == "clerk"
+    assert runs[0].result != runs[1].result
+
+    again = run_replications(build, [1], until=20.0, reducer=served)
+    assert again[0].result == runs[0].result["Value"][-1]
+    assert again[0].events == runs[0].events
+
+    table = combine_tables(runs)
+    assert len(table["Seed"]) == sum(len(r.result["Value"]) for r in runs)
+    assert table["Seed"][0] == 1 and table["Seed"][-1] == 3
+    assert set(table) == {"Seed", *runs[0].result}
+
+    with pytest.raises(UP.UpstageError, match="Seed"):
+        combine_tables([Replication(0, {"Seed": [1]}, 0.0, 0, 0.0)])
+
+
+def test_run_replications_in_workers() -> None:
+    expected = run_replications(build, range(4), until=30.0, reducer=served)
+    finished: list[int] = []
+    runs = run_replications(
+        build,
+        range(4),
+        until=30.0,
+        reducer=served,
+        workers=2,
+        on_result=lambda r: finished.append(r.seed),
+    )
+    assert [(r.seed, r.result, r.events) for r in runs] == [
+        (r.seed, r.result, r.events) for r in expected
+    ]
+    assert sorted(finished) == [0, 1, 2, 3]
+
+
+def test_run_replications_falls_back() -> None:
+    def count(clerk: Clerk) -> int:
+        return clerk.served
+
+    with pytest.warns(UserWarning, match="in this process"):
+        runs = run_replications(build, [5, 6], until=10.0, reducer=count, workers=2)
+    assert [r.seed for r in runs] == [5, 6]
+    assert all(r.end_time == 10.0 for r in runs)
+
+
+def build_or_crash() -> Clerk:
+    # Seed 2 kills its worker process, which breaks the pool.
+    stage = UP.get_stage()
+    if stage.random_streams.seed == 2 and str(os.getpid()) != os.environ["PARENT_PID"]:
+        os._exit(1)
+    return build()
+
+
+def test_run_replications_pool_breaks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PARENT_PID", str(os.getpid()))
+    expected = run_replications(build, range(4), until=30.0, reducer=served)
+    finished: list[int] = []
+    with pytest.warns(UserWarning, match="unfinished replications"):
+        runs = run_replications(
+            build_or_crash,
+            range(4),
+            until=30.0,
+            reducer=served,
+            workers=2,
+            on_result=lambda r: finished.append(r.seed),
+        )
+    assert [(r.seed, r.result) for r in runs] == [(r.seed, r.result) for r in expected]
+    assert sorted(finished) == [0, 1, 2, 3]
+
+
+BUILT: list[float] = []
+
+
+def build_and_note() -> Clerk:
+    BUILT.append(UP.get_stage_variable("scale"))
+    return build()
+
+
+def test_run_sweep(tmp_path: Path) -> None:
+    points = parameter_grid({"scale": [1.0, 2.0], "label": ["a"]})
+    assert points == [{"scale": 1.0, "label": "a"}, {"scale": 2.0, "label": "a"}]
+
+    runs = run_sweep(build_and_note, points, [1, 2], model_version="1", until=30.0, reducer=served)
+    assert [(r.params["scale"], r.seed) for r in runs] == [(1.0, 1), (1.0, 2), (2.0, 1), (2.0, 2)]
+    assert runs[0].result > runs[2].result
+    assert runs[0].result == run_replications(build, [1], until=30.0, reducer=served)[0].result
+
+    BUILT.clear()
+    cache = tmp_path / "results"
+    first = run_sweep(
+        build_and_note, points[:1], [1, 2], model_version="1", cache_dir=cache, until=30.0
+    )
+    assert BUILT == [1.0, 1.0]
+    assert len(list(cache.iterdir())) == 2
+
+    # Overlapping points are loaded, new ones are run and saved.
+    BUILT.clear()
+    second = run_sweep(
+        build_and_note, points, [1, 2], model_version="1", cache_dir=cache, until=30.0
+    )
+    assert BUILT == [2.0, 2.0]
+    assert second[:2] == first
+    assert [r.params["scale"] for r in second] == [1.0, 1.0, 2.0, 2.0]
+    assert len(list(cache.iterdir())) == 4
+
+    # A new model version doesn't use the old results.
+    BUILT.clear()
+    run_sweep(build_and_note, points[:1], [1], model_version="2", cache_dir=cache, until=30.0)
+    assert BUILT == [1.0]
+
+    # Neither does a new reducer or end time.
+    BUILT.clear()
+    run_sweep(
+        build_and_note,
+        points[:1],
+        [1],
+        model_version="1",
+        cache_dir=cache,
+        until=30.0,
+        reducer=served,
+    )
+    run_sweep(build_and_note, points[:1], [1], model_version="1", cache_dir=cache, until=40.0)
+    assert BUILT == [1.0, 1.0]
+
+    with pytest.raises(UP.UpstageError, match="reducer_key"):
+        run_sweep(
+            build, points, [1], model_version="1", cache_dir=cache, reducer=lambda c: c.served
+        )
+    BUILT.clear()
+    for _ in range(2):
+        run_sweep(
+            build_and_note,
+            points[:1],
+            [1],
+            model_version="1",
+            cache_dir=cache,
+            until=30.0,
+            reducer=lambda c: c.served,
+            reducer_key="served",
+        )
+    assert BUILT == [1.0]
+
+    with pytest.raises(UP.UpstageError, match="JSON serializable"):
+        run_sweep(build, [{"scale": object()}], [1], model_version="1", cache_dir=cache)
+
+
+def test_run_sweep_in_workers(tmp_path: Path) -> None:
+    points = parameter_grid({"scale": [1.0, 2.0]})
+    expected = run_sweep(build, points, [1, 2], model_version="1", until=30.0, reducer=served)
+    runs = run_sweep(
+        build,
+        points,
+        [1, 2],
+        model_version="1",
+        cache_dir=tmp_path,
+        until=30.0,
+        reducer=served,
+        workers=2,
+    )
+    assert [(r.params, r.seed, r.result) for r in runs] == [
+        (r.params, r.seed, r.result) for r in expected
+    ]
+    assert len(list(tmp_path.glob("*.pkl"))) == 4
+    assert list(tmp_path.glob("*.tmp")) == []
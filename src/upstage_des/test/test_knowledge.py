@@ -1,3 +1,5 @@
+import pytest
+
 import upstage_des.api as UP
 from upstage_des.type_help import TASK_GEN
 
@@ -47,5 +49,84 @@ def test_knowledge_event_clear() -> None:
         assert "other evt" in act._knowledge
 
 
+class Cook(UP.Actor):
+    orders = UP.State[int](default=0)
+
+
+class WaitForOrder(UP.Task):
+    def task(self, *, actor: UP.Actor) -> TASK_GEN:
+        evt = actor.wait_for_knowledge("order", lambda size: size > 2, 5.0)
+        yield evt
+        self.set_actor_knowledge(actor, "got", (self.env.now, evt.get_payload()["value"]))
+
+    def on_interrupt(self, *, actor: UP.Actor, cause: str) -> UP.InterruptStates:
+        return UP.InterruptStates.END
+
+
+def test_wait_for_knowledge() -> None:
+    with UP.EnvironmentContext() as env:
+        act = Cook(name="Example")
+        WaitForOrder().run(actor=act)
+
+        env.run(until=1)
+        act.set_knowledge("order", 1)
+        env.run(until=2)
+        assert act.get_knowledge("got") is None
+        act.set_knowledge("order", 3, overwrite=True)
+        env.run(until=3)
+        assert act.get_knowledge("got") == (2.0, 3)
+        assert act._knowledge_waiters == {}
+
+        # Already true when asked
+        evt = act.wait_for_knowledge("order")
+        assert evt.get_payload() == {"value": 3}
+
+        # Interrupted waiters are dropped when their event is cancelled
+        act.set_knowledge("order", 0, overwrite=True)
+        proc = WaitForOrder().run(actor=act)
+        env.run(until=4)
+        assert len(act._knowledge_waiters["order"]) == 1
+        proc.interrupt(cause="stop")
+        env.run(until=5)
+        assert act._knowledge_waiters == {}
+        act.set_knowledge("order", 10, overwrite=True)
+        env.run()
+        assert act.get_knowledge("got") == (2.0, 3)
+
+        clone = act.clone()
+        time, response = clone.wait_for_knowledge("other").rehearse()
+        assert time == 0.0
+        assert response is UP.PLANNING_FACTOR_OBJECT
+        assert clone._knowledge_waiters == {}
+
+    with UP.EnvironmentContext():
+        act = Cook(name="Example")
+        clone = WaitForOrder().rehearse(actor=act)
+        assert clone.env.now == 5.0
+        assert clone.get_knowledge("got") == (5.0, UP.PLANNING_FACTOR_OBJECT)
+
+
+def test_knowledge_predicate_error() -> None:
+    def bad(value: int) -> bool:
+        raise ValueError("bad predicate")
+
+    with UP.EnvironmentContext() as env:
+        act = Cook(name="Example")
+        first = act.wait_for_knowledge("order", lambda size: size > 2)
+        broken = act.wait_for_knowledge("order", bad)
+        last = act.wait_for_knowledge("order")
+        with pytest.raises(ValueError, match="bad predicate"):
+            act.set_knowledge("order", 1)
+        # The untested waiters are kept
+        assert [evt for _, evt in act._knowledge_waiters["order"]] == [first, broken, last]
+
+        act._knowledge_waiters["order"].remove((bad, broken))
+        act.set_knowledge("order", 5, overwrite=True)
+        env.run()
+        assert first.get_payload() == {"value": 5}
+        assert last.get_payload() == {"value": 5}
+        assert act._knowledge_waiters == {}
+
+
 if __name__ == "__main__":
     test_knowledge_event_clear()
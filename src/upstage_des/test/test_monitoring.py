@@ -4,9 +4,10 @@
 # See the LICENSE file in the project root for complete license terms and disclaimers.
 """Tests for a bug where bad queue order keeps Monitoring*Stores from working."""
 
+import pytest
 from simpy import Container, Environment, FilterStore, Store
 
-from upstage_des.base import EnvironmentContext
+from upstage_des.base import EnvironmentContext, UpstageError
 from upstage_des.events import Get, Put
 from upstage_des.resources.monitoring import (
     SelfMonitoringContainer,
@@ -140,5 +141,91 @@ def test_monitoring_sorted_filter_store_get() -> None:
         assert data.get("final", [1]) == [2]
 
 
+def test_monitoring_statistics() -> None:
+    with EnvironmentContext() as env:
+        store = SelfMonitoringStore(env, statistics=True, keep_history=False)
+        tank = SelfMonitoringContainer(env, capacity=10, init=2.0, statistics=True)
+        plain = SelfMonitoringStore(env)
+
+        def _proc() -> SIMPY_GEN:
+            yield env.timeout(1.0)
+            yield store.put("a")
+            yield tank.put(2.0)
+            yield env.timeout(1.0)
+            yield store.put("b")
+            yield env.timeout(2.0)
+            yield store.get()
+            yield store.get()
+            yield tank.get(4.0)
+
+        env.process(_proc())
+        env.run(until=3.0)
+        # Mid-run query counts the level held up to now
+        mid = store.get_statistics()
+        assert mid.elapsed == 3.0
+        assert mid.mean == (0 * 1 + 1 * 1 + 2 * 1) / 3
+
+        env.run(until=8.0)
+        stats = store.get_statistics()
+        assert stats.elapsed == 8.0
+        assert stats.mean == (1 * 1 + 2 * 2) / 8
+        assert stats.maximum == 2
+        assert stats.minimum == 0
+        assert stats.busy_fraction == 3 / 8
+        assert stats.time_at_level == {0: 5.0, 1: 1.0, 2: 2.0}
+        assert stats.percentile(50) == 0
+        assert stats.percentile(70) == 1
+        assert stats.percentile(100) == 2
+        mean = stats.mean
+        variance = (5 * (0 - mean) ** 2 + 1 * (1 - mean) ** 2 + 2 * (2 - mean) ** 2) / 8
+        assert abs(stats.variance - variance) < 1e-12
+        assert store._quantities == []
+
+        tank_stats = tank.get_statistics()
+        assert tank_stats.mean == (2.0 * 1 + 4.0 * 3) / 8
+        assert tank_stats.busy_fraction == 4 / 8
+        assert tank._quantities == [(0.0, 2.0), (1.0, 4.0), (4.0, 0.0)]
+
+        with pytest.raises(UpstageError, match="statistics=True"):
+            plain.get_statistics()
+
+
+def test_monitoring_decimated_history() -> None:
+    with EnvironmentContext() as env:
+        store = SelfMonitoringStore(env, history_interval=1.0)
+
+        def _proc() -> SIMPY_GEN:
+            for _ in range(4):
+                yield env.timeout(0.25)
+                yield store.put("a")
+            yield env.timeout(0.75)
+            yield store.get()
+
+        env.process(_proc())
+        env.run()
+        assert store._quantities == [(0.0, 0), (0.75, 3), (1.0, 4)]
+        assert store._level_history() == [(0.0, 0), (0.75, 3), (1.0, 4), (1.75, 3)]
+
+    with EnvironmentContext() as env:
+        tank = SelfMonitoringContainer(env, capacity=100, init=50, history_interval=10)
+
+        def _drain() -> SIMPY_GEN:
+            yield env.timeout(1.0)
+            yield tank.get(5)
+            yield env.timeout(1.0)
+            yield tank.get(5)
+
+        env.process(_drain())
+        env.run()
+        assert tank._quantities == [(0.0, 50)]
+        assert tank._level_history() == [(0.0, 50), (2.0, 40)]
+
+
+def test_monitoring_statistics_bad_values() -> None:
+    with EnvironmentContext() as env:
+        with pytest.raises(UpstageError, match="numeric"):
+            SelfMonitoringStore(env, item_func=set, statistics=True)  # type: ignore [arg-type]
+
+
 if __name__ == "__main__":
     test_monitoring_container_get()
@@ -0,0 +1,290 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+
+from collections.abc import Callable
+
+import pytest
+
+import upstage_des.api as UP
+from upstage_des.type_help import TASK_GEN
+
+
+class Truck(UP.Actor):
+    fuel = UP.State[float](recording=True)
+    trips = UP.State[int](default=0)
+    cargo = UP.ResourceState[UP.SelfMonitoringStore](default=UP.SelfMonitoringStore)
+    tank = UP.ResourceState[UP.SelfMonitoringContainer](
+        default=UP.SelfMonitoringContainer, default_kwargs={"capacity": 100, "init": 50}
+    )
+
+
+class Drive(UP.Task):
+    def task(self, *, actor: Truck) -> TASK_GEN:
+        distance = actor.get_knowledge("distance", must_exist=True)
+        yield UP.Wait(distance / UP.get_stage_variable("speed"))
+        actor.fuel -= distance
+        actor.trips += 1
+        actor.set_knowledge("arrived", True, overwrite=True)
+
+
+class Load(UP.Task):
+    def task(self, *, actor: Truck) -> TASK_GEN:
+        yield UP.Put(actor.cargo, "box", rehearsal_time_to_complete=0.5)
+        yield UP.Get(actor.tank, 10.0, rehearsal_time_to_complete=0.5)
+
+
+def _fuel_and_time(truck: Truck) -> tuple[float, float]:
+    return truck.fuel, truck.env.now
+
+
+def _make_truck() -> Truck:
+    UP.add_stage_variable("speed", 2.0)
+    truck = Truck(name="truck", fuel=100.0)
+    truck.set_knowledge("distance", 10.0)
+    links = {
+        "Drive": UP.TaskLinks(default="Load", allowed=["Load", "Drive"]),
+        "Load": UP.TaskLinks(default="Drive", allowed=["Drive", "Load"]),
+    }
+    fact = UP.TaskNetworkFactory("route", {"Drive": Drive, "Load": Load}, links)
+    truck.add_task_network(fact.make_network())
+    return truck
+
+
+def _trip_counter(truck: Truck) -> Callable[[], int]:
+    trips = truck.trips
+    return lambda: trips
+
+
+def _bad_summary(truck: Truck) -> int:
+    return truck.no_such_state  # type: ignore [attr-defined, no-any-return]
+
+
+PLANS = [["Drive"], ["Drive", "Load", "Drive"], ["Load", "Load"]]
+
+
+def test_rehearse_many() -> None:
+    with UP.EnvironmentContext() as env:
+        truck = _make_truck()
+        results = UP.rehearse_many(truck, PLANS)
+        expected = [UP.rehearse_many(truck, [plan])[0] for plan in PLANS]
+        assert results == expected
+        assert [r.time for r in results] == [5.0, 11.0, 2.0]
+        assert [r.states["fuel"] for r in results] == [90.0, 80.0, 100.0]
+        assert results[1].states["trips"] == 2
+        assert results[1].states["cargo"] == []
+        assert results[2].states["tank"] == 50.0
+        assert env.now == 0
+        assert truck.fuel == 100.0
+        assert truck.get_actors() == [truck]
+
+        summaries = UP.rehearse_many(
+            truck, PLANS, summary=_fuel_and_time, knowledge={"distance": 4}
+        )
+        assert summaries == [(96.0, 2.0), (92.0, 5.0), (100.0, 2.0)]
+
+        with pytest.raises(UP.UpstageError, match="no task network"):
+            UP.rehearse_many(truck, PLANS, network_name="other")
+
+
+def test_rehearse_many_in_workers() -> None:
+    with UP.EnvironmentContext(initial_time=3.0):
+        truck = _make_truck()
+        truck.fuel = 60.0
+        truck.cargo.items.append("crate")
+        expected = UP.rehearse_many(truck, PLANS)
+        results = UP.rehearse_many(truck, PLANS, workers=2)
+        assert results == expected
+        assert results[0].time == 8.0
+        assert results[1].states["cargo"] == ["crate"]
+        assert results[1].states["tank"] == 50.0
+
+        summaries = UP.rehearse_many(truck, PLANS, summary=_fuel_and_time, workers=2)
+        assert summaries == [(50.0, 8.0), (40.0, 14.0), (60.0, 5.0)]
+
+
+def test_rehearse_many_falls_back() -> None:
+    with UP.EnvironmentContext():
+        truck = _make_truck()
+        with pytest.warns(UserWarning, match="in this process"):
+            results = UP.rehearse_many(truck, PLANS, summary=lambda t: t.trips, workers=2)
+        assert results == [1, 2, 0]
+
+        with pytest.warns(UserWarning, match="can't be sent back"):
+            counters = UP.rehearse_many(truck, PLANS, summary=_trip_counter, workers=2)
+        assert [counter() for counter in counters] == [1, 2, 0]
+
+        # Errors from the summary aren't mistaken for pickling failures.
+        with pytest.raises(AttributeError, match="no_such_state"):
+            UP.rehearse_many(truck, PLANS, summary=_bad_summary, workers=2)
+
+
+def test_rehearsal_cache() -> None:
+    with UP.EnvironmentContext() as env:
+        truck = _make_truck()
+        cache = UP.RehearsalCache(states=["fuel"], knowledge=["distance"], max_size=2)
+        plan = ["Drive", "Load", "Drive"]
+        expected = truck.rehearse_network("route", plan)
+        first = truck.rehearse_network("route", plan, cache=cache)
+        second = truck.rehearse_network("route", plan, cache=cache)
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+        for understudy in (first, second):
+            assert understudy.env.now == expected.env.now == 11.0
+            assert understudy.fuel == expected.fuel == 80.0
+            assert understudy.trips == 2
+            assert understudy.get_knowledge("arrived") is True
+            assert understudy is not truck
+        assert env.now == 0
+        assert truck.get_knowledge("arrived") is None
+
+        # Task rehearsals are cached separately from network rehearsals.
+        task = Drive()
+        task_first = task.rehearse(actor=truck, cache=cache)
+        task_second = task.rehearse(actor=truck, cache=cache)
+        assert (task_first.fuel, task_first.env.now) == (90.0, 5.0)
+        assert (task_second.fuel, task_second.env.now) == (90.0, 5.0)
+        assert task.env is env
+        assert task_second.env is not env
+        assert (cache.hits, cache.misses, len(cache)) == (2, 2, 2)
+
+        # Undeclared numeric states get the same change.
+        truck.trips = 3
+        third = truck.rehearse_network("route", plan, cache=cache)
+        assert (cache.hits, third.trips, third.fuel) == (3, 5, 80.0)
+        truck.trips = 0
+
+        # Declared values are part of the fingerprint.
+        longer = truck.rehearse_network("route", plan, knowledge={"distance": 20.0}, cache=cache)
+        assert longer.fuel == 60.0
+        assert (cache.hits, cache.misses, cache.evictions, len(cache)) == (3, 3, 1, 2)
+        assert cache.hit_rate == 0.5
+
+        cache.clear()
+        assert (cache.hits, cache.misses, len(cache), cache.hit_rate) == (0, 0, 0, 0.0)
+
+        truck.set_knowledge("distance", bytearray(b"far"), overwrite=True)
+        with pytest.raises(UP.UpstageError, match="must be hashable"):
+            truck.rehearse_network("route", plan, cache=cache)
+
+
+class Porter(UP.Actor):
+    spot = UP.State[str](default="dock")
+
+
+class Move(UP.Task):
+    def task(self, *, actor: Porter) -> TASK_GEN:
+        yield UP.Wait(1.0)
+        actor.spot = "yard"
+
+
+def test_rehearsal_cache_other_states() -> None:
+    with UP.EnvironmentContext():
+        porter = Porter(name="porter")
+        cache = UP.RehearsalCache()
+        Move().rehearse(actor=porter, cache=cache)
+        moved = Move().rehearse(actor=porter, cache=cache)
+        assert moved.spot == "yard"
+        assert (cache.hits, cache.misses, len(cache)) == (0, 2, 0)
+
+        cache = UP.RehearsalCache(states=["spot"])
+        Move().rehearse(actor=porter, cache=cache)
+        moved = Move().rehearse(actor=porter, cache=cache)
+        assert (moved.spot, moved.env.now) == ("yard", 1.0)
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+class Go(UP.Task):
+    def task(self, *, actor: Truck) -> TASK_GEN:
+        yield UP.Wait(1.0)
+        actor.fuel -= 1
+
+
+class Short(UP.Task):
+    def task(self, *, actor: Truck) -> TASK_GEN:
+        yield UP.Wait(1.0)
+        actor.fuel -= 1
+
+
+class Long(UP.Task):
+    def task(self, *, actor: Truck) -> TASK_GEN:
+        yield UP.Wait(5.0)
+        actor.fuel -= 5
+
+
+def test_rehearsal_cache_task_queue() -> None:
+    links = {
+        "Go": UP.TaskLinks(default="Short", allowed=["Short", "Long"]),
+        "Short": UP.TaskLinks(default="End", allowed=["End"]),
+        "Long": UP.TaskLinks(default="End", allowed=["End"]),
+        "End": UP.TaskLinks(default="End", allowed=["End"]),
+    }
+    fact = UP.TaskNetworkFactory("n", {"Go": Go, "Short": Short, "Long": Long, "End": Go}, links)
+    with UP.EnvironmentContext():
+        trucks = [Truck(name=name, fuel=11.0) for name in "ab"]
+        for truck in trucks:
+            truck.add_task_network(fact.make_network())
+        trucks[1].set_task_queue("n", ["Long"])
+        cache = UP.RehearsalCache(states=["fuel"])
+        for _ in range(2):
+            results = [
+                truck.rehearse_network("n", ["Go"], end_task="End", cache=cache) for truck in trucks
+            ]
+            assert [(r.fuel, r.env.now) for r in results] == [(9.0, 2.0), (5.0, 6.0)]
+        assert (cache.hits, cache.misses) == (2, 2)
+        assert trucks[1].get_task_queue("n") == ["Long"]
+
+
+class Choose(UP.DecisionTask):
+    def rehearse_decision(self, *, actor: Truck) -> None:
+        actor.set_knowledge("choice", "Drive")
+
+
+class Stall(UP.Task):
+    def task(self, *, actor: Truck) -> TASK_GEN:
+        yield UP.Wait(1.0)
+        raise ValueError("stalled")
+
+
+def test_rehearsal_profiler() -> None:
+    with UP.EnvironmentContext():
+        truck = _make_truck()
+        cache = UP.RehearsalCache(states=["fuel"])
+        with UP.RehearsalProfiler() as profiler:
+            truck.rehearse_network("route", ["Drive", "Load", "Drive"])
+            Drive().rehearse(actor=truck, cache=cache)
+            Drive().rehearse(actor=truck, cache=cache)
+            Choose().rehearse(actor=truck)
+            stall = Stall()
+            with pytest.raises(ValueError, match="stalled"):
+                stall.rehearse(actor=truck)
+        truck.rehearse_network("route", ["Drive"])
+        assert not stall._rehearsing
+        assert stall.env is truck.env
+
+        rows, cols = profiler.get_table()
+        assert cols == [
+            "Name",
+            "Kind",
+            "Rehearsals",
+            "Cloned Actors",
+            "Events",
+            "Cache Hits",
+            "Wall Time",
+        ]
+        assert [row[:6] for row in rows] == [
+            ("Drive", "Task", 4, 2, 3, 1),
+            ("Load", "Task", 1, 0, 2, 0),
+            ("route", "TaskNetwork", 1, 1, 4, 0),
+            ("Choose", "DecisionTask", 1, 1, 0, 0),
+            ("Stall", "Task", 1, 1, 1, 0),
+        ]
+        assert all(row[6] >= 0 for row in rows)
+        columns = profiler.get_table(format="columns")
+        assert columns["Name"] == ["Drive", "Load", "route", "Choose", "Stall"]
+        assert columns["Rehearsals"] == [4, 1, 1, 1, 1]
+
+        profiler.clear()
+        assert profiler.get_table() == ([], cols)
+        with pytest.raises(UP.UpstageError, match="Unknown table format"):
+            profiler.get_table(format="bad")  # type: ignore [arg-type]
@@ -0,0 +1,200 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+
+import gc
+import weakref
+from typing import Any
+
+import upstage_des.api as UP
+from upstage_des.data_utils import create_table
+from upstage_des.motion.cartesian_model import cartesian_linear_intersection as cli
+from upstage_des.type_help import TASK_GEN
+
+
+class Customer(UP.Actor, entity_groups=["customers"]):
+    count = UP.State[int](recording=True, default=0)
+    bag = UP.ResourceState[UP.SelfMonitoringStore](default=UP.SelfMonitoringStore)
+
+
+class Shop(UP.Task):
+    def task(self, *, actor: Customer) -> TASK_GEN:
+        actor.count += 1
+        yield UP.Wait(1.0)
+
+
+class Stubborn(UP.Task):
+    def task(self, *, actor: Customer) -> TASK_GEN:
+        yield UP.Wait(10.0)
+
+    def on_interrupt(self, *, actor: Customer, cause: Any) -> UP.InterruptStates:
+        return self.INTERRUPT.IGNORE
+
+
+class Leave(UP.Task):
+    def task(self, *, actor: Customer) -> TASK_GEN:
+        actor.count += 1
+        actor.retire()
+        yield UP.Wait(1.0)
+        actor.count += 1
+
+
+class Mover(UP.Actor):
+    loc = UP.CartesianLocationChangingState(recording=True)
+    detect = UP.DetectabilityState(default=True)
+
+
+class Move(UP.Task):
+    def task(self, *, actor: Mover) -> TASK_GEN:
+        actor.activate_location_state(
+            state="loc",
+            task=self,
+            speed=1.0,
+            waypoints=[UP.CartesianLocation(20, 0, 0)],
+        )
+        yield UP.Wait(20.0)
+        actor.deactivate_all_states(task=self)
+
+
+class Sensor:
+    def __init__(self) -> None:
+        self.location = UP.CartesianLocation(10, 0, 0)
+        self.radius = 3.0
+        self.seen: list[str] = []
+
+    def entity_entered_range(self, mover: Any) -> None:
+        self.seen.append("enter")
+
+    def entity_exited_range(self, mover: Any) -> None:
+        self.seen.append("exit")
+
+
+class Radio(UP.Actor):
+    messages = UP.CommunicationStore(modes=["radio"])
+
+
+def test_retire_releases_actor() -> None:
+    with UP.EnvironmentContext() as env:
+        net = UP.TaskNetworkFactory.from_single_looping("shop", Shop).make_network()
+        customer = Customer(name="Alice")
+        other = Customer(name="Bob")
+        customer.add_task_network(net)
+        customer.start_network_loop("shop", "Shop")
+        env.run(until=2.5)
+
+        data: list[dict[str, list[Any]]] = []
+        customer.retire(sink=data.append)
+        assert set(data[0]["Entity Name"]) == {"Alice"}
+        assert set(data[0]["State Name"]) == {"count", "bag"}
+        counts = [v for n, v in zip(data[0]["State Name"], data[0]["Value"]) if n == "count"]
+        assert counts == [0, 1, 2, 3]
+
+        assert customer.get_actors() == [other]
+        assert customer.get_entity_group("customers") == [other]
+        assert customer.get_monitored() == [other.bag]
+        assert customer._task_networks == {}
+
+        ref = weakref.ref(customer)
+        del customer
+        env.run(until=10)
+        gc.collect()
+        assert ref() is None
+        assert net._current_task_proc is None
+
+        table, _ = create_table()
+        assert all(row[0] == "Bob" for row in table)
+
+
+def test_retire_releases_random_streams() -> None:
+    with UP.EnvironmentContext(random_seed=3) as env:
+        customer = Customer(name="Alice")
+        other = Customer(name="Bob")
+        variates = UP.get_stage().variates
+        for actor in (customer, other):
+            variates.exponential(1.0, (Shop, actor))
+        variates.exponential(1.0, Shop)
+        streams = UP.get_stage().random_streams
+        for actor in (customer, other):
+            UP.get_random_stream(Shop, actor)
+        customer.retire()
+        assert set(variates._generators) == {("Shop", "Bob"), ("Shop",)}
+        assert ("Shop", "Alice") not in streams
+        assert ("Shop", "Bob") in streams
+        env.run()
+
+
+def test_retire_skips_interrupt_handling() -> None:
+    with UP.EnvironmentContext() as env:
+        fact = UP.TaskNetworkFactory.from_single_looping("wait", Stubborn)
+        customer = Customer(name="Alice")
+        customer.add_task_network(fact.make_network())
+        customer.start_network_loop("wait", "Stubborn")
+        env.run(until=1)
+        task_proc = customer.get_running_task("wait")
+        assert task_proc is not None
+        customer.retire()
+        env.run(until=2)
+        assert not task_proc.process.is_alive
+
+
+def test_retire_from_own_task() -> None:
+    with UP.EnvironmentContext() as env:
+        fact = UP.TaskNetworkFactory.from_single_looping("leave", Leave)
+        customer = Customer(name="Alice")
+        customer.add_task_network(fact.make_network())
+        customer.start_network_loop("leave", "Leave")
+        env.run()
+        assert customer.count == 2
+        assert env.now == 1.0
+        assert customer.get_actors() == []
+
+
+def test_retire_moving_actor() -> None:
+    with UP.EnvironmentContext() as env:
+        UP.add_stage_variable("distance_units", "m")
+        motion = UP.SensorMotionManager(cli)
+        UP.add_stage_variable("motion_manager", motion)
+        sensor = Sensor()
+        motion.add_sensor(sensor)
+
+        mover = Mover(name="Mover", loc=UP.CartesianLocation(0, 0, 0))
+        net = UP.TaskNetworkFactory.from_single_terminating("move", Move).make_network()
+        mover.add_task_network(net)
+        mover.start_network_loop("move", "Move")
+        env.run(until=9)
+        assert sensor.seen == ["enter"]
+
+        mover.retire()
+        assert sensor.seen == ["enter", "exit"]
+        assert motion._movers == {}
+        assert motion._events == {}
+        assert motion._in_view == {}
+
+        ref = weakref.ref(mover)
+        del mover
+        env.run(until=30)
+        gc.collect()
+        assert ref() is None
+        assert sensor.seen == ["enter", "exit"]
+
+
+def test_retire_comms() -> None:
+    with UP.EnvironmentContext():
+        first = Radio(name="first")
+        second = Radio(name="second")
+        p2p = UP.PointToPointCommsManager(name="p2p", mode="radio")
+        p2p.connect(first, "messages")
+        p2p.connect(second, "messages")
+        p2p.blocked_links.append((first, second))
+        p2p.blocked_nodes.append(first)
+
+        routed = UP.RoutingTableCommsManager(name="routed", mode="radio")
+        routed.connect_nodes(first, second, two_way=True)
+
+        first.retire()
+        assert list(p2p.connected) == [second]
+        assert p2p.blocked_links == []
+        assert p2p.blocked_nodes == []
+        assert list(routed._nodes) == ["second"]
+        assert dict(routed._network) == {"second": set()}
@@ -0,0 +1,87 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+import simpy as SIM
+from simpy.core import EmptySchedule, Infinity
+
+import upstage_des.api as UP
+from upstage_des.scheduling import BucketedEnvironment
+from upstage_des.type_help import TASK_GEN
+
+
+def _log_run(env: SIM.Environment) -> list[tuple[float, str]]:
+    log: list[tuple[float, str]] = []
+
+    def worker(name: str, delays: list[float]) -> Generator[SIM.Event, Any, None]:
+        for delay in delays:
+            try:
+                yield env.timeout(delay)
+                log.append((env.now, name))
+            except SIM.Interrupt:
+                log.append((env.now, f"{name} interrupted"))
+
+    def trigger(event: SIM.Event) -> Generator[SIM.Event, Any, None]:
+        yield env.timeout(2)
+        event.succeed()
+        log.append((env.now, "triggered"))
+
+    def waiter(event: SIM.Event) -> Generator[SIM.Event, Any, None]:
+        yield event
+        log.append((env.now, "woke"))
+        yield env.timeout(0)
+        log.append((env.now, "after zero"))
+
+    event = env.event()
+    env.process(waiter(event))
+    procs = [env.process(worker(f"w{i}", [1, 1, 0.5, 2, 1])) for i in range(4)]
+    env.process(trigger(event))
+    env.run(until=2)
+    procs[2].interrupt()
+    env.run(until=3.5)
+    env.run()
+    return log
+
+
+def test_bucketed_matches_simpy() -> None:
+    expected = _log_run(SIM.Environment())
+    env = BucketedEnvironment()
+    assert _log_run(env) == expected
+    assert env.now == 5.5
+    assert env.peek() == Infinity
+    with pytest.raises(EmptySchedule):
+        env.step()
+
+
+class Cook(UP.Actor):
+    meals = UP.State[int](default=0, recording=True)
+
+
+class Fry(UP.Task):
+    def task(self, *, actor: Cook) -> TASK_GEN:
+        yield UP.Wait(float(actor.stage.random.randint(1, 3)))
+        actor.meals += 1
+
+
+def _kitchen(scheduler: type[SIM.Environment]) -> list[tuple[str, float, int]]:
+    with UP.EnvironmentContext(random_seed=5, scheduler=scheduler) as env:
+        assert isinstance(env, scheduler)
+        cooks = [Cook(name=f"cook {i}") for i in range(5)]
+        for cook in cooks:
+            net = UP.TaskNetworkFactory.from_single_looping("cook", Fry).make_network()
+            cook.add_task_network(net)
+            cook.start_network_loop("cook", "Fry")
+        env.run(until=40)
+        return [(cook.name, t, v) for cook in cooks for t, v in cook._state_histories["meals"]]
+
+
+def test_bucketed_context() -> None:
+    assert _kitchen(BucketedEnvironment) == _kitchen(SIM.Environment)
+
+    with pytest.raises(UP.UpstageError, match="simpy.Environment"):
+        UP.EnvironmentContext(scheduler=dict)  # type: ignore[arg-type]
@@ -4,6 +4,8 @@
 # See the LICENSE file in the project root for complete license terms and disclaimers.
 
 import upstage_des.api as UP
+from upstage_des.base import EntityGroup
+from upstage_des.data_utils import create_table
 
 
 class Example(UP.Actor):
@@ -191,5 +193,82 @@ def test_multi_inheritence_tracking() -> None:
         assert m.a_method() == 3
 
 
+def test_entity_group() -> None:
+    a, b, c = Example.__new__(Example), Example.__new__(Example), Example.__new__(Example)
+    group = EntityGroup([a, b])
+    assert group.add(c)
+    assert not group.add(a)
+    assert group == [a, b, c]
+    assert group[1] is b
+    assert group[-1] is c
+    assert b in group
+
+    seen = []
+    for item in group:
+        seen.append(item)
+        if item is a:
+            group.discard(b)
+            group.add(b)
+    assert seen == [a, c, b]
+    assert group == [a, c, b]
+    assert group.discard(c)
+    assert not group.discard(c)
+    assert c not in group
+    assert len(group) == 2
+    assert group[:] == [a, b]
+    assert group.copy() == [a, b] and isinstance(group.copy(), list)
+    assert group + [c] == [a, b, c]
+    assert [c] + group == [c, a, b]
+
+    # Removals that would compact the group don't hide entities from a running iteration.
+    many = [Example.__new__(Example) for _ in range(40)]
+    group = EntityGroup(many)
+    late = Example.__new__(Example)
+    seen = []
+    for item in group:
+        seen.append(item)
+        if item is many[0]:
+            for other in many[1:30]:
+                group.discard(other)
+            assert group[1] is many[30]
+            group.add(late)
+    assert seen == [many[0], *many[30:], late]
+    assert group[1] is many[30]
+    assert len(group._items) == len(group)
+
+
+def test_remove_entity() -> None:
+    with UP.EnvironmentContext() as env:
+        holder = EnvHolder()
+        store = UP.SelfMonitoringStore(env, name="Shelf")
+        first = Example(name="First")
+        second = Example2(name="Second", b_value=1.0)
+        sensor = RadarSensor(name="A Radar", radius=10)
+
+        UP.remove_entity(first)
+        assert holder.get_actors() == [second]
+        assert holder.get_entity_group("Example") == [second]
+        assert "Example" in holder.get_all_entity_groups()
+
+        UP.remove_entity(second)
+        assert len(holder.get_actors()) == 0
+        assert "Example" not in holder.get_all_entity_groups()
+        assert "Example2" not in holder.get_all_entity_groups()
+        # Removing twice does nothing
+        UP.remove_entity(second)
+
+        UP.remove_entity(sensor)
+        assert holder.get_all_entity_groups() == {}
+
+        UP.remove_entity(store)
+        assert len(holder.get_monitored()) == 0
+        table, _ = create_table()
+        assert table == []
+
+        # Entities can be added back
+        second._add_entity(second._entity_groups)
+        assert holder.get_actors() == [second]
+
+
 if __name__ == "__main__":
     test_multi_inheritence_tracking()
@@ -29,6 +29,8 @@ class StateTest:
         self._mimic_states: dict[str, Any] = {}
         self._state_listener = None
         self._state_histories: dict[str, list[tuple[float, Any]]] = {}
+        self._state_callbacks: dict[str, dict[Any, Any]] = {}
+        self._state_recorders: dict[str, Any] = {}
 
     def set_one(self, val: Any) -> None:
         self.state_one = val  # type: ignore [arg-type]
@@ -630,25 +632,35 @@ def test_extra_recording() -> None:
     def recorder2(time: float, value: float) -> float:
         return time * (value + 1)
 
-    class FailingRecord(UP.Actor):
-        a_state = UP.State[float](
-            default=0.0,
-            recording_functions=[(recorder, "time_mult")],
-        )
-        b_state = UP.State[float](
-            default=0.0,
-            recording_functions=[(recorder, "time_mult")],
-        )
+    # Name clashes are found when the class is made
+    with pytest.raises(SimulationError, match="Duplicated state or recording name"):
 
-    class FailingRecord2(UP.Actor):
-        a_state = UP.State[float](
-            default=0.0,
-            recording_functions=[(recorder, "time_mult")],
-        )
-        b_state = UP.State[float](
-            default=0.0,
-            recording_functions=[(recorder, "a_state")],
-        )
+        class FailingRecord(UP.Actor):
+            a_state = UP.State[float](
+                default=0.0,
+                recording_functions=[(recorder, "time_mult")],
+            )
+            b_state = UP.State[float](
+                default=0.0,
+                recording_functions=[(recorder, "time_mult")],
+            )
+
+    with pytest.raises(SimulationError, match="Duplicated state or recording name"):
+
+        class FailingRecord2(UP.Actor):
+            a_state = UP.State[float](
+                default=0.0,
+                recording_functions=[(recorder, "time_mult")],
+            )
+            b_state = UP.State[float](
+                default=0.0,
+                recording_functions=[(recorder, "a_state")],
+            )
+
+    with pytest.raises(UpstageError, match="Do not name a state `log`"):
+
+        class FailingLog(UP.Actor):
+            log = UP.State[float](default=0.0)  # type: ignore [assignment]
 
     class RecordingStates(UP.Actor):
         a_state = UP.State[float](
@@ -666,12 +678,6 @@ def test_extra_recording() -> None:
         )
 
     with UP.EnvironmentContext() as env:
-        with pytest.raises(SimulationError, match="Duplicated state or recording name"):
-            FailingRecord(name="example")
-
-        with pytest.raises(SimulationError, match="Duplicated state or recording name"):
-            FailingRecord2(name="example")
-
         rs = RecordingStates(name="example")
         env.run(until=1)
         rs.a_state = 3
@@ -790,5 +796,33 @@ def test_extra_recording_docs() -> None:
         ]
 
 
+def test_state_set_features() -> None:
+    class Features(UP.Actor):
+        plain = UP.State[float](default=0.0)
+        items = UP.State[list](default_factory=list, recording=True)
+        fixed = UP.State[int](frozen=True, valid_types=int)
+
+    assert not Features.__dict__["plain"]._check_on_set
+    assert Features.__dict__["fixed"]._check_on_set
+
+    with EnvironmentContext():
+        actor = Features(name="features", fixed=1)
+        things = [1]
+        actor.items = things
+        things.append(2)
+        # Mutable values are copied when recorded
+        assert actor._state_histories["items"][-1] == (0.0, [1])
+
+        with pytest.raises(SimulationError, match="frozen"):
+            actor.fixed = 2
+
+        seen: list[float] = []
+        actor._add_callback_to_state("test", lambda _, value: seen.append(value), "plain")
+        actor.plain = 2.0
+        actor._remove_callback_from_state("test", "plain")
+        actor.plain = 3.0
+        assert seen == [2.0]
+
+
 if __name__ == "__main__":
     test_multistore_state()
@@ -0,0 +1,124 @@
+# Copyright (C) 2025 by the Georgia Tech Research Institute (GTRI)
+
+# Licensed under the BSD 3-Clause License.
+# See the LICENSE file in the project root for complete license terms and disclaimers.
+
+import sys
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+import upstage_des.api as UP
+from upstage_des.data_utils import create_table
+from upstage_des.type_help import TASK_GEN
+
+N_THREADS = 8
+
+
+class LongestWait:
+    def __init__(self) -> None:
+        self.longest = 0.0
+
+    def __call__(self, time: float, value: float) -> float:
+        self.longest = max(self.longest, value)
+        return self.longest
+
+
+class Teller(UP.Actor):
+    served = UP.State[int](default=0, recording=True)
+    wait = UP.State[float](
+        default=0.0,
+        recording=True,
+        recording_functions=[(LongestWait, "longest_wait")],
+    )
+    shadow = UP.State[float](default=0.0, recording=True)
+    tray = UP.ResourceState[UP.SelfMonitoringStore](default=UP.SelfMonitoringStore)
+
+
+class Serve(UP.Task):
+    def task(self, *, actor: Teller) -> TASK_GEN:
+        partner = actor.get_knowledge("partner", must_exist=True)
+        actor.activate_mimic_state(
+            self_state="shadow",
+            mimic_state="wait",
+            mimic_actor=partner,
+            task=self,
+        )
+        actor.wait = actor.stage.random.uniform(0.5, 2.0)
+        yield UP.Put(actor.tray, actor.served)
+        yield UP.Wait(actor.wait)
+        actor.deactivate_mimic_state(self_state="shadow", task=self)
+        actor.served += 1
+
+
+def _run_model(seed: int) -> dict[str, list[Any]]:
+    with UP.EnvironmentContext(random_seed=seed) as env:
+        first = Teller(name="first")
+        second = Teller(name="second")
+        first.set_knowledge("partner", second)
+        second.set_knowledge("partner", first)
+        factory = UP.TaskNetworkFactory.from_single_looping("serve", Serve)
+        for teller in (first, second):
+            teller.add_task_network(factory.make_network())
+            teller.start_network_loop("serve", "Serve")
+        env.run(until=20)
+        return create_table(format="columns")
+
+
+@pytest.fixture
+def fast_switching() -> Iterator[None]:
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.usefixtures("fast_switching")
+def test_threaded_contexts_match_sequential() -> None:
+    seeds = list(range(N_THREADS))
+    expected = {seed: _run_model(seed) for seed in seeds}
+
+    results: dict[int, dict[str, list[Any]]] = {}
+    errors: list[BaseException] = []
+    barrier = threading.Barrier(N_THREADS)
+
+    def work(seed: int) -> None:
+        try:
+            barrier.wait()
+            results[seed] = _run_model(seed)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(seed,)) for seed in seeds]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert results == expected
+
+
+def test_state_bookkeeping_is_per_actor() -> None:
+    with UP.EnvironmentContext():
+        first = Teller(name="first")
+        second = Teller(name="second")
+        first.wait = 3.0
+        first.wait = 1.0
+        second.wait = 2.0
+        assert first._state_histories["longest_wait"][-1] == (0.0, 3.0)
+        assert second._state_histories["longest_wait"][-1] == (0.0, 2.0)
+
+        seen: list[Any] = []
+        first._add_callback_to_state("watcher", lambda actor, value: seen.append(value), "wait")
+        second.wait = 4.0
+        first.wait = 5.0
+        assert seen == [5.0]
+        assert second._state_callbacks == {}
+
+    with UP.EnvironmentContext():
+        # a new context can set the same resource state on a new actor.
+        again = Teller(name="first")
+        assert again.tray is not first.tray
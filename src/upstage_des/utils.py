@@ -14,6 +14,7 @@ Note:
 import inspect
 from collections.abc import Sequence
 from sys import _getframe as get_frame  # pylint: disable=protected-access
+from types import CodeType
 from typing import Any, TypeVar
 
 from .data_types import Location
@@ -107,6 +108,32 @@ def get_caller_object(caller_level: int = 2) -> Any:
         return None
 
 
+_CALLER_NAMES: dict[CodeType, str] = {}
+
+
+def _caller_name(code: CodeType) -> str:
+    """Get the logged name of the code that made a call.
+
+    Task methods all share the name "task", so their qualified name is used.
+    Names are cached by code object, since they do not change.
+
+    Args:
+        code (CodeType): The caller's code object.
+
+    Returns:
+        str: The caller name.
+    """
+    try:
+        return _CALLER_NAMES[code]
+    except KeyError:
+        ...
+    name = code.co_name
+    if name == "task":
+        name = getattr(code, "co_qualname", "") or name
+    _CALLER_NAMES[code] = name
+    return name
+
+
 def get_caller_info(caller_level: int = 1) -> str:
     """Get information from the object that called the function.
 
@@ -118,20 +145,11 @@ def get_caller_info(caller_level: int = 1) -> str:
     """
     try:
         frame = get_frame(caller_level + 1)
-        if frame.f_code.co_name == "task":
-            try:
-                caller = frame.f_code.co_qualname
-                if caller:
-                    return caller
-            except (AttributeError, IndexError):
-                ...
-        return frame.f_code.co_name
     except ValueError as exc:
         if any("call stack is not deep enough" in arg for arg in exc.args):
             return "Unknown caller"
         raise
-    except Exception:
-        raise
+    return _caller_name(frame.f_code)
 
 
 T = TypeVar("T")